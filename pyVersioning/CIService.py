@@ -32,13 +32,15 @@
 from dataclasses  import make_dataclass
 from datetime     import datetime
 from os           import environ
-from typing       import Dict, Optional as Nullable, Tuple
+from typing       import Dict, Iterable, Optional as Nullable, Tuple
 
-from pyTooling.Decorators  import export
-from pyTooling.MetaClasses import abstractmethod
+from pyTooling.Decorators    import export, readonly
+from pyTooling.MetaClasses   import abstractmethod
 
-from pyVersioning          import VersioningException, GitHelperMixin, SelfDescriptive
-from pyVersioning          import GitShowCommand, BaseService, Platform
+from pyVersioning            import VersioningException, GitHelperMixin, SelfDescriptive
+from pyVersioning            import BaseService, Platform, Commit, GitShowCommand
+from pyVersioning.GitFacade  import GitFacade
+from pyVersioning.GitSession import GitSession
 
 
 @export
@@ -59,6 +61,34 @@ class CIService(BaseService, GitHelperMixin):
 	ENV_INCLUDES: Tuple[str, ...] =       ()
 	ENV_EXCLUDES: Tuple[str, ...] =       ()
 
+	_git: GitFacade  #: Git facade shared with :class:`~pyVersioning.Versioning`.
+
+	def __init__(self, git: Nullable[GitFacade] = None) -> None:
+		"""
+		Initialize a CI service.
+
+		:param git: Facade for all Git queries. If ``None``, a facade for the current directory is created.
+		"""
+		self._git = git if git is not None else GitFacade.Discover()
+
+	@readonly
+	def GitFacade(self) -> GitFacade:
+		"""
+		Read-only property to return the facade used for all Git queries.
+
+		:return: The Git facade.
+		"""
+		return self._git
+
+	@readonly
+	def GitSession(self) -> GitSession:
+		"""
+		Read-only property to return the Git session used for object lookups.
+
+		:return: The Git session.
+		"""
+		return self._git.Session
+
 	def GetEnvironment(self) -> Dict[str, str]:
 		"""
 		.. todo::
@@ -109,15 +139,47 @@ class CIService(BaseService, GitHelperMixin):
 		:return:                  Git hash as a hex formated string (40 characters).
 		"""
 
-	# @abstractmethod
+	def GetCommitDateFromEnvironment(self) -> Nullable[datetime]:
+		"""
+		Returns the commit date as a :class:`~datetime.datetime`, if provided by the CI service's environment variables.
+
+		:return:                  Git commit date as :class:`~datetime.datetime` or ``None``.
+		"""
+		return None
+
 	def GetCommitDate(self) -> datetime:
 		"""
 		Returns the commit date as a :class:`~datetime.datetime`.
 
+		If the CI service doesn't provide the commit date, it's queried from Git.
+
 		:return:                  Git commit date as :class:`~datetime.datetime`.
 		"""
-		datetimeString = self.ExecuteGitShow(GitShowCommand.CommitDateTime, self.GetGitHash())
-		return datetime.fromtimestamp(int(datetimeString))
+		commitDateTime = self.GetCommitDateFromEnvironment()
+		if commitDateTime is not None:
+			return commitDateTime
+
+		return self._git.GetCommitDate(self.GetGitHash())
+
+	def GetLastCommit(self, commands: Iterable[GitShowCommand] = tuple(GitShowCommand)) -> Commit:
+		"""
+		Returns the commit information of the commit referenced by the CI service.
+
+		All commit fields are collected in a single pass and memoized by the shared Git facade. The commit date is only
+		queried from Git, if the CI service doesn't provide it.
+
+		:param commands:          Commit fields to query (see :meth:`~pyVersioning.GitHelperMixin.GetCommit`).
+		:return:                  Git commit information as :class:`~pyVersioning.Commit`.
+		"""
+		return self._git.GetCommit(self.GetGitHash(), self.GetCommitDateFromEnvironment(), commands)
+
+	async def GetLastCommitAsync(self) -> Commit:
+		"""
+		Returns the commit information of the commit referenced by the CI service without blocking the event loop.
+
+		:return:                  Git commit information as :class:`~pyVersioning.Commit`.
+		"""
+		return await self._git.GetCommitAsync(self.GetGitHash(), self.GetCommitDateFromEnvironment())
 
 	@abstractmethod
 	def GetGitBranch(self) -> Nullable[str]:  # type: ignore[empty-body]
@@ -30,9 +30,17 @@
 #
 from argparse    import RawDescriptionHelpFormatter, Namespace, ArgumentError
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from filecmp     import cmp as filecmp_cmp
+from hashlib     import sha256
+from itertools   import chain
+from json        import dumps as json_dumps, loads as json_loads
+from os          import cpu_count, environ, getpid, replace as os_replace
 from pathlib     import Path
+from re          import sub as re_sub
 from textwrap    import dedent
-from typing      import NoReturn, Optional as Nullable
+from threading   import Lock
+from typing      import Any, Callable, ClassVar, Dict, Iterable, List, Mapping, NoReturn, Optional as Nullable, TextIO, Tuple
 
 from pyTooling.Attributes                     import Entity
 from pyTooling.Decorators                     import export
@@ -44,8 +52,12 @@ from pyTooling.Attributes.ArgParse.ValuedFlag import LongValuedFlag
 from pyTooling.TerminalUI                     import TerminalApplication, Severity, Mode
 
 from pyVersioning                             import __version__, __author__, __email__, __copyright__, __license__
-from pyVersioning                             import Versioning, Platforms, Project, SelfDescriptive
+from pyVersioning                             import Versioning, Volatility, Platforms, SelfDescriptive
 from pyVersioning.Configuration               import Configuration
+from pyVersioning.GitRepository               import GitRepositoryException
+from pyVersioning.Server                      import WarmVersioning, VersioningServer, VersioningClient, ServerException
+from pyVersioning.Template                    import FieldReferences, RenderCache, TemplateStream
+from pyVersioning.Worker                      import PersistentWorker
 
 
 @export
@@ -107,6 +119,22 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 	__configFile: Path
 	_config:      Nullable[Configuration]
 	_versioning:  Nullable[Versioning]
+	_renderCache: Nullable[RenderCache]
+	_manifest:    Nullable[Path]
+	_manifestLock: Lock
+
+	JSON_TEMPLATE: ClassVar[str] = dedent("""\
+	{{
+	  "format": "1.1",
+	  "version": {{
+	    "name": "{version!s}",
+	    "major": {version.Major},
+	    "minor": {version.Minor},
+	    "patch": {version.Patch},
+	    "flags": {version.Flags.value}
+	  }}
+	}}
+	""")  #: Template of command ``json``.
 
 	def __init__(self) -> None:
 		super().__init__(Mode.TextToStdOut_ErrorsToStdErr)
@@ -116,13 +144,17 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 		self.__configFile = Path(".pyVersioning.yml")
 		self._config = None
 		self._versioning = None
+		self._renderCache = None
+		self._manifest = None
+		self._manifestLock = Lock()
 
 		ArgParseHelperMixin.__init__(
 			self,
 			description=self.HeadLine,
 			formatter_class=RawDescriptionHelpFormatter,
 			add_help=False,
-			exit_on_error=False
+			exit_on_error=False,
+			fromfile_prefix_chars="@"
 		)
 
 		self._LOG_MESSAGE_FORMAT__[Severity.Fatal] =   "{DARK_RED}[FATAL] {message}{NOCOLOR}"
@@ -130,27 +162,90 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 		self._LOG_MESSAGE_FORMAT__[Severity.Warning] = "{YELLOW}[WARNING] {message}{NOCOLOR}"
 		self._LOG_MESSAGE_FORMAT__[Severity.Normal]=   "{GRAY}{message}{NOCOLOR}"
 
-	def Initialize(self, configFile: Nullable[Path] = None) -> None:
+	def Initialize(
+		self,
+		configFile: Nullable[Path] = None,
+		cacheFile: Nullable[Path] = None,
+		templateCacheDirectory: Nullable[Path] = None,
+		templates: Nullable[Iterable[str]] = None,
+		fields: Nullable[Iterable[str]] = None,
+		volatilePlaceholders: bool = False,
+		config: Nullable[Configuration] = None
+	) -> None:
+		"""
+		Read the configuration file and collect versioning information.
+
+		:param configFile:             Path to the configuration file. If ``None``, the default configuration file is used.
+		:param cacheFile:              Optional path to an on-disk cache of the collected Git information.
+		:param templateCacheDirectory: Optional directory for compiled templates.
+		:param templates:              Templates, which will be filled out. If given, only information referenced by these
+		                               templates is collected. If ``None``, all information is collected.
+		:param fields:                 Additional referenced field paths (e.g. from a :class:`TemplateStream`). If
+		                               ``templates`` and ``fields`` are ``None``, all information is collected.
+		:param volatilePlaceholders:   If ``True``, volatile fields are rendered as fixed placeholders.
+		:param config:                 Already read configuration. If ``None``, the configuration file is read.
+		"""
+		self._config = self._ReadConfiguration(configFile) if config is None else config
+
+		self.WriteVerbose( "Creating internal data model ...")
+		self._versioning = Versioning(
+			self,
+			cacheFile=cacheFile,
+			templateCacheDirectory=templateCacheDirectory,
+			volatilePlaceholders=volatilePlaceholders
+		)
+		self.WriteDebug( "  Loading information from configuration file ...")
+		self._versioning.LoadDataFromConfiguration(self._config)
+		references = None
+		if templates is not None or fields is not None:
+			references = FieldReferences(chain(
+				() if fields is None else fields,
+				*(self._versioning.TemplateCache.Compile(template).Fields for template in (() if templates is None else templates))
+			))
+			self.WriteDebug(f"  Referenced fields: {', '.join(sorted(references.Paths))}")
+		self.WriteDebug( "  Collecting information from environment ...")
+		self._versioning.CollectData(references)
+
+	def _ReadConfiguration(self, configFile: Nullable[Path] = None) -> Configuration:
+		"""
+		Helper method to read the configuration file.
+
+		:param configFile: Path to the configuration file. If ``None``, the default configuration file is read, if it exists.
+		:return:           The configuration or a default configuration, if the file doesn't exist.
+		"""
 		if configFile is None:
 			if not self.__configFile.exists():
 				self.WriteWarning(f"Configuration file '{self.__configFile}' does not exist.")
-				self._config = Configuration()
-			else:
-				self.WriteVerbose(f"Reading configuration file '{self.__configFile}'")
-				self._config = Configuration(self.__configFile)
+				return Configuration()
+
+			self.WriteVerbose(f"Reading configuration file '{self.__configFile}'")
+			return Configuration(self.__configFile)
 		elif configFile.exists():
 			self.WriteVerbose(f"Reading configuration file '{configFile}'")
-			self._config = Configuration(configFile)
+			return Configuration(configFile)
 		else:
 			self.WriteError(f"Configuration file '{configFile}' does not exist.")
-			self._config = Configuration()
-
-		self.WriteVerbose( "Creating internal data model ...")
-		self._versioning = Versioning(self)
-		self.WriteDebug( "  Loading information from configuration file ...")
-		self._versioning.LoadDataFromConfiguration(self._config)
-		self.WriteDebug( "  Collecting information from environment ...")
-		self._versioning.CollectData()
+			return Configuration()
+
+	def _InitializeFromArguments(
+		self,
+		args: Namespace,
+		templates: Nullable[Iterable[str]] = None,
+		fields: Nullable[Iterable[str]] = None,
+		config: Nullable[Configuration] = None
+	) -> None:
+		"""Helper method to call :meth:`Initialize` with the global command line options."""
+		self._renderCache = None if args.RenderCache is None else RenderCache(Path(args.RenderCache))
+		self._manifest = None if args.Manifest is None else Path(args.Manifest)
+		self.Initialize(
+			None if args.ConfigFile is None else Path(args.ConfigFile),
+			None if args.CacheFile is None else Path(args.CacheFile),
+			None if args.TemplateCache is None else Path(args.TemplateCache),
+			templates,
+			fields,
+			args.VolatilePlaceholders,
+			config
+		)
 
 	def Run(self) -> NoReturn:
 		try:
@@ -159,6 +254,9 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 			self._PrintHeadline()
 			self.WriteError(ex)
 			self.Exit(2)
+		finally:
+			if self._versioning is not None:
+				self._versioning.Close()
 
 		self.Exit()
 
@@ -179,8 +277,21 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 	@FlagArgument(short="-v", long="--verbose", dest="Verbose", help="Print verbose messages.")
 	@FlagArgument(short="-d", long="--debug", dest="Debug", help="Print debug messages.")
 	@LongValuedFlag("--config-file", dest="ConfigFile", metaName="<pyVersioning.yaml>", optional=True, help="Path to pyVersioning.yaml .")
+	@LongValuedFlag("--cache-file", dest="CacheFile", metaName="<.pyVersioning.cache>", optional=True, help="Cache collected Git information in this file.")
+	@LongValuedFlag("--template-cache", dest="TemplateCache", metaName="<directory>", optional=True, help="Cache compiled templates in this directory.")
+	@FlagArgument(long="--volatile-placeholders", dest="VolatilePlaceholders", help="Render volatile fields (build time, environment) as fixed placeholders.")
+	@FlagArgument(long="--write-if-changed", dest="WriteIfChanged", help="Keep output files (and their modification time) if the content is unchanged.")
+	@LongValuedFlag("--render-cache", dest="RenderCache", metaName="<directory>", optional=True, help="Reuse rendered output files from this directory.")
+	@LongValuedFlag("--manifest", dest="Manifest", metaName="<manifest.json>", optional=True, help="Record the content hash of each written output file in this file.")
+	@LongValuedFlag("--socket", dest="Socket", metaName="<socket>", optional=True, help="Unix domain socket of a pyVersioning server (default: .pyVersioning.sock).")
+	@FlagArgument(long="--no-server", dest="NoServer", help="Don't ask a running pyVersioning server.")
+	@FlagArgument(long="--persistent_worker", dest="PersistentWorker", help="Run as Bazel persistent worker (JSON worker protocol).")
 	def HandleDefault(self, args: Namespace) -> None:
 		"""Handle program calls for no given command."""
+		if args.PersistentWorker:
+			self._RunPersistentWorker(args)
+			return
+
 		self.Configure(verbose=args.Verbose, debug=args.Debug)
 		self._PrintHeadline()
 		self._PrintVersion()
@@ -220,7 +331,7 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 		"""Handle program calls for command ``variables``."""
 		self.Configure(verbose=args.Verbose, debug=args.Debug, quiet=True)
 		self._PrintHeadline()
-		self.Initialize(Path(args.ConfigFile) if args.ConfigFile is not None else None)
+		self._InitializeFromArguments(args)
 
 		self.UpdateProject(args)
 		self.UpdateCompiler(args)
@@ -244,15 +355,18 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 		"""Handle program calls for command ``field``."""
 		self.Configure(verbose=args.Verbose, debug=args.Debug)  #, quiet=args.Filename is None)
 		self._PrintHeadline()
-		self.Initialize(None if args.ConfigFile is None else Path(args.ConfigFile))
 
-		query = f"{{{args.Field}}}"
+		content = self._QueryServer(args, {"command": "field", "field": args.Field})
+		if content is None:
+			query = f"{{{args.Field}}}"
+			self._InitializeFromArguments(args, (query, ))
 
-		content = self.FillOutTemplate(query)
+			content = self.FillOutTemplate(query)
 
 		self.WriteOutput(
 			None if args.Filename is None else Path(args.Filename),
-			content
+			content,
+			args.WriteIfChanged
 		)
 
 	@CommandHandler("fillout", help="Read a template and replace tokens with version information.")
@@ -260,68 +374,434 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 	@CompilerAttributeGroup("flummy")
 	@PathArgument(dest="Template", metaName="<Template file>", help="Template input filename.")
 	@PathArgument(dest="Filename", metaName="<Output file>",   optional=True, help="Output filename.")
+	@FlagArgument(long="--stream", dest="Stream", help="Read, fill out and write the template in chunks (for very large templates).")
+	@LongValuedFlag("--split", dest="SplitFile", metaName="<Volatile output file>", optional=True, help="Write template sections referencing volatile fields (commit, build time) to this file.")
+	@LongValuedFlag("--depfile", dest="DepFile", metaName="<Dependency file>", optional=True, help="Write a Makefile-syntax dependency file for the output file.")
 	def HandleFillOut(self, args: Namespace) -> None:
 		"""Handle program calls for command ``fillout``."""
 		self.Configure(verbose=args.Verbose, debug=args.Debug, quiet=args.Filename is None)
 		self._PrintHeadline()
-		self.Initialize(None if args.ConfigFile is None else Path(args.ConfigFile))
 
 		templateFile = Path(args.Template)
 		if not templateFile.exists():
 			self.WriteError(f"Template file '{templateFile}' does not exist.")
+		if args.SplitFile is not None and (args.Filename is None or args.Stream):
+			self.WriteError("Option '--split' requires an output file and can't be combined with '--stream'.")
+		self.ExitOnPreviousErrors()
+
+		outputs = None
+		if args.Stream:
+			self._FillOutStream(args, TemplateStream(templateFile))
+		elif args.SplitFile is not None:
+			self._FillOutSplit(args, templateFile.read_text(encoding="utf-8"))
+			outputs = (Path(args.Filename), Path(args.SplitFile))
+		else:
+			template = templateFile.read_text(encoding="utf-8")
+			content = None
+			if args.DepFile is None:
+				content = self._QueryServer(args, {"command": "fillout", "template": template})
+
+			if content is not None:
+				self.WriteOutput(None if args.Filename is None else Path(args.Filename), content, args.WriteIfChanged)
+			else:
+				self._InitializeFromArguments(args, (template, ))
 
-		template = templateFile.read_text(encoding="utf-8")
+				self.UpdateProject(args)
+				self.UpdateCompiler(args)
+
+				self.RenderOutput(
+					None if args.Filename is None else Path(args.Filename),
+					template,
+					args.WriteIfChanged
+				)
+
+		self.WriteDepFile(args, (templateFile, ), outputs)
+
+	def _FillOutStream(self, args: Namespace, template: TemplateStream) -> None:
+		"""Helper method to fill out a template file chunk by chunk and write each rendered chunk right away."""
+		self._InitializeFromArguments(args, fields=template.Fields())
 
 		self.UpdateProject(args)
 		self.UpdateCompiler(args)
 
-		content = self.FillOutTemplate(template)
+		self.WriteVerbose("Applying variables to template ...")
+		outputFile = None if args.Filename is None else Path(args.Filename)
+		if outputFile is None:
+			self._versioning.FillOutTemplateStream(template, self.WriteToStdOut)
+			return
+
+		self._PrepareOutput(outputFile, args.WriteIfChanged)
+		if args.WriteIfChanged:
+			self._WriteIfChanged(outputFile, lambda file: self._versioning.FillOutTemplateStream(template, file.write))
+		else:
+			self._BreakHardLink(outputFile)
+			with outputFile.open("w", encoding="utf-8") as file:
+				self._versioning.FillOutTemplateStream(template, file.write)
+		self._RecordOutput(outputFile)
+
+	def _FillOutSplit(self, args: Namespace, template: str) -> None:
+		"""
+		Helper method to fill out a template with sections and to split the result into a stable and a volatile output file
+		(see :meth:`~pyVersioning.Versioning.FillOutSplitTemplate`).
 
-		self.WriteOutput(
-			None if args.Filename is None else Path(args.Filename),
-			content
+		Each output file is replaced only if its content changed, thus e.g. the stable translation unit isn't recompiled if
+		only the commit or the build time changed.
+		"""
+		self._InitializeFromArguments(args, (template, ))
+
+		self.UpdateProject(args)
+		self.UpdateCompiler(args)
+
+		self.WriteVerbose("Applying variables to template ...")
+		stable, volatile = self._versioning.FillOutSplitTemplate(template)
+
+		for outputFile, content in ((Path(args.Filename), stable), (Path(args.SplitFile), volatile)):
+			self._PrepareOutput(outputFile, True)
+			self._WriteIfChanged(outputFile, lambda file, content=content: file.write(content))
+			self._RecordOutput(outputFile)
+
+	@CommandHandler("batch", help="Fill out all templates listed in a manifest with information collected once.")
+	@ProjectAttributeGroup("dummy")
+	@CompilerAttributeGroup("flummy")
+	@PathArgument(dest="OutputsFile", metaName="<Manifest file>", optional=True, help="File listing 'outputs' (default: configuration file).")
+	@LongValuedFlag("--jobs", dest="Jobs", metaName="<count>", optional=True, help="Number of parallel workers (default: number of CPUs).")
+	def HandleBatch(self, args: Namespace) -> None:
+		"""
+		Handle program calls for command ``batch``.
+
+		The manifest lists pairs of template and output file in the configuration file format (``outputs``). Information is
+		collected once for all templates. Then, all output files are rendered and written by a pool of worker threads. If
+		the configuration file declares a ``matrix`` of project variants and compilers, each template is rendered for each
+		matrix cell. Output paths are templates as well, e.g. ``build/{project.variant}/{build.compiler.name}/version.h``.
+		"""
+		self.Configure(verbose=args.Verbose, debug=args.Debug)
+		self._PrintHeadline()
+
+		config = self._ReadConfiguration(None if args.ConfigFile is None else Path(args.ConfigFile))
+		if args.OutputsFile is None:
+			outputs = config.outputs
+		elif Path(args.OutputsFile).exists():
+			self.WriteVerbose(f"Reading manifest file '{args.OutputsFile}'")
+			outputs = Configuration(Path(args.OutputsFile)).outputs
+		else:
+			self.WriteError(f"Manifest file '{args.OutputsFile}' does not exist.")
+			outputs = []
+
+		try:
+			jobs = (cpu_count() or 1) if args.Jobs is None else int(args.Jobs)
+			if jobs < 1:
+				raise ValueError()
+		except ValueError:
+			self.WriteError(f"Option '--jobs' requires a positive number, but got '{args.Jobs}'.")
+
+		for output in outputs:
+			if not output.template.exists():
+				self.WriteError(f"Template file '{output.template}' does not exist.")
+		self.ExitOnPreviousErrors()
+
+		templates = [output.template.read_text(encoding="utf-8") for output in outputs]
+		outputPaths = [output.output.as_posix() for output in outputs]
+		self._InitializeFromArguments(args, templates + outputPaths, config=config)
+
+		self.UpdateProject(args)
+		self.UpdateCompiler(args)
+
+		# Resolve all referenced variables upfront, so workers don't collect (and query Git) concurrently.
+		variables = self._versioning.Variables
+		names = {field.partition(".")[0] for template in templates + outputPaths for field in self._versioning.TemplateCache.Compile(template).Fields}
+		names = [name for name in names if name in variables]
+		if len(names) > 0:
+			variables.Resolve(*names)
+
+		cells = [variables] if config.matrix is None else self._versioning.GetMatrixVariables(config.matrix)
+		tasks = []
+		outputFiles = set()
+		for cell in cells:
+			for outputPath, template in zip(outputPaths, templates):
+				outputFile = Path(self._versioning.FillOutTemplate(outputPath, cell))
+				if outputFile.resolve() in outputFiles:
+					self.WriteError(f"Output file '{outputFile}' is listed more than once.")
+				outputFiles.add(outputFile.resolve())
+				tasks.append((outputFile, template, args.WriteIfChanged, cell))
+		self.ExitOnPreviousErrors()
+
+		self.WriteVerbose(f"Filling out {len(templates)} templates for {len(cells)} matrix cells with up to {jobs} workers ...")
+		if jobs == 1 or len(tasks) <= 1:
+			for task in tasks:
+				self.RenderOutput(*task)
+		else:
+			with ThreadPoolExecutor(max_workers=jobs) as pool:
+				futures = [pool.submit(self.RenderOutput, *task) for task in tasks]
+				for future in futures:
+					future.result()
+
+	@CommandHandler("serve", help="Answer field, fillout and json requests of other pyVersioning calls via a Unix domain socket.")
+	def HandleServe(self, args: Namespace) -> None:
+		"""
+		Handle program calls for command ``serve``.
+
+		The server keeps the collected information in memory, thus other calls of the ``field``, ``fillout`` and ``json``
+		commands in the same directory and with the same settings don't collect it again. The information is collected
+		again, if the configuration file or the Git repository's state changes. Stop the server with :kbd:`Ctrl+C`.
+		"""
+		self.Configure(verbose=args.Verbose, debug=args.Debug)
+		self._PrintHeadline()
+
+		def initialize() -> Tuple[Versioning, Configuration]:
+			self.WriteVerbose("Collecting information ...")
+			self._InitializeFromArguments(args)
+			self._renderCache = None
+			self._manifest = None
+			return self._versioning, self._config
+
+		server = VersioningServer(
+			self._SocketPath(args),
+			initialize,
+			self._ServerSettings(args),
+			[self._ConfigFilePath(args)]
+		)
+		self.WriteNormal(f"Serving on '{server.SocketPath}' ...")
+		try:
+			server.Serve()
+		except ServerException as ex:
+			self.WriteError(str(ex))
+		except KeyboardInterrupt:
+			pass
+		finally:
+			self._versioning = None
+
+		self.WriteNormal(f"Answered {server.Requests} requests (information collected {server.Refreshes} times).")
+
+	def _SocketPath(self, args: Namespace) -> Path:
+		"""Helper method to return the path of the server's Unix domain socket."""
+		return VersioningServer.DEFAULT_SOCKET_PATH if args.Socket is None else Path(args.Socket)
+
+	def _ConfigFilePath(self, args: Namespace) -> Path:
+		"""Helper method to return the absolute path of the configuration file."""
+		return (self.__configFile if args.ConfigFile is None else Path(args.ConfigFile)).absolute()
+
+	def _ServerSettings(self, args: Namespace) -> Dict[str, Any]:
+		"""Helper method to return the settings, which must be identical for a server and its clients."""
+		return {
+			"directory":            Path.cwd().as_posix(),
+			"config":               self._ConfigFilePath(args).as_posix(),
+			"cacheFile":            None if args.CacheFile is None else Path(args.CacheFile).absolute().as_posix(),
+			"volatilePlaceholders": args.VolatilePlaceholders,
+			"environment":          {name: environ.get(name) for name in ("SOURCE_DATE_EPOCH", "APPVEYOR", "GITHUB_ACTIONS", "GITLAB_CI", "TRAVIS")}
+		}
+
+	def _QueryServer(self, args: Namespace, request: Dict[str, Any]) -> Nullable[str]:
+		"""
+		Helper method to ask a running server (see command ``serve``).
+
+		The server isn't asked, if ``--no-server``, ``--render-cache`` or ``--manifest`` is given, or if project or
+		compiler settings are overridden on the command line.
+
+		:param args:    Parsed command line arguments.
+		:param request: Request without settings.
+		:return:        The server's answer or ``None``, if the server isn't running or refused the request.
+		"""
+		socketPath = self._SocketPath(args)
+		overrides = (
+			args.ProjectName, args.ProjectVariant, args.ProjectVersion,
+			args.CompilerName, args.CompilerVersion, args.CompilerConfig, args.CompilerOptions
+		)
+		if (
+			args.NoServer or args.RenderCache is not None or args.Manifest is not None or
+			any(override is not None for override in overrides) or not socketPath.exists()
+		):
+			return None
+
+		try:
+			response = VersioningClient(socketPath).Request({**request, "settings": self._ServerSettings(args)})
+		except (OSError, ServerException) as ex:
+			self.WriteVerbose(f"Server on '{socketPath}' not used: {ex}")
+			return None
+
+		self.WriteVerbose(f"Answered by server on '{socketPath}'.")
+		return response["content"]
+
+	def _RunPersistentWorker(self, args: Namespace) -> None:
+		"""
+		Run as Bazel persistent worker (``--persistent_worker``), see :class:`~pyVersioning.Worker.PersistentWorker`.
+
+		Each work request carries the arguments of a ``fillout`` or ``json`` command with an output file. Global options
+		given when the worker was started apply to all work requests. Collected information and compiled templates are
+		kept per setting (see command ``serve``) between work requests, while the Git repository's state is checked for
+		each work request. Messages are written to STDERR, as STDOUT carries the work responses.
+		"""
+		from sys import argv, stdin
+
+		self.Configure(verbose=args.Verbose, debug=args.Debug)
+		stdout, self._stdout = self._stdout, self._stderr
+
+		startupArguments = [argument for argument in argv[1:] if argument != "--persistent_worker"]
+		warmVersionings: Dict[str, WarmVersioning] = {}
+		lock = Lock()
+
+		def handler(arguments: List[str]) -> Tuple[int, str]:
+			return self._HandleWorkRequest(startupArguments + arguments, warmVersionings, lock)
+
+		worker = PersistentWorker(handler)
+		try:
+			worker.Run(stdin, stdout)
+		finally:
+			for warmVersioning in warmVersionings.values():
+				warmVersioning.Close()
+			self._stdout = stdout
+
+		self.WriteVerbose(f"Answered {worker.Requests} work requests.")
+
+	def _HandleWorkRequest(self, arguments: List[str], warmVersionings: Dict[str, WarmVersioning], lock: Lock) -> Tuple[int, str]:
+		"""
+		Helper method to execute a work request of a persistent worker. It's called concurrently.
+
+		:param arguments:       Command line arguments of the work request.
+		:param warmVersionings: Collected information per setting.
+		:param lock:            Serializes accessing ``warmVersionings``.
+		:return:                Exit code and output of the work request.
+		"""
+		try:
+			args = self.MainParser.parse_args(arguments)
+		except ArgumentError as ex:
+			return 2, str(ex)
+		except SystemExit as ex:  # usage errors are printed to STDERR by argparse
+			return 2 if ex.code is None else ex.code, f"Invalid arguments: {' '.join(arguments)}"
+
+		if args.func is Application.HandleFillOut:
+			if args.Stream or args.SplitFile is not None:
+				return 2, "Options '--stream' and '--split' aren't supported by the persistent worker."
+			templateFile = Path(args.Template)
+			if not templateFile.exists():
+				return 1, f"Template file '{templateFile}' does not exist."
+			template = templateFile.read_text(encoding="utf-8")
+		elif args.func is Application.HandleJSON:
+			template = self.JSON_TEMPLATE
+		else:
+			return 2, "Persistent worker supports commands 'fillout' and 'json' only."
+
+		if args.Filename is None:
+			return 2, "Persistent worker requires an output file."
+		elif args.DepFile is not None or args.RenderCache is not None or args.Manifest is not None:
+			return 2, "Options '--depfile', '--render-cache' and '--manifest' aren't supported by the persistent worker."
+
+		settings = self._ServerSettings(args)
+		key = json_dumps(settings, sort_keys=True)
+		with lock:
+			warmVersioning = warmVersionings.get(key)
+			if warmVersioning is None:
+				def initialize() -> Tuple[Versioning, Configuration]:
+					config = self._ReadConfiguration(None if args.ConfigFile is None else Path(args.ConfigFile))
+					versioning = Versioning(
+						self,
+						cacheFile=None if args.CacheFile is None else Path(args.CacheFile),
+						templateCacheDirectory=None if args.TemplateCache is None else Path(args.TemplateCache),
+						volatilePlaceholders=args.VolatilePlaceholders
+					)
+					versioning.LoadDataFromConfiguration(config)
+					versioning.CollectData()
+					return versioning, config
+
+				warmVersioning = warmVersionings[key] = WarmVersioning(initialize, [self._ConfigFilePath(args)])
+
+		compiled = warmVersioning.Refresh().TemplateCache.Compile(template)
+		variables = warmVersioning.Resolve(compiled.Fields)
+		self._OverrideVariables(variables, args)
+		content = compiled.Render(variables)
+
+		outputFile = Path(args.Filename)
+		outputFile.parent.mkdir(parents=True, exist_ok=True)
+		if not (args.WriteIfChanged and outputFile.is_file() and outputFile.read_text(encoding="utf-8") == content):
+			self._BreakHardLink(outputFile)
+			outputFile.write_text(content, encoding="utf-8")
+
+		return 0, ""
+
+	@staticmethod
+	def _OverrideVariables(variables: Dict[str, Any], args: Namespace) -> None:
+		"""
+		Helper method to replace the variables ``project`` and ``build`` by copies with project and compiler settings from
+		the command line. Unlike :meth:`UpdateProject` and :meth:`UpdateCompiler`, only referenced variables are replaced.
+		"""
+		if any(override is not None for override in (args.ProjectName, args.ProjectVariant, args.ProjectVersion)):
+			variables["project"] = Versioning.DeriveProject(variables.get("project"), args.ProjectName, args.ProjectVersion, args.ProjectVariant)
+
+		if "build" in variables and any(override is not None for override in (args.CompilerName, args.CompilerVersion, args.CompilerConfig, args.CompilerOptions)):
+			variables["build"] = Versioning.DeriveBuild(variables["build"], args.CompilerName, args.CompilerVersion, args.CompilerConfig, args.CompilerOptions)
+
+	@CommandHandler("status", help="Write all variables as Bazel workspace status (stable keys prefixed with 'STABLE_').")
+	@ProjectAttributeGroup("dummy")
+	@CompilerAttributeGroup("flummy")
+	@PathArgument(dest="Filename", metaName="<Output file>", optional=True, help="Output filename.")
+	@FlagArgument(long="--env", dest="Environment", help="Include environment variables (env).")
+	def HandleStatus(self, args: Namespace) -> None:
+		"""
+		Handle program calls for command ``status``.
+
+		Each field is written as a line ``KEY value`` for Bazel's ``--workspace_status_command``. The key is the upper-case
+		field path, e.g. ``GIT_COMMIT_HASH``. Keys of fields, which change only with the configuration or the commit (see
+		:attr:`~pyVersioning.Versioning.FieldVolatility`), are prefixed with ``STABLE_``, thus actions depending on them
+		are rerun on change. Other keys like ``BUILD_TIME`` are volatile and don't invalidate cached actions. Environment
+		variables are written (as volatile keys) only with ``--env``, as they might contain secrets.
+		"""
+		self.Configure(verbose=args.Verbose, debug=args.Debug, quiet=args.Filename is None)
+		self._InitializeFromArguments(args)
+
+		self.UpdateProject(args)
+		self.UpdateCompiler(args)
+
+		content = "".join(
+			f"{'STABLE_' if self._versioning.GetVolatility((path, )) is not Volatility.Build else ''}{self._StatusKey(path)} {' '.join(str(value).splitlines())}\n"
+			for path, value in self._versioning.FlattenVariables()
+			if args.Environment or path.partition(".")[0] != "env"
 		)
+		self.WriteOutput(None if args.Filename is None else Path(args.Filename), content, args.WriteIfChanged)
+
+	@staticmethod
+	def _StatusKey(path: str) -> str:
+		"""Helper method to convert a field path into a Bazel workspace status key (e.g. ``GIT_COMMIT_HASH``)."""
+		return re_sub(r"[^A-Z0-9_]", "_", path.upper().replace(".", "_"))
 
 	@CommandHandler("json", help="Write all available variables as JSON.")
 	@ProjectAttributeGroup("dummy")
 	@CompilerAttributeGroup("flummy")
 	@PathArgument(dest="Filename", metaName="<Output file>", optional=True, help="Output filename.")
+	@LongValuedFlag("--depfile", dest="DepFile", metaName="<Dependency file>", optional=True, help="Write a Makefile-syntax dependency file for the output file.")
 	def HandleJSON(self, args: Namespace) -> None:
 		"""Handle program calls for command ``json``."""
 		self.Configure(verbose=args.Verbose, debug=args.Debug, quiet=args.Filename is None)
-		self.Initialize(Path(args.ConfigFile) if args.ConfigFile is not None else None)
 
-		self.UpdateProject(args)
-		self.UpdateCompiler(args)
 
-		template = dedent("""\
-		{{
-		  "format": "1.1",
-		  "version": {{
-		    "name": "{version!s}",
-		    "major": {version.Major},
-		    "minor": {version.Minor},
-		    "patch": {version.Patch},
-		    "flags": {version.Flags.value}
-		  }}
-		}}
-		""")
+		template = self.JSON_TEMPLATE
+		content = None
+		if args.DepFile is None:
+			content = self._QueryServer(args, {"command": "fillout", "template": template})
 
-		content = self._versioning.FillOutTemplate(template)
+		if content is not None:
+			self.WriteOutput(None if args.Filename is None else Path(args.Filename), content, args.WriteIfChanged)
+			return
 
-		self.WriteOutput(
+		self._InitializeFromArguments(args, (template, ))
+
+		self.UpdateProject(args)
+		self.UpdateCompiler(args)
+
+		self.RenderOutput(
 			None if args.Filename is None else Path(args.Filename),
-			content
+			template,
+			args.WriteIfChanged
 		)
+		self.WriteDepFile(args)
 
 	@CommandHandler("yaml", help="Write all available variables as YAML.")
 	@ProjectAttributeGroup("dummy")
 	@CompilerAttributeGroup("flummy")
 	@PathArgument(dest="Filename", metaName="<Output file>", optional=True, help="Output filename.")
+	@LongValuedFlag("--depfile", dest="DepFile", metaName="<Dependency file>", optional=True, help="Write a Makefile-syntax dependency file for the output file.")
 	def HandleYAML(self, args: Namespace) -> None:
 		"""Handle program calls for command ``yaml``."""
 		self.Configure(verbose=args.Verbose, debug=args.Debug, quiet=args.Filename is None)
-		self.Initialize(Path(args.ConfigFile) if args.ConfigFile is not None else None)
+		self._InitializeFromArguments(args)
 
 		self.UpdateProject(args)
 		self.UpdateCompiler(args)
@@ -391,63 +871,233 @@ class Application(TerminalApplication, ArgParseHelperMixin):
 		  env:{yamlEnvironment}
 		""")
 
-		content = self.FillOutTemplate(
+		self.RenderOutput(
+			None if args.Filename is None else Path(args.Filename),
 			template,
+			args.WriteIfChanged,
 			yamlEnvironment=yamlEnvironment,
 			yamlAppVeyor=yamlAppVeyor,
 			yamlGitHub=yamlGitHub,
 			yamlGitLab=yamlGitLab,
 			yamlTravis=yamlTravis
 		)
-
-		self.WriteOutput(
-			None if args.Filename is None else Path(args.Filename),
-			content
-		)
+		self.WriteDepFile(args)
 
 	def UpdateProject(self, args: Namespace) -> None:
-		if "project" not in self._versioning.Variables:
-			self._versioning.Variables["project"] = Project(args.ProjectName, args.ProjectVersion, args.ProjectVariant)
-		elif args.ProjectName is not None:
-			self._versioning.Variables["project"]._name = args.ProjectName
-
-		if args.ProjectVariant is not None:
-			self._versioning.Variables["project"]._variant = args.ProjectVariant
-
-		if args.ProjectVersion is not None:
-			self._versioning.Variables["project"]._version = args.ProjectVersion
+		"""Replace the variable ``project`` by a copy with the project settings from the command line."""
+		variables = self._versioning.Variables
+		if "project" not in variables or any(override is not None for override in (args.ProjectName, args.ProjectVariant, args.ProjectVersion)):
+			variables["project"] = Versioning.DeriveProject(variables.get("project"), args.ProjectName, args.ProjectVersion, args.ProjectVariant)
 
 	def UpdateCompiler(self, args: Namespace) -> None:
-		if args.CompilerName is not None:
-			self._versioning.Variables["build"]._compiler._name = args.CompilerName
-		if args.CompilerVersion is not None:
-			self._versioning.Variables["build"]._compiler._version = args.CompilerVersion
-		if args.CompilerConfig is not None:
-			self._versioning.Variables["build"]._compiler._configuration = args.CompilerConfig
-		if args.CompilerOptions is not None:
-			self._versioning.Variables["build"]._compiler._options = args.CompilerOptions
-
-	def FillOutTemplate(self, template: str, **kwargs) -> str:
+		"""Replace the variable ``build`` by a copy with the compiler settings from the command line."""
+		if any(override is not None for override in (args.CompilerName, args.CompilerVersion, args.CompilerConfig, args.CompilerOptions)):
+			variables = self._versioning.Variables
+			variables["build"] = Versioning.DeriveBuild(variables["build"], args.CompilerName, args.CompilerVersion, args.CompilerConfig, args.CompilerOptions)
+
+	def FillOutTemplate(self, template: str, variables: Nullable[Mapping[str, Any]] = None, /, **kwargs) -> str:
 		self.WriteVerbose("Applying variables to template ...")
-		return self._versioning.FillOutTemplate(template, **kwargs)
+		return self._versioning.FillOutTemplate(template, variables, **kwargs)
+
+	def WriteOutput(self, outputFile: Nullable[Path], content: str, ifChanged: bool = False) -> None:
+		"""
+		Write the content to the output file or to STDOUT.
 
-	def WriteOutput(self, outputFile: Nullable[Path], content: str) -> None:
+		:param outputFile: Path to the output file. If ``None``, the content is written to STDOUT.
+		:param content:    Content to write.
+		:param ifChanged:  If ``True``, an existing output file with identical content isn't touched (see
+		                   :meth:`_WriteIfChanged`).
+		"""
 		if outputFile is not None:
-			self.WriteVerbose(f"Writing output to '{outputFile}' ...")
-			if not outputFile.parent.exists():
-				self.WriteWarning(f"Directory for file '{outputFile}' does not exist. Directory will be created")
-				try:
-					outputFile.parent.mkdir()
-				except:
-					self.WriteError(f"Failed to create the directory '{outputFile.parent}' for the output file.")
-			elif outputFile.exists():
-				self.WriteWarning(f"Output file '{outputFile}' already exists. This file will be overwritten.")
+			self._PrepareOutput(outputFile, ifChanged)
+			if ifChanged:
+				self._WriteIfChanged(outputFile, lambda file: file.write(content))
+			else:
+				self._BreakHardLink(outputFile)
+				outputFile.write_text(content, encoding="utf-8")
+		else:
+			self.WriteToStdOut(content)
+
+	def RenderOutput(
+		self,
+		outputFile: Nullable[Path],
+		template: str,
+		ifChanged: bool = False,
+		variables: Nullable[Mapping[str, Any]] = None,
+		/,
+		**kwargs: Any
+	) -> None:
+		"""
+		Fill out a template and write the result to the output file (see :meth:`WriteOutput`) or to STDOUT.
+
+		If a render cache is used (``--render-cache``), a cached output for the same template and the same values of the
+		referenced fields is copied instead (see :class:`~pyVersioning.Template.RenderCache`). Otherwise,
+		the output is rendered and stored in the cache.
+
+		:param outputFile: Path to the output file. If ``None``, the content is written to STDOUT.
+		:param template:   Template to fill out.
+		:param ifChanged:  If ``True``, an existing output file with identical content isn't touched.
+		:param variables:  Variables (e.g. of a matrix cell). If ``None``, all collected variables are used.
+		:param kwargs:     Additional variables.
+		"""
+		if outputFile is None or self._renderCache is None:
+			self.WriteOutput(outputFile, self.FillOutTemplate(template, variables, **kwargs), ifChanged)
+			if outputFile is not None:
+				self._RecordOutput(outputFile)
+			return
+
+		key = self._versioning.GetRenderKey(template, variables, **kwargs)
+		cached = self._renderCache.Load(key)
+		if cached is not None:
+			self.WriteVerbose(f"Using rendered output '{key}' from render cache.")
+		else:
+			content = self.FillOutTemplate(template, variables, **kwargs)
+			try:
+				cached = self._renderCache.Store(key, content)
+			except OSError as ex:
+				self.WriteWarning(f"Rendered output can't be stored in render cache '{self._renderCache.Directory}': {ex}")
+				self.WriteOutput(outputFile, content, ifChanged)
+				self._RecordOutput(outputFile)
+				return
+
+		objectFile, contentHash = cached
+		self._PrepareOutput(outputFile, ifChanged)
+		if ifChanged and outputFile.is_file() and (outputFile.samefile(objectFile) or filecmp_cmp(objectFile, outputFile, shallow=False)):
+			self.WriteNormal(f"Output file '{outputFile}' is unchanged.")
+		else:
+			self._renderCache.Place(objectFile, outputFile)
+			if ifChanged:
+				self.WriteNormal(f"Output file '{outputFile}' updated.")
+
+		self._RecordOutput(outputFile, contentHash)
+
+	def _RecordOutput(self, outputFile: Path, contentHash: Nullable[str] = None) -> None:
+		"""
+		Record the output file's SHA-256 content hash in the manifest file (``--manifest``), if requested.
+
+		The manifest is a JSON file mapping output paths to content hashes. Entries of previous runs are kept, thus several
+		runs can share a manifest file. It's replaced atomically.
 
+		:param outputFile:  Path to the output file.
+		:param contentHash: Known content hash of the output file. If ``None``, the output file is hashed.
+		"""
+		if self._manifest is None:
+			return
+
+		if contentHash is None:
+			contentHash = sha256(outputFile.read_bytes()).hexdigest()
+
+		with self._manifestLock:
+			self._UpdateManifest(outputFile, contentHash)
+
+	def _UpdateManifest(self, outputFile: Path, contentHash: str) -> None:
+		try:
+			manifest = json_loads(self._manifest.read_text(encoding="utf-8"))
+			outputs = manifest["outputs"] if manifest["format"] == 1 and manifest["algorithm"] == "sha256" else {}
+		except (OSError, ValueError, KeyError, TypeError):
+			outputs = {}
+
+		outputs[outputFile.as_posix()] = contentHash
+
+		temporaryFile = self._manifest.with_name(f".{self._manifest.name}.{getpid()}.tmp")
+		try:
+			temporaryFile.write_text(
+				json_dumps({"format": 1, "algorithm": "sha256", "outputs": dict(sorted(outputs.items()))}, indent=2),
+				encoding="utf-8"
+			)
+			os_replace(temporaryFile, self._manifest)
+		except BaseException:
+			temporaryFile.unlink(missing_ok=True)
+			raise
+
+	@staticmethod
+	def _BreakHardLink(outputFile: Path) -> None:
+		"""Helper method to remove a hard linked output file before writing it in place, so other links aren't altered."""
+		if outputFile.is_file() and outputFile.stat().st_nlink > 1:
+			outputFile.unlink()
+
+	def _WriteIfChanged(self, outputFile: Path, write: Callable[[TextIO], None]) -> bool:
+		"""
+		Write the output to a temporary file next to the output file and replace the output file only if the content
+		differs. Otherwise, the output file and its modification time are kept, thus build tools like make or ninja
+		(``restat``) don't rebuild dependent files.
+
+		:param outputFile: Path to the output file.
+		:param write:      Callable writing the content to the given (temporary) file.
+		:return:           ``True``, if the output file was updated.
+		"""
+		temporaryFile = outputFile.with_name(f".{outputFile.name}.{getpid()}.tmp")
+		try:
+			with temporaryFile.open("w", encoding="utf-8") as file:
+				write(file)
+
+			if outputFile.is_file() and filecmp_cmp(temporaryFile, outputFile, shallow=False):
+				temporaryFile.unlink()
+				self.WriteNormal(f"Output file '{outputFile}' is unchanged.")
+				return False
+
+			os_replace(temporaryFile, outputFile)
+		except BaseException:
+			temporaryFile.unlink(missing_ok=True)
+			raise
+
+		self.WriteNormal(f"Output file '{outputFile}' updated.")
+		return True
+
+	def WriteDepFile(self, args: Namespace, inputs: Iterable[Path] = (), outputs: Nullable[Iterable[Path]] = None) -> None:
+		"""
+		Write a Makefile-syntax dependency file (``--depfile``) for the output file, if requested.
+
+		The output file depends on the given inputs (e.g. the template), the configuration file and the files in the
+		``.git`` directory, whose change can alter the collected Git information (see
+		:meth:`~pyVersioning.GitRepository.GitRepository.GetStateFiles`).
+
+		:param args:    Parsed command line arguments.
+		:param inputs:  Additional input files.
+		:param outputs: Output files. If ``None``, the output file given on the command line.
+		"""
+		if args.DepFile is None:
+			return
+		elif args.Filename is None:
+			self.WriteError("Option '--depfile' requires an output file.")
 			self.ExitOnPreviousErrors()
 
-			outputFile.write_text(content, encoding="utf-8")
-		else:
-			self.WriteToStdOut(content)
+		depFile = Path(args.DepFile)
+		self.WriteVerbose(f"Writing dependency file '{depFile}' ...")
+
+		dependencies = list(inputs)
+		configFile = self.__configFile if args.ConfigFile is None else Path(args.ConfigFile)
+		if configFile.exists():
+			dependencies.append(configFile)
+
+		repository = self._versioning.GitFacade.Repository
+		if repository is not None:
+			try:
+				dependencies.extend(repository.GetStateFiles())
+			except GitRepositoryException as ex:
+				self.WriteWarning(f"Git repository files can't be listed as dependencies: {ex}")
+
+		def escape(path: Path) -> str:
+			return path.as_posix().replace("$", "$$").replace("#", "\\#").replace(" ", "\\ ")
+
+		targets = (Path(args.Filename), ) if outputs is None else outputs
+		lines = [f"{' '.join(escape(target) for target in targets)}:"]
+		lines.extend(f"  {escape(dependency)}" for dependency in dict.fromkeys(dependencies))
+		depFile.write_text(" \\\n".join(lines) + "\n", encoding="utf-8")
+
+	def _PrepareOutput(self, outputFile: Path, ifChanged: bool = False) -> None:
+		"""Helper method to create the output file's directory and to check for previous errors before writing."""
+		self.WriteVerbose(f"Writing output to '{outputFile}' ...")
+		if not outputFile.parent.exists():
+			self.WriteWarning(f"Directory for file '{outputFile}' does not exist. Directory will be created")
+			try:
+				outputFile.parent.mkdir(parents=True, exist_ok=True)
+			except:
+				self.WriteError(f"Failed to create the directory '{outputFile.parent}' for the output file.")
+		elif outputFile.exists() and not ifChanged:
+			self.WriteWarning(f"Output file '{outputFile}' already exists. This file will be overwritten.")
+
+		self.ExitOnPreviousErrors()
 
 
 def main() -> NoReturn:
@@ -0,0 +1,561 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Reader for Git's commit-graph file and a history walker to count commits and find the nearest tag (like
+``git describe`` and ``git rev-list --count``).
+"""
+from collections import deque
+from heapq       import heappush, heappop
+from mmap        import mmap, ACCESS_READ
+from pathlib     import Path
+from struct      import unpack_from, iter_unpack
+from typing      import Callable, Deque, Dict, FrozenSet, Iterable, List, Mapping, Optional as Nullable, Set, Tuple
+
+from pyTooling.Decorators    import export, readonly
+from pyTooling.MetaClasses   import ExtendedType
+
+from pyVersioning            import VersioningException
+from pyVersioning.GitObjects import GitCommitObject
+
+_NO_PARENT =      0x70000000
+_EXTRA_EDGES =    0x80000000
+_LAST_EDGE =      0x80000000
+
+
+@export
+class CommitGraphException(VersioningException):
+	"""Exception thrown when a commit-graph file is malformed."""
+
+
+class _Layer(metaclass=ExtendedType, slots=True):
+	"""A single commit-graph file. Split commit-graphs consist of a chain of layers."""
+
+	map:          mmap  #: Memory-mapped commit-graph file.
+	base:         int   #: Global position of this layer's first commit.
+	count:        int   #: Number of commits in this layer.
+	fanoutOffset: int   #: Offset of the OIDF chunk.
+	hashOffset:   int   #: Offset of the OIDL chunk.
+	dataOffset:   int   #: Offset of the CDAT chunk.
+	edgeOffset:   int   #: Offset of the EDGE chunk or -1.
+
+	def __init__(self, path: Path, base: int) -> None:
+		with path.open("rb") as file:
+			try:
+				self.map = mmap(file.fileno(), 0, access=ACCESS_READ)
+			except ValueError as ex:
+				raise CommitGraphException(f"Commit-graph '{path}' is empty.") from ex
+
+		try:
+			signature, version, hashVersion, chunkCount, _ = unpack_from(">4sBBBB", self.map, 0)
+			if signature != b"CGPH" or version != 1 or hashVersion != 1:
+				raise CommitGraphException(f"Commit-graph '{path}' has an unsupported format.")
+
+			chunks: Dict[bytes, int] = {}
+			for i in range(chunkCount):
+				chunkID, offset = unpack_from(">4sQ", self.map, 8 + i * 12)
+				chunks[chunkID] = offset
+
+			self.base = base
+			self.fanoutOffset = chunks[b"OIDF"]
+			self.hashOffset = chunks[b"OIDL"]
+			self.dataOffset = chunks[b"CDAT"]
+			self.edgeOffset = chunks.get(b"EDGE", -1)
+			self.count = unpack_from(">I", self.map, self.fanoutOffset + 255 * 4)[0]
+		except (KeyError, ValueError) as ex:
+			self.map.close()
+			raise CommitGraphException(f"Commit-graph '{path}' is malformed.") from ex
+		except CommitGraphException:
+			self.map.close()
+			raise
+
+
+@export
+class CommitGraph(metaclass=ExtendedType, slots=True):
+	"""
+	A memory-mapped commit-graph (``objects/info/commit-graph`` or a split chain in ``objects/info/commit-graphs``).
+
+	Commits are addressed by their (global) position in the graph. Per commit, the graph provides the parent positions,
+	the generation number (topological level) and the commit time without inflating any commit object.
+	"""
+
+	_layers:   List[_Layer]                           #: Layers from base to tip.
+	_count:    int                                    #: Total number of commits.
+	_parents:  Nullable[Tuple[List[int], List[int]]]  #: First and second parent of all commits (loaded on demand).
+
+	def __init__(self, files: Iterable[Path]) -> None:
+		"""
+		Open and memory-map a commit-graph consisting of one or more layers.
+
+		:param files:                 Commit-graph files ordered from base to tip.
+		:raises CommitGraphException: If a file is malformed.
+		"""
+		self._layers = []
+		self._count = 0
+		self._parents = None
+
+		try:
+			for file in files:
+				layer = _Layer(file, self._count)
+				self._layers.append(layer)
+				self._count += layer.count
+		except CommitGraphException:
+			self.Close()
+			raise
+
+	@classmethod
+	def Open(cls, objectsDirectory: Path) -> Nullable["CommitGraph"]:
+		"""
+		Open the commit-graph of a repository, if present.
+
+		:param objectsDirectory:      Path to the repository's ``objects`` directory.
+		:return:                      The commit-graph or ``None``, if the repository has no commit-graph.
+		:raises CommitGraphException: If the commit-graph is malformed.
+		"""
+		chainFile = objectsDirectory / "info" / "commit-graphs" / "commit-graph-chain"
+		if chainFile.is_file():
+			hashes = chainFile.read_text(encoding="ascii").split()
+			return cls(objectsDirectory / "info" / "commit-graphs" / f"graph-{hash}.graph" for hash in hashes)
+
+		graphFile = objectsDirectory / "info" / "commit-graph"
+		if graphFile.is_file():
+			return cls((graphFile, ))
+
+		return None
+
+	@readonly
+	def Count(self) -> int:
+		"""
+		Read-only property to return the number of commits in the graph.
+
+		:return: Number of commits.
+		"""
+		return self._count
+
+	def Close(self) -> None:
+		"""Unmap all commit-graph files."""
+		for layer in self._layers:
+			layer.map.close()
+		self._layers = []
+		self._parents = None
+
+	def _Layer(self, position: int) -> _Layer:
+		for layer in reversed(self._layers):
+			if position >= layer.base:
+				return layer
+
+		raise IndexError(position)
+
+	def Lookup(self, hash: str) -> Nullable[int]:
+		"""
+		Find the position of a commit.
+
+		:param hash:                 Commit hash as hex string.
+		:return:                     Global position of the commit or ``None``, if the commit isn't in the graph.
+		:raises CommitGraphException: If the hash isn't a hex string of 40 characters.
+		"""
+		try:
+			key = bytes.fromhex(hash)
+		except ValueError:
+			key = b""
+		if len(key) != 20:
+			raise CommitGraphException(f"'{hash}' is not a commit hash.")
+
+		first = key[0]
+		for layer in self._layers:
+			low = unpack_from(">I", layer.map, layer.fanoutOffset + (first - 1) * 4)[0] if first > 0 else 0
+			high = unpack_from(">I", layer.map, layer.fanoutOffset + first * 4)[0]
+			while low < high:
+				middle = (low + high) // 2
+				position = layer.hashOffset + middle * 20
+				current = layer.map[position:position + 20]
+				if current < key:
+					low = middle + 1
+				elif current > key:
+					high = middle
+				else:
+					return layer.base + middle
+
+		return None
+
+	def GetHash(self, position: int) -> str:
+		"""
+		Return the hash of a commit.
+
+		:param position: Global position of the commit.
+		:return:         Commit hash as hex string.
+		"""
+		layer = self._Layer(position)
+		offset = layer.hashOffset + (position - layer.base) * 20
+		return layer.map[offset:offset + 20].hex()
+
+	def _ReadEdges(self, layer: _Layer, index: int) -> List[int]:
+		parents = []
+		while True:
+			edge = unpack_from(">I", layer.map, layer.edgeOffset + index * 4)[0]
+			parents.append(edge & ~_LAST_EDGE)
+			if edge & _LAST_EDGE:
+				return parents
+			index += 1
+
+	def GetParents(self, position: int) -> Tuple[int, ...]:
+		"""
+		Return the parents of a commit.
+
+		:param position: Global position of the commit.
+		:return:         Global positions of all parents.
+		"""
+		layer = self._Layer(position)
+		parent1, parent2 = unpack_from(">II", layer.map, layer.dataOffset + (position - layer.base) * 36 + 20)
+		if parent1 == _NO_PARENT:
+			return ()
+		elif parent2 == _NO_PARENT:
+			return (parent1, )
+		elif parent2 & _EXTRA_EDGES:
+			return (parent1, *self._ReadEdges(layer, parent2 & ~_EXTRA_EDGES))
+		else:
+			return (parent1, parent2)
+
+	def GetGeneration(self, position: int) -> int:
+		"""
+		Return the generation number (topological level) of a commit.
+
+		A commit's generation is always greater than the generation of all its ancestors.
+
+		:param position: Global position of the commit.
+		:return:         Generation number.
+		"""
+		layer = self._Layer(position)
+		return unpack_from(">I", layer.map, layer.dataOffset + (position - layer.base) * 36 + 28)[0] >> 2
+
+	def GetCommitTime(self, position: int) -> int:
+		"""
+		Return the commit time of a commit.
+
+		:param position: Global position of the commit.
+		:return:         Commit time in seconds since epoch.
+		"""
+		layer = self._Layer(position)
+		high, low = unpack_from(">II", layer.map, layer.dataOffset + (position - layer.base) * 36 + 28)
+		return ((high & 0x3) << 32) | low
+
+	def CountAncestors(self, positions: Iterable[int]) -> int:
+		"""
+		Count all commits reachable from the given commits (including themselves), like ``git rev-list --count``.
+
+		Parent positions of all commits are unpacked once in bulk, then a visited bitmap is used for the walk.
+
+		:param positions: Global positions of the start commits.
+		:return:          Number of reachable commits.
+		"""
+		if self._parents is None:
+			firstParents: List[int] = []
+			secondParents: List[int] = []
+			for layer in self._layers:
+				data = layer.map[layer.dataOffset:layer.dataOffset + layer.count * 36]
+				for parent1, parent2 in iter_unpack(">20xII8x", data):
+					firstParents.append(parent1)
+					secondParents.append(parent2)
+			self._parents = (firstParents, secondParents)
+
+		firstParents, secondParents = self._parents
+		visited = bytearray(self._count)
+		stack = list(positions)
+		count = 0
+		while stack:
+			position = stack.pop()
+			if visited[position]:
+				continue
+			visited[position] = 1
+			count += 1
+
+			parent1 = firstParents[position]
+			if parent1 == _NO_PARENT:
+				continue
+			stack.append(parent1)
+
+			parent2 = secondParents[position]
+			if parent2 == _NO_PARENT:
+				continue
+			elif parent2 & _EXTRA_EDGES:
+				stack.extend(self.GetParents(position)[1:])
+			else:
+				stack.append(parent2)
+
+		return count
+
+
+@export
+class CommitWalker(metaclass=ExtendedType, slots=True):
+	"""
+	Walk the commit history to count commits and to find the nearest tag.
+
+	If a :class:`CommitGraph` is available, parents and generation numbers are read from it and commits are walked in
+	generation order, thus only the commits between ``HEAD`` and a tag are visited. Commits newer than the commit-graph
+	are read as objects. Without a commit-graph, a breadth-first walk bounded by ``limit`` commits is used.
+	"""
+
+	_readCommit:  Callable[[str], GitCommitObject]  #: Callback to read a commit object by hash.
+	_graph:       Nullable[CommitGraph]             #: Optional commit-graph.
+	_shallow:     FrozenSet[str]                    #: Commits of a shallow clone, whose parents are missing.
+	_limit:       int                               #: Maximum number of commits visited by a walk.
+	_parents:     Dict[str, Tuple[str, ...]]        #: Parents of commits not in the commit-graph.
+	_generations: Dict[str, int]                    #: Generation numbers of commits not in the commit-graph.
+
+	def __init__(
+		self,
+		readCommit: Callable[[str], GitCommitObject],
+		graph: Nullable[CommitGraph] = None,
+		shallow: Iterable[str] = (),
+		limit: int = 100000
+	) -> None:
+		"""
+		Initialize a commit walker.
+
+		:param readCommit: Callback to read a commit object by hash.
+		:param graph:      Optional commit-graph.
+		:param shallow:    Hashes of shallow commits (see ``.git/shallow``).
+		:param limit:      Maximum number of commits visited by a walk.
+		"""
+		self._readCommit = readCommit
+		self._graph = graph
+		self._shallow = frozenset(shallow)
+		self._limit = limit
+		self._parents = {}
+		self._generations = {}
+
+	def _Position(self, hash: str) -> Nullable[int]:
+		if self._graph is None or hash in self._shallow:
+			return None
+
+		return self._graph.Lookup(hash)
+
+	def GetParents(self, hash: str) -> Tuple[str, ...]:
+		"""
+		Return the parents of a commit.
+
+		:param hash: Commit hash.
+		:return:     Hashes of all parents (empty for root and shallow commits).
+		"""
+		if hash in self._shallow:
+			return ()
+
+		try:
+			return self._parents[hash]
+		except KeyError:
+			pass
+
+		position = self._Position(hash)
+		if position is not None:
+			parents = tuple(self._graph.GetHash(parent) for parent in self._graph.GetParents(position))
+		else:
+			parents = self._readCommit(hash).Parents
+
+		self._parents[hash] = parents
+		return parents
+
+	def GetGeneration(self, hash: str) -> int:
+		"""
+		Return the generation number of a commit. Requires a commit-graph.
+
+		Commits not in the commit-graph get one more than the maximum generation of their parents.
+
+		:param hash: Commit hash.
+		:return:     Generation number.
+		"""
+		position = self._Position(hash)
+		if position is not None:
+			return self._graph.GetGeneration(position)
+
+		stack = [hash]
+		while stack:
+			current = stack[-1]
+			if current in self._generations:
+				stack.pop()
+				continue
+
+			pending = []
+			generation = 0
+			for parent in self.GetParents(current):
+				position = self._Position(parent)
+				if position is not None:
+					generation = max(generation, self._graph.GetGeneration(position))
+				elif parent in self._generations:
+					generation = max(generation, self._generations[parent])
+				else:
+					pending.append(parent)
+
+			if len(pending) > 0:
+				stack.extend(pending)
+			else:
+				self._generations[current] = generation + 1
+				stack.pop()
+
+		return self._generations[hash]
+
+	def _Ancestors(self, hash: str) -> Nullable[Set[str]]:
+		visited = {hash}
+		queue = [hash]
+		for current in queue:
+			for parent in self.GetParents(current):
+				if parent not in visited:
+					visited.add(parent)
+					queue.append(parent)
+					if len(visited) > self._limit:
+						return None
+
+		return visited
+
+	def CountCommits(self, hash: str) -> Nullable[int]:
+		"""
+		Count all commits reachable from a commit (including itself), like ``git rev-list --count``.
+
+		:param hash: Commit hash.
+		:return:     Number of commits or ``None``, if the walk limit was exceeded without a commit-graph.
+		"""
+		if self._graph is None or len(self._shallow) > 0:
+			ancestors = self._Ancestors(hash)
+			return len(ancestors) if ancestors is not None else None
+
+		# Walk commits newer than the commit-graph by hash, then count the remaining history within the graph.
+		outside = {hash}
+		boundary = []
+		queue = [hash]
+		for current in queue:
+			position = self._Position(current)
+			if position is not None:
+				outside.discard(current)
+				boundary.append(position)
+				continue
+
+			for parent in self.GetParents(current):
+				if parent not in outside:
+					outside.add(parent)
+					queue.append(parent)
+
+		return len(outside) + self._graph.CountAncestors(boundary)
+
+	def CountCommitsBetween(self, head: str, base: str) -> Nullable[int]:
+		"""
+		Count commits reachable from ``head``, but not from ``base`` (like ``git rev-list --count base..head``).
+
+		With a commit-graph, a two-color walk in descending generation order stops as soon as all remaining commits are
+		reachable from ``base``.
+
+		:param head: Hash of the newer commit.
+		:param base: Hash of the older commit.
+		:return:     Number of commits or ``None``, if the walk limit was exceeded.
+		"""
+		if self._graph is None:
+			headAncestors = self._Ancestors(head)
+			baseAncestors = self._Ancestors(base)
+			if headAncestors is None or baseAncestors is None:
+				return None
+			return len(headAncestors - baseAncestors)
+
+		HEAD, BASE = 1, 2
+		flags = {head: HEAD}
+		flags[base] = flags.get(base, 0) | BASE
+		heap = [(-self.GetGeneration(hash), hash) for hash in flags]
+		heap.sort()
+		headOnly = 1 if flags[head] == HEAD else 0
+
+		count = 0
+		visited = 0
+		while heap and headOnly > 0:
+			_, current = heappop(heap)
+			flag = flags[current]
+			if flag == HEAD:
+				count += 1
+				headOnly -= 1
+
+			visited += 1
+			if visited > self._limit:
+				return None
+
+			for parent in self.GetParents(current):
+				parentFlag = flags.get(parent)
+				if parentFlag is None:
+					flags[parent] = flag
+					heappush(heap, (-self.GetGeneration(parent), parent))
+					if flag == HEAD:
+						headOnly += 1
+				elif parentFlag | flag != parentFlag:
+					if parentFlag == HEAD:
+						headOnly -= 1
+					flags[parent] = parentFlag | flag
+
+		return count
+
+	def FindNearestTag(
+		self,
+		head: str,
+		tags: Mapping[str, List[str]],
+		candidates: int = 10
+	) -> Nullable[Tuple[str, str, int]]:
+		"""
+		Find the tag with the fewest commits between the tag and ``head`` (like ``git describe --tags``).
+
+		The first ``candidates`` tagged commits found by walking from ``head`` are compared by their distance. The distance
+		is exact (``git rev-list --count tag..head``), while ``git describe`` estimates it in merge-heavy histories.
+
+		:param head:       Hash of the start commit.
+		:param tags:       Mapping of (peeled) commit hashes to tag names. The first name of a commit is used.
+		:param candidates: Maximum number of tagged commits to compare.
+		:return:           Tuple of tag name, tagged commit hash and distance or ``None``, if no tag was found.
+		"""
+		found: List[str] = []
+		visited = {head}
+		useGeneration = self._graph is not None
+		# With generation numbers, a max-heap visits newer commits first; otherwise a FIFO queue walks breadth-first.
+		heap: List[Tuple[int, str]] = [(-self.GetGeneration(head), head)] if useGeneration else []
+		queue: Deque[str] = deque() if useGeneration else deque((head, ))
+
+		while (heap or queue) and len(found) < candidates and len(visited) <= self._limit:
+			current = heappop(heap)[1] if useGeneration else queue.popleft()
+			if current in tags:
+				found.append(current)
+				continue
+
+			for parent in self.GetParents(current):
+				if parent not in visited:
+					visited.add(parent)
+					if useGeneration:
+						heappush(heap, (-self.GetGeneration(parent), parent))
+					else:
+						queue.append(parent)
+
+		best: Nullable[Tuple[str, str, int]] = None
+		for commit in found:
+			distance = self.CountCommitsBetween(head, commit)
+			if distance is not None and (best is None or distance < best[2]):
+				best = (tags[commit][0], commit, distance)
+
+		return best
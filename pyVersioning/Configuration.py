@@ -30,7 +30,7 @@
 #
 """pyVersioning configuration file in YAML format."""
 from pathlib               import Path
-from typing                import Dict, Optional as Nullable
+from typing                import Dict, List, Optional as Nullable
 
 from ruamel.yaml           import YAML
 from pyTooling.Decorators  import export
@@ -91,12 +91,42 @@ class Compiler(Base):
 class Build(Base):
 	"""Configuration class describing a *build*."""
 
-	compiler: Nullable[Compiler]
+	compiler:  Nullable[Compiler]
+	timestamp: str  #: Source of the build time: ``now`` (default) or ``commit``.
+	volatile:  str  #: Rendering of volatile fields: ``keep`` (default) or ``placeholder``.
 
 	def __init__(self, root: 'Base', parent: 'Base', settings: Dict) -> None:
 		super().__init__(root, parent)
 
-		self.compiler = Compiler(root, self, settings["compiler"]) if "compiler" in settings else None
+		self.compiler =  Compiler(root, self, settings["compiler"]) if "compiler" in settings else None
+		self.timestamp = str(settings["timestamp"]) if "timestamp" in settings else "now"
+		self.volatile =  str(settings["volatile"])  if "volatile" in settings  else "keep"
+
+
+class Matrix(Base):
+	"""Configuration class describing a *matrix* of project variants and compilers (see command ``batch``)."""
+
+	variants:  List[str]       #: Project variants. If empty, the project's variant is used.
+	compilers: List[Compiler]  #: Compilers. If empty, the build's compiler is used.
+
+	def __init__(self, root: 'Base', parent: 'Base', settings: Dict) -> None:
+		super().__init__(root, parent)
+
+		self.variants =  [str(variant) for variant in settings["variants"]] if "variants" in settings else []
+		self.compilers = [Compiler(root, self, compiler) for compiler in settings["compilers"]] if "compilers" in settings else []
+
+
+class Output(Base):
+	"""Configuration class describing an *output* file filled out from a template (see command ``batch``)."""
+
+	template: Path  #: Template file.
+	output:   Path  #: Output file.
+
+	def __init__(self, root: 'Base', parent: 'Base', settings: Dict) -> None:
+		super().__init__(root, parent)
+
+		self.template = Path(settings["template"])
+		self.output =   Path(settings["output"])
 
 
 @export
@@ -106,6 +136,8 @@ class Configuration(Base):
 	version: int
 	project: Nullable[Project]
 	build:   Nullable[Build]
+	matrix:  Nullable[Matrix]
+	outputs: List[Output]
 
 	def __init__(self, configFile: Nullable[Path] = None) -> None:
 		super().__init__(self, None)
@@ -125,6 +157,8 @@ class Configuration(Base):
 					"options": ""
 				}
 			})
+			self.matrix = None
+			self.outputs = []
 		else:
 			self.load(configFile)
 
@@ -141,3 +175,5 @@ class Configuration(Base):
 	def loadVersion1(self, config) -> None:
 		self.project = Project(self, self, config["project"]) if "project" in config else None
 		self.build =   Build(self, self, config["build"])     if "build" in config   else None
+		self.matrix =  Matrix(self, self, config["matrix"])   if "matrix" in config  else None
+		self.outputs = [Output(self, self, settings) for settings in config["outputs"]] if "outputs" in config else []
@@ -0,0 +1,240 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""An on-disk cache of collected Git information keyed by the repository's state."""
+from datetime     import date, time
+from hashlib      import sha256
+from json         import dumps as json_dumps, loads as json_loads
+from os           import getpid, replace as os_replace
+from pathlib      import Path
+from time         import time as time_now, timezone
+from typing       import Any, Dict, List, Optional as Nullable
+
+from pyTooling.Decorators       import export, readonly
+from pyTooling.MetaClasses      import ExtendedType
+
+from pyVersioning               import __version__, Commit, Description, Git, Person
+from pyVersioning.GitRepository import GitRepository, GitRepositoryException
+
+
+def _Stamp(path: Path) -> str:
+	try:
+		status = path.stat()
+	except (FileNotFoundError, NotADirectoryError):
+		return f"{path.as_posix()}:-"
+
+	return f"{path.as_posix()}:{status.st_mtime_ns}:{status.st_size}"
+
+
+def _PersonToDict(person: Person) -> Dict[str, str]:
+	return {"name": person.name, "email": person.email}
+
+
+def _GitToDict(git: Git) -> Dict[str, Any]:
+	commit = git.commit
+	return {
+		"commit": {
+			"hash":      commit.hash,
+			"date":      commit.date.isoformat(),
+			"time":      commit.time.isoformat(),
+			"author":    _PersonToDict(commit.author),
+			"committer": _PersonToDict(commit.committer),
+			"comment":   commit.comment
+		},
+		"tag":        git.tag,
+		"branch":     git.branch,
+		"repository": git.repository,
+		"describe":   {
+			"tag":      git.describe.tag,
+			"distance": git.describe.distance,
+			"count":    git.describe.count
+		}
+	}
+
+
+def _GitFromDict(data: Dict[str, Any]) -> Git:
+	commit = data["commit"]
+	describe = data["describe"]
+	return Git(
+		commit=Commit(
+			hash=commit["hash"],
+			date=date.fromisoformat(commit["date"]),
+			time=time.fromisoformat(commit["time"]),
+			author=Person(**commit["author"]),
+			committer=Person(**commit["committer"]),
+			comment=commit["comment"]
+		),
+		repository=data["repository"],
+		tag=data["tag"],
+		branch=data["branch"],
+		describe=Description(commit["hash"], describe["tag"], describe["distance"], describe["count"])
+	)
+
+
+@export
+class GitCache(metaclass=ExtendedType, slots=True):
+	"""
+	An opt-in on-disk cache (e.g. ``.pyVersioning.cache``) of the collected :class:`~pyVersioning.Git` record.
+
+	Entries are keyed by a hash of the repository state, which is read without spawning any process:
+
+	* ``HEAD`` and its resolved target commit,
+	* modification time and size of the checked out branch's reference file, ``packed-refs`` and all loose tags,
+	* modification time and size of all configuration files (remotes), including included files, and the absence of
+	  missing configuration files (e.g. global or include targets), and
+	* the ``shallow`` file.
+
+	Thus, an entry is invalidated automatically by new commits, checkouts, new or moved tags and changed remotes. The
+	cache holds at most :attr:`MaxEntries` entries (e.g. for worktrees seeing many branches). When full, the oldest
+	entries are evicted. The file is replaced atomically, so concurrent invocations never read partial files.
+	"""
+
+	_path:       Path                    #: Path to the cache file.
+	_repository: GitRepository           #: Repository whose state is the cache key.
+	_maxEntries: int                     #: Maximum number of cached entries.
+
+	FORMAT = 1  #: Version of the cache file format.
+
+	def __init__(self, path: Path, repository: GitRepository, maxEntries: int = 16) -> None:
+		"""
+		Initialize a Git cache.
+
+		:param path:       Path to the cache file.
+		:param repository: Repository whose state is used as cache key.
+		:param maxEntries: Maximum number of cached entries.
+		"""
+		if maxEntries < 1:
+			raise ValueError("Parameter 'maxEntries' must be at least 1.")
+
+		self._path = path
+		self._repository = repository
+		self._maxEntries = maxEntries
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to return the path to the cache file.
+
+		:return: Path to the cache file.
+		"""
+		return self._path
+
+	@readonly
+	def MaxEntries(self) -> int:
+		"""
+		Read-only property to return the maximum number of cached entries.
+
+		:return: Maximum number of entries.
+		"""
+		return self._maxEntries
+
+	def ComputeKey(self) -> str:
+		"""
+		Compute the cache key from the repository's current state.
+
+		:return:                        Hex digest of the repository state.
+		:raises GitRepositoryException: If ``HEAD`` can't be resolved or the configuration can't be read.
+		"""
+		repository = self._repository
+		commonDirectory = repository.CommonDirectory
+		try:
+			head = (repository.GitDirectory / "HEAD").read_text(encoding="utf-8").strip()
+		except OSError as ex:
+			raise GitRepositoryException(f"Can't read 'HEAD' in '{repository.GitDirectory}'.") from ex
+
+		material = [
+			f"pyVersioning:{__version__}",
+			f"timezone:{timezone}",
+			f"HEAD:{head}",
+			f"target:{repository.ResolveReference('HEAD')}",
+			_Stamp(commonDirectory / "packed-refs"),
+			_Stamp(commonDirectory / "shallow"),
+		]
+		if head.startswith("ref:"):
+			material.append(_Stamp(commonDirectory / head[4:].strip()))
+
+		tagsDirectory = commonDirectory / "refs" / "tags"
+		if tagsDirectory.is_dir():
+			material.extend(sorted(_Stamp(file) for file in tagsDirectory.rglob("*") if file.is_file()))
+
+		# Missing configuration files are stamped as absent, thus creating e.g. '~/.gitconfig' changes the key.
+		material.extend(_Stamp(file) for file in (*repository.Config.Files, *repository.Config.MissingFiles))
+
+		return sha256("\n".join(material).encode("utf-8")).hexdigest()
+
+	def _ReadEntries(self) -> List[Dict[str, Any]]:
+		try:
+			content = json_loads(self._path.read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return []
+
+		if not isinstance(content, dict) or content.get("format") != self.FORMAT or not isinstance(content.get("entries"), list):
+			return []
+
+		return content["entries"]
+
+	def _WriteEntries(self, entries: List[Dict[str, Any]]) -> None:
+		temporaryPath = self._path.with_name(f"{self._path.name}.{getpid()}.tmp")
+		try:
+			temporaryPath.write_text(json_dumps({"format": self.FORMAT, "entries": entries}), encoding="utf-8")
+			os_replace(temporaryPath, self._path)
+		except OSError:
+			temporaryPath.unlink(missing_ok=True)
+
+	def Load(self, key: str) -> Nullable[Git]:
+		"""
+		Load the Git record cached for a key.
+
+		:param key: Cache key computed by :meth:`ComputeKey`.
+		:return:    The cached Git record or ``None`` on a cache miss.
+		"""
+		for entry in self._ReadEntries():
+			if entry.get("key") == key:
+				try:
+					return _GitFromDict(entry["git"])
+				except (KeyError, TypeError, ValueError):
+					return None
+
+		return None
+
+	def Store(self, key: str, git: Git) -> None:
+		"""
+		Store a Git record. If the cache is full, the oldest entries are evicted.
+
+		Write errors are ignored, as the cache is an optimization only.
+
+		:param key: Cache key computed by :meth:`ComputeKey`.
+		:param git: The Git record to cache.
+		"""
+		entries = [entry for entry in self._ReadEntries() if entry.get("key") != key]
+		entries.append({"key": key, "stored": time_now(), "git": _GitToDict(git)})
+		entries.sort(key=lambda entry: entry.get("stored", 0))
+
+		self._WriteEntries(entries[-self._maxEntries:])
@@ -0,0 +1,530 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A reader for Git configuration files (``.git/config``) including ``include``, ``includeIf`` and worktree configs."""
+from os                        import environ
+from os.path                   import expanduser
+from pathlib                   import Path
+from re                        import compile as re_compile, escape as re_escape, IGNORECASE, Pattern
+from typing                    import Callable, Dict, List, Optional as Nullable, Tuple
+
+from pyTooling.Decorators      import export, readonly
+from pyTooling.Exceptions      import ToolingException
+from pyTooling.GenericPath.URL import URL
+from pyTooling.MetaClasses     import ExtendedType
+
+from pyVersioning              import VersioningException
+
+
+@export
+class GitConfigException(VersioningException):
+	"""Exception thrown when a Git configuration file can't be parsed."""
+
+
+_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", "\"": "\""}
+
+
+def _GlobToRegExp(pattern: str, ignoreCase: bool = False) -> Pattern:
+	"""
+	Translate a wildcard pattern as used by ``includeIf`` conditions into a regular expression.
+
+	``*`` and ``?`` don't match a ``/``, whereas ``**/`` matches zero or more directories and a trailing ``/**`` matches
+	everything below a directory.
+	"""
+	regExp = ""
+	index = 0
+	while index < len(pattern):
+		if pattern.startswith("**/", index):
+			regExp += "(?:.*/)?"
+			index += 3
+		elif pattern.startswith("**", index):
+			regExp += ".*"
+			index += 2
+		elif pattern[index] == "*":
+			regExp += "[^/]*"
+			index += 1
+		elif pattern[index] == "?":
+			regExp += "[^/]"
+			index += 1
+		elif pattern[index] == "[" and (end := pattern.find("]", index + 2)) != -1:
+			characters = pattern[index + 1:end]
+			if characters[0] == "!":
+				characters = "^" + characters[1:]
+			regExp += f"[{characters}]"
+			index = end + 1
+		else:
+			regExp += re_escape(pattern[index])
+			index += 1
+
+	return re_compile(regExp + r"\Z", IGNORECASE if ignoreCase else 0)
+
+
+@export
+class GitConfig(metaclass=ExtendedType, slots=True):
+	"""
+	Parse Git configuration files into an in-memory mapping of configuration names to values.
+
+	The parser follows ``git config``'s syntax: case-insensitive section and key names, case-sensitive subsections,
+	legacy ``[section.subsection]`` headers, quoted values, escape sequences, line continuations and comments. Keys
+	without an ``=`` are implicit booleans and read as ``true``.
+
+	``[include]`` and ``[includeIf "..."]`` files are read at the position of their ``path`` entry. Supported conditions
+	are ``gitdir:``, ``gitdir/i:`` and ``onbranch:``; others (e.g. ``hasconfig:``) never match.
+
+	A repository's configuration (see :meth:`ForRepository`) includes the system and global configuration files like
+	``git config`` does, because e.g. remotes or upstream branches can be configured there too.
+	"""
+
+	_values:       Dict[str, List[str]]  #: Configuration values by normalized name (all values of multi-valued keys).
+	_files:        List[Path]            #: Files read in order of appearance.
+	_missingFiles: List[Path]            #: Files looked up, but not existing.
+	_gitDirectory: Nullable[Path]        #: Git directory to evaluate ``gitdir:`` conditions.
+	_branch:       Nullable[str]         #: Checked out branch to evaluate ``onbranch:`` conditions.
+
+	MAX_INCLUDE_DEPTH = 10  #: Maximum nesting of included files like in Git.
+
+	def __init__(self, gitDirectory: Nullable[Path] = None, branch: Nullable[str] = None) -> None:
+		"""
+		Initialize an empty configuration.
+
+		:param gitDirectory: Git directory used to evaluate ``includeIf "gitdir:..."`` conditions.
+		:param branch:       Checked out branch used to evaluate ``includeIf "onbranch:..."`` conditions.
+		"""
+		self._values = {}
+		self._files = []
+		self._missingFiles = []
+		self._gitDirectory = gitDirectory
+		self._branch = branch
+
+	@classmethod
+	def ForRepository(cls, gitDirectory: Path, commonDirectory: Nullable[Path] = None, branch: Nullable[str] = None) -> "GitConfig":
+		"""
+		Read a repository's configuration.
+
+		The system (see :meth:`GetSystemFiles`) and global (see :meth:`GetGlobalFiles`) configuration files are read first,
+		followed by ``config`` in the common Git directory. If ``extensions.worktreeConfig`` is enabled, the worktree
+		specific ``config.worktree`` is read afterwards. Like in Git, values of later files take precedence.
+
+		:param gitDirectory:        Git directory (worktree specific for linked worktrees).
+		:param commonDirectory:     Common Git directory. If ``None``, ``gitDirectory`` is used.
+		:param branch:              Checked out branch used to evaluate ``onbranch:`` conditions.
+		:return:                    The repository's configuration.
+		:raises GitConfigException: If a configuration file can't be parsed.
+		"""
+		if commonDirectory is None:
+			commonDirectory = gitDirectory
+
+		config = cls(gitDirectory, branch)
+		for path in cls.GetSystemFiles() + cls.GetGlobalFiles():
+			config.ReadFile(path)
+		config.ReadFile(commonDirectory / "config")
+		if config.GetBoolean("extensions.worktreeConfig"):
+			config.ReadFile(gitDirectory / "config.worktree")
+
+		return config
+
+	@staticmethod
+	def GetSystemFiles() -> List[Path]:
+		"""
+		Return the system configuration file like Git: ``$GIT_CONFIG_SYSTEM`` or ``/etc/gitconfig``.
+
+		No file is returned, if ``$GIT_CONFIG_NOSYSTEM`` is true.
+
+		:return: List of system configuration files (at most one).
+		"""
+		if environ.get("GIT_CONFIG_NOSYSTEM", "").lower() in ("true", "yes", "on", "1"):
+			return []
+
+		return [Path(environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig"))]
+
+	@staticmethod
+	def GetGlobalFiles() -> List[Path]:
+		"""
+		Return the global configuration files like Git in order of increasing precedence.
+
+		These are ``$XDG_CONFIG_HOME/git/config`` (or ``~/.config/git/config``) and ``~/.gitconfig``. If
+		``$GIT_CONFIG_GLOBAL`` is set, only this file is returned.
+
+		:return: List of global configuration files.
+		"""
+		if "GIT_CONFIG_GLOBAL" in environ:
+			return [Path(environ["GIT_CONFIG_GLOBAL"])]
+
+		xdgConfigHome = environ.get("XDG_CONFIG_HOME", "")
+		xdgDirectory = Path(xdgConfigHome) if xdgConfigHome != "" else Path(expanduser("~/.config"))
+		return [xdgDirectory / "git" / "config", Path(expanduser("~/.gitconfig"))]
+
+	@readonly
+	def Files(self) -> List[Path]:
+		"""
+		Read-only property to return all configuration files read so far (including included files).
+
+		:return: List of configuration files.
+		"""
+		return self._files
+
+	@readonly
+	def MissingFiles(self) -> List[Path]:
+		"""
+		Read-only property to return all configuration files looked up so far, which didn't exist (e.g. a global
+		configuration file or an include target). Creating such a file can change the configuration.
+
+		:return: List of missing configuration files.
+		"""
+		return self._missingFiles
+
+	@staticmethod
+	def NormalizeName(name: str) -> str:
+		"""
+		Normalize a configuration name: section and key are case-insensitive, the subsection is case-sensitive.
+
+		:param name: Name of the configuration value like ``remote.origin.url``.
+		:return:     Normalized name.
+		"""
+		section, _, key = name.rpartition(".")
+		first, dot, subsection = section.partition(".")
+		return f"{first.lower()}{dot}{subsection}.{key.lower()}"
+
+	def ReadFile(self, path: Path, depth: int = 0) -> None:
+		"""
+		Read a configuration file and merge its values. Missing files are ignored like by Git.
+
+		:param path:                Path to the configuration file.
+		:param depth:               Nesting level of included files.
+		:raises GitConfigException: If the file can't be parsed or includes are nested too deep.
+		"""
+		if depth > self.MAX_INCLUDE_DEPTH:
+			raise GitConfigException(f"Exceeded maximum include depth ({self.MAX_INCLUDE_DEPTH}) while including '{path}'.")
+
+		try:
+			content = path.read_text(encoding="utf-8")
+		except (FileNotFoundError, NotADirectoryError):
+			self._missingFiles.append(path)
+			return
+		except (OSError, UnicodeDecodeError) as ex:
+			raise GitConfigException(f"Configuration file '{path}' can't be read.") from ex
+
+		self._files.append(path)
+		self.Parse(content, path, depth)
+
+	def Parse(self, content: str, path: Nullable[Path] = None, depth: int = 0) -> None:
+		"""
+		Parse configuration content and merge its values.
+
+		:param content:             Content of a configuration file.
+		:param path:                Path of the file. Relative include paths are resolved against its directory. If
+		                            ``None``, relative include paths are ignored.
+		:param depth:               Nesting level of included files.
+		:raises GitConfigException: If the content has a syntax error.
+		"""
+		source = "<string>" if path is None else str(path)
+		section: Nullable[str] = None
+		length = len(content)
+		index = 0
+		line = 1
+
+		def error(message: str) -> GitConfigException:
+			return GitConfigException(f"{message} in '{source}' at line {line}.")
+
+		while index < length:
+			char = content[index]
+			if char == "\n":
+				line += 1
+				index += 1
+			elif char in " \t\r":
+				index += 1
+			elif char in "#;":
+				end = content.find("\n", index)
+				index = length if end == -1 else end
+			elif char == "[":
+				section, index = self._ParseSectionHeader(content, index + 1, error)
+			elif char.isalpha():
+				start = index
+				while index < length and (content[index].isalnum() or content[index] == "-"):
+					index += 1
+				key = content[start:index].lower()
+				if section is None:
+					raise error(f"Key '{key}' outside of a section")
+
+				while index < length and content[index] in " \t\r":
+					index += 1
+
+				if index < length and content[index] == "=":
+					value, index, lines = self._ParseValue(content, index + 1, error)
+					line += lines
+				elif index == length or content[index] in "\n#;":
+					value = "true"
+				else:
+					raise error(f"Invalid character after key '{key}'")
+
+				name = f"{section}.{key}"
+				self._values.setdefault(name, []).append(value)
+				self._HandleInclude(section, key, value, path, depth)
+			else:
+				raise error(f"Invalid character '{char}'")
+
+	@staticmethod
+	def _ParseSectionHeader(content: str, index: int, error: Callable[[str], GitConfigException]) -> Tuple[str, int]:
+		length = len(content)
+		start = index
+		while index < length and (content[index].isalnum() or content[index] in "-."):
+			index += 1
+		name = content[start:index].lower()
+		if name == "":
+			raise error("Empty section name")
+
+		if index < length and content[index] == "]":
+			# Legacy syntax [section.subsection] has a case-insensitive subsection.
+			return name, index + 1
+		elif "." in name:
+			raise error(f"Invalid section header '{name}'")
+
+		while index < length and content[index] in " \t":
+			index += 1
+		if index == length or content[index] != "\"":
+			raise error(f"Invalid section header '{name}'")
+
+		index += 1
+		subsection = ""
+		while True:
+			if index == length or content[index] == "\n":
+				raise error(f"Unterminated subsection in section '{name}'")
+			char = content[index]
+			if char == "\"":
+				break
+			elif char == "\\":
+				index += 1
+				if index == length or content[index] == "\n":
+					raise error(f"Unterminated subsection in section '{name}'")
+				char = content[index]
+			subsection += char
+			index += 1
+
+		if index + 1 == length or content[index + 1] != "]":
+			raise error(f"Invalid section header '{name}'")
+
+		return f"{name}.{subsection}", index + 2
+
+	@staticmethod
+	def _ParseValue(content: str, index: int, error: Callable[[str], GitConfigException]) -> Tuple[str, int, int]:
+		length = len(content)
+		value = ""
+		spaces = ""
+		quoted = False
+		lines = 0
+
+		while index < length and content[index] in " \t":
+			index += 1
+
+		while index < length:
+			char = content[index]
+			if char == "\n":
+				if quoted:
+					raise error("Unterminated quoted value")
+				break
+			elif char == "\r" and content.startswith("\r\n", index):
+				index += 1
+				continue
+			elif not quoted and char in " \t":
+				spaces += " "
+			elif not quoted and char in "#;":
+				end = content.find("\n", index)
+				index = length if end == -1 else end
+				break
+			else:
+				if value != "":
+					value += spaces
+				spaces = ""
+				if char == "\"":
+					quoted = not quoted
+				elif char == "\\":
+					index += 1
+					if index < length and content[index] == "\r":
+						index += 1
+					if index < length and content[index] == "\n":
+						lines += 1
+					elif index < length and content[index] in _ESCAPES:
+						value += _ESCAPES[content[index]]
+					else:
+						raise error("Invalid escape sequence in value")
+				else:
+					value += char
+			index += 1
+		else:
+			if quoted:
+				raise error("Unterminated quoted value")
+
+		return value, index, lines
+
+	def _HandleInclude(self, section: str, key: str, value: str, path: Nullable[Path], depth: int) -> None:
+		if key != "path":
+			return
+		elif section == "include":
+			pass
+		elif section.startswith("includeif."):
+			if not self._MatchCondition(section[10:], path):
+				return
+		else:
+			return
+
+		if value.startswith("~/"):
+			value = expanduser(value)
+
+		includePath = Path(value)
+		if not includePath.is_absolute():
+			if path is None:
+				return
+			includePath = path.parent / includePath
+
+		self.ReadFile(includePath, depth + 1)
+
+	def _MatchCondition(self, condition: str, path: Nullable[Path]) -> bool:
+		kind, _, pattern = condition.partition(":")
+		if kind in ("gitdir", "gitdir/i"):
+			if self._gitDirectory is None:
+				return False
+
+			if pattern.startswith("~/"):
+				pattern = expanduser(pattern)
+			elif pattern.startswith("./"):
+				if path is None:
+					return False
+				pattern = (path.parent / pattern[2:]).as_posix()
+			elif not Path(pattern).is_absolute() and not pattern.startswith("**/"):
+				pattern = f"**/{pattern}"
+			if pattern.endswith("/"):
+				pattern += "**"
+
+			regExp = _GlobToRegExp(pattern, kind == "gitdir/i")
+			candidates = {self._gitDirectory.as_posix(), self._gitDirectory.resolve().as_posix()}
+			return any(regExp.match(candidate) is not None for candidate in candidates)
+		elif kind == "onbranch":
+			if self._branch is None or self._branch == "":
+				return False
+			if pattern.endswith("/"):
+				pattern += "**"
+
+			return _GlobToRegExp(pattern).match(self._branch) is not None
+
+		return False
+
+	def __contains__(self, name: str) -> bool:
+		return self.NormalizeName(name) in self._values
+
+	def GetValue(self, name: str) -> Nullable[str]:
+		"""
+		Return a configuration value. For multi-valued keys, the last value wins like in ``git config --get``.
+
+		:param name: Name of the configuration value like ``remote.origin.url``.
+		:return:     The value or ``None``, if not set.
+		"""
+		try:
+			return self._values[self.NormalizeName(name)][-1]
+		except KeyError:
+			return None
+
+	def GetValues(self, name: str) -> List[str]:
+		"""
+		Return all values of a (multi-valued) configuration key like ``git config --get-all``.
+
+		:param name: Name of the configuration value like ``remote.origin.fetch``.
+		:return:     List of values in order of appearance.
+		"""
+		return list(self._values.get(self.NormalizeName(name), ()))
+
+	def GetBoolean(self, name: str, default: bool = False) -> bool:
+		"""
+		Return a configuration value interpreted as a boolean.
+
+		:param name:                Name of the configuration value like ``core.bare``.
+		:param default:             Value returned if the key isn't set.
+		:return:                    The boolean value.
+		:raises GitConfigException: If the value isn't a valid boolean.
+		"""
+		value = self.GetValue(name)
+		if value is None:
+			return default
+
+		value = value.lower()
+		if value in ("true", "yes", "on", "1"):
+			return True
+		elif value in ("false", "no", "off", "0", ""):
+			return False
+
+		raise GitConfigException(f"Value '{value}' of '{name}' isn't a boolean.")
+
+	def GetBranchRemote(self, branch: str) -> Nullable[str]:
+		"""
+		Return the remote a local branch is tracking (``branch.<branch>.remote``).
+
+		:param branch: Name of the local branch.
+		:return:       Name of the remote or ``None``, if the branch isn't tracking a remote.
+		"""
+		return self.GetValue(f"branch.{branch}.remote")
+
+	def GetBranchMerge(self, branch: str) -> Nullable[str]:
+		"""
+		Return the upstream branch of a local branch (``branch.<branch>.merge``).
+
+		:param branch: Name of the local branch.
+		:return:       Upstream reference like ``refs/heads/main`` or ``None``, if not configured.
+		"""
+		return self.GetValue(f"branch.{branch}.merge")
+
+	def GetRemoteURL(self, remote: str) -> Nullable[str]:
+		"""
+		Return the URL of a remote (``remote.<remote>.url``) without credentials.
+
+		:param remote: Name of the remote.
+		:return:       The remote's URL or ``None``, if not configured.
+		"""
+		url = self.GetValue(f"remote.{remote}.url")
+		return None if url is None else self.WithoutCredentials(url)
+
+	@staticmethod
+	def WithoutCredentials(url: str) -> str:
+		"""
+		Remove user name and password from a remote URL like the CI services do.
+
+		SCP-like SSH addresses (``user@host:path``) and local paths aren't URLs and are returned unchanged.
+
+		:param url: Remote URL.
+		:return:    URL without credentials.
+		"""
+		scheme, separator, rest = url.partition("://")
+		if separator == "":
+			return url
+
+		try:
+			return str(URL.Parse(url).WithoutCredentials())
+		except (ToolingException, KeyError, ValueError):
+			# Schemes unknown to pyTooling (e.g. ssh://) are stripped manually.
+			authority, slash, path = rest.partition("/")
+			return f"{scheme}://{authority.rpartition('@')[2]}{slash}{path}"
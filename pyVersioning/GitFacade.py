@@ -0,0 +1,595 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A facade for all Git queries of a run, which memoizes each query's result."""
+from asyncio      import Task, create_subprocess_exec, ensure_future
+from datetime     import datetime
+from pathlib      import Path
+from subprocess   import CompletedProcess, PIPE
+from types        import TracebackType
+from typing       import Any, Awaitable, Callable, Dict, Iterable, Optional as Nullable, Tuple, Type, TypeVar
+
+from pyTooling.Decorators       import export, readonly
+
+from pyVersioning               import ToolException, GitHelperMixin, GitShowCommand, Commit, Description
+from pyVersioning.GitConfig     import GitConfig
+from pyVersioning.GitObjects    import GitObjectException, GitCommitObject
+from pyVersioning.GitRepository import GitRepository, GitRepositoryException, TagIndex
+from pyVersioning.GitSession    import GitSession
+
+
+T = TypeVar("T")
+
+_UNAVAILABLE = object()  #: Marker for queries the repository reader can't answer.
+
+
+@export
+class GitFacade(GitHelperMixin, slots=True):
+	"""
+	A single entry point for all Git queries of a run.
+
+	Every query is memoized for the lifetime of the facade, keyed by ``(query, ref)``. Queries are answered from the
+	pure-Python :class:`~pyVersioning.GitRepository.GitRepository` reader if possible and fall back to the ``git``
+	executable otherwise. Object reads (commits) fall back to the facade's :class:`~pyVersioning.GitSession.GitSession`,
+	so all of them share one ``git cat-file --batch`` process. Failed queries aren't memoized.
+
+	One facade is shared by :class:`~pyVersioning.Versioning` and its CI service. Tests can inject a facade (or a
+	subclass returning fake data) into both.
+	"""
+
+	_session:    GitSession                     #: Git session for ``git cat-file --batch`` object lookups.
+	_repository: Nullable[GitRepository]        #: Pure-Python repository reader (``None`` if unusable).
+	_checked:    bool                           #: True, if the repository's object format was checked.
+	_cache:      Dict[Tuple[str, str], Any]     #: Memoized query results by ``(query, ref)``.
+	_pending:    Dict[Tuple[str, str], Task]    #: Running asynchronous queries by ``(query, ref)``.
+	_hits:       int                            #: Number of queries answered from the cache.
+	_misses:     int                            #: Number of queries computed.
+	_spawns:     int                            #: Number of ``git`` processes spawned by queries.
+
+	def __init__(self, session: Nullable[GitSession] = None, repository: Nullable[GitRepository] = None) -> None:
+		"""
+		Initialize a Git facade.
+
+		:param session:    Git session for object lookups. If ``None``, a new session is created.
+		:param repository: Repository reader. If ``None``, all queries use the ``git`` executable.
+		"""
+		self._session = session if session is not None else GitSession()
+		self._repository = repository
+		self._checked = False
+		self._cache = {}
+		self._pending = {}
+		self._hits = 0
+		self._misses = 0
+		self._spawns = 0
+
+	@classmethod
+	def Discover(cls) -> "GitFacade":
+		"""
+		Create a facade for the repository containing the current working directory.
+
+		:return: A Git facade.
+		"""
+		return cls(GitSession(), GitRepository.Discover())
+
+	@readonly
+	def Session(self) -> GitSession:
+		"""
+		Read-only property to return the Git session shared by all Git object lookups of this run.
+
+		:return: The Git session.
+		"""
+		return self._session
+
+	@readonly
+	def Repository(self) -> Nullable[GitRepository]:
+		"""
+		Read-only property to return the pure-Python repository reader.
+
+		:return: The repository reader or ``None``, if no repository was found or its object format isn't supported.
+		"""
+		if not self._checked:
+			self._checked = True
+			if self._repository is not None:
+				try:
+					if self._repository.GetConfigValue("extensions.objectformat") not in (None, "sha1"):
+						self._repository = None
+				except GitRepositoryException:
+					self._repository = None
+
+		return self._repository
+
+	@readonly
+	def Hits(self) -> int:
+		"""
+		Read-only property to return the number of queries answered from the cache.
+
+		:return: Number of cache hits.
+		"""
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		"""
+		Read-only property to return the number of queries, which were computed.
+
+		:return: Number of cache misses.
+		"""
+		return self._misses
+
+	@readonly
+	def SpawnCount(self) -> int:
+		"""
+		Read-only property to return the number of spawned ``git`` processes (including the session's process).
+
+		:return: Number of spawned processes.
+		"""
+		return self._spawns + self._session.SpawnCount
+
+	def __enter__(self) -> "GitFacade":
+		return self
+
+	def __exit__(
+		self,
+		excType: Nullable[Type[BaseException]],
+		excValue: Nullable[BaseException],
+		traceback: Nullable[TracebackType]
+	) -> None:
+		self.Close()
+
+	def Close(self) -> None:
+		"""Release all resources like the session's ``git cat-file`` process or memory-mapped packfiles."""
+		self._session.Close()
+		if self._repository is not None:
+			self._repository.Close()
+
+	def Memoize(self, query: str, ref: str, compute: Callable[[], T]) -> T:
+		"""
+		Return a memoized query result or compute and memoize it.
+
+		:param query:   Name of the query.
+		:param ref:     Git reference, branch or remote name the query refers to.
+		:param compute: Function computing the result on a cache miss. Exceptions are propagated and nothing is memoized.
+		:return:        The query result.
+		"""
+		key = (query, ref)
+		try:
+			result = self._cache[key]
+		except KeyError:
+			self._misses += 1
+			result = self._cache[key] = compute()
+		else:
+			self._hits += 1
+
+		return result
+
+	async def MemoizeAsync(self, query: str, ref: str, compute: Callable[[], Awaitable[T]]) -> T:
+		"""
+		Return a memoized query result or compute and memoize it asynchronously.
+
+		Concurrent requests for the same query await the same computation.
+
+		:param query:   Name of the query.
+		:param ref:     Git reference, branch or remote name the query refers to.
+		:param compute: Coroutine function computing the result on a cache miss. Exceptions are propagated and nothing is
+		                memoized.
+		:return:        The query result.
+		"""
+		key = (query, ref)
+		if key in self._cache:
+			self._hits += 1
+			return self._cache[key]
+		elif key in self._pending:
+			self._hits += 1
+			return await self._pending[key]
+
+		self._misses += 1
+		self._pending[key] = task = ensure_future(compute())
+		try:
+			result = self._cache[key] = await task
+		finally:
+			del self._pending[key]
+
+		return result
+
+	def _ExecuteGit(self, arguments: Tuple[str, ...]) -> CompletedProcess:
+		self._spawns += 1
+		return super()._ExecuteGit(arguments)
+
+	async def _ExecuteGitAsync(self, arguments: Tuple[str, ...]) -> CompletedProcess:
+		"""
+		Run ``git`` with the given arguments without blocking the event loop.
+
+		:param arguments:      Arguments passed to ``git``.
+		:return:               The completed process.
+		:raises ToolException: If ``git`` can't be started.
+		"""
+		try:
+			process = await create_subprocess_exec("git", *arguments, stdout=PIPE, stderr=PIPE)
+		except OSError as ex:
+			raise ToolException(f"git {' '.join(arguments)}", str(ex))
+
+		self._spawns += 1
+		stdout, stderr = await process.communicate()
+		return CompletedProcess(("git", *arguments), process.returncode, stdout, stderr)
+
+	def _FromRepository(self, read: Callable[[GitRepository], T]) -> Any:
+		if self.Repository is None:
+			return _UNAVAILABLE
+
+		try:
+			return read(self._repository)
+		except GitRepositoryException:
+			return _UNAVAILABLE
+
+	def _Query(
+		self,
+		query: str,
+		ref: str,
+		fromRepository: Callable[[GitRepository], T],
+		arguments: Tuple[str, ...],
+		parse: Callable[[Tuple[str, ...], CompletedProcess], T]
+	) -> T:
+		def compute() -> T:
+			result = self._FromRepository(fromRepository)
+			if result is _UNAVAILABLE:
+				result = parse(arguments, self._ExecuteGit(arguments))
+
+			return result
+
+		return self.Memoize(query, ref, compute)
+
+	async def _QueryAsync(
+		self,
+		query: str,
+		ref: str,
+		fromRepository: Callable[[GitRepository], T],
+		arguments: Tuple[str, ...],
+		parse: Callable[[Tuple[str, ...], CompletedProcess], T]
+	) -> T:
+		async def compute() -> T:
+			result = self._FromRepository(fromRepository)
+			if result is _UNAVAILABLE:
+				result = parse(arguments, await self._ExecuteGitAsync(arguments))
+
+			return result
+
+		return await self.MemoizeAsync(query, ref, compute)
+
+	@staticmethod
+	def _ParseFirstLine(arguments: Tuple[str, ...], completed: CompletedProcess) -> str:
+		if completed.returncode != 0:
+			raise ToolException(f"git {' '.join(arguments)}", completed.stderr.decode("utf-8"))
+
+		return completed.stdout.decode("utf-8").split("\n")[0]
+
+	@staticmethod
+	def _ParseConfigValue(arguments: Tuple[str, ...], completed: CompletedProcess) -> Nullable[str]:
+		# 'git config' returns 1, if the key isn't set.
+		if completed.returncode == 1:
+			return None
+
+		return GitFacade._ParseFirstLine(arguments, completed)
+
+	@staticmethod
+	def _ParseTags(arguments: Tuple[str, ...], completed: CompletedProcess) -> str:
+		if completed.returncode != 0:
+			raise ToolException(f"git {' '.join(arguments)}", completed.stderr.decode("utf-8"))
+
+		tags = TagIndex.SortTags(line for line in completed.stdout.decode("utf-8").split("\n") if line != "")
+		return tags[0] if len(tags) > 0 else ""
+
+	def ExecuteGitShowBatch(
+		self,
+		commands: Iterable[GitShowCommand] = tuple(GitShowCommand),
+		ref: str = "HEAD"
+	) -> Dict[GitShowCommand, str]:
+		"""
+		Query commit fields. Each field is memoized separately, so later queries of already known fields are free.
+
+		Missing fields are read from the repository or from the Git session (all fields at once). If both fail, a single
+		``git show`` invocation is used.
+
+		:param commands:       Commit fields to query.
+		:param ref:            Git reference of the commit.
+		:return:               Dictionary of queried fields and their values.
+		:raises ToolException: If the commit doesn't exist or ``git show`` failed.
+		"""
+		commands = tuple(commands)
+		missing = tuple(cmd for cmd in commands if (cmd.name, ref) not in self._cache)
+		self._hits += len(commands) - len(missing)
+
+		if len(missing) > 0:
+			self._misses += len(missing)
+			fields = self._FromRepository(lambda repository: self._CommitFields(repository.ReadCommit(ref)))
+			if fields is _UNAVAILABLE:
+				fields = self._FromSession(ref)
+			if fields is _UNAVAILABLE:
+				fields = super().ExecuteGitShowBatch(missing, ref)
+			self._StoreCommitFields(fields, ref)
+
+		return {cmd: self._cache[(cmd.name, ref)] for cmd in commands}
+
+	async def ExecuteGitShowBatchAsync(
+		self,
+		commands: Iterable[GitShowCommand] = tuple(GitShowCommand),
+		ref: str = "HEAD"
+	) -> Dict[GitShowCommand, str]:
+		"""
+		Query commit fields asynchronously like :meth:`ExecuteGitShowBatch`.
+
+		If fields are missing, all fields of the commit are queried at once, so concurrent queries for the same commit
+		share a single lookup. The Git session's pipe round trip is short, thus it's done synchronously.
+
+		:param commands:       Commit fields to query.
+		:param ref:            Git reference of the commit.
+		:return:               Dictionary of queried fields and their values.
+		:raises ToolException: If ``git show`` failed.
+		"""
+		commands = tuple(commands)
+		if any((cmd.name, ref) not in self._cache for cmd in commands):
+			async def compute() -> Dict[GitShowCommand, str]:
+				fields = self._FromRepository(lambda repository: self._CommitFields(repository.ReadCommit(ref)))
+				if fields is _UNAVAILABLE:
+					fields = self._FromSession(ref)
+				if fields is _UNAVAILABLE:
+					allCommands = tuple(GitShowCommand)
+					arguments = self._GitShowBatchArguments(allCommands, ref)
+					fields = self._ParseGitShowBatch(allCommands, arguments, await self._ExecuteGitAsync(arguments))
+
+				return fields
+
+			self._StoreCommitFields(await self.MemoizeAsync("show", ref, compute), ref)
+
+		return {cmd: self._cache[(cmd.name, ref)] for cmd in commands}
+
+	def ExecuteGitShow(self, cmd: GitShowCommand, ref: str = "HEAD") -> str:
+		"""
+		Query a single commit field (memoized).
+
+		:param cmd:            Commit field to query.
+		:param ref:            Git reference of the commit.
+		:return:               The field's value.
+		:raises ToolException: If ``git show`` failed.
+		"""
+		return self.ExecuteGitShowBatch((cmd, ), ref)[cmd]
+
+	def _StoreCommitFields(self, fields: Dict[GitShowCommand, str], ref: str) -> None:
+		for cmd, value in fields.items():
+			self._cache[(cmd.name, ref)] = value
+
+	def _FromSession(self, ref: str) -> Any:
+		try:
+			return self._CommitFields(self._session.ReadCommit(ref))
+		except ToolException:
+			# The object doesn't exist, if the session survived the request. Otherwise, 'git cat-file' itself failed.
+			if self._session.IsOpen:
+				raise
+			return _UNAVAILABLE
+		except (GitObjectException, ValueError):
+			return _UNAVAILABLE
+
+	@staticmethod
+	def _CommitFields(commit: GitCommitObject) -> Dict[GitShowCommand, str]:
+		return {
+			GitShowCommand.CommitHash:           commit.Hash,
+			GitShowCommand.CommitDateTime:       str(commit.Committer.Timestamp),
+			GitShowCommand.CommitAuthorName:     commit.Author.Name,
+			GitShowCommand.CommitAuthorEmail:    commit.Author.Email,
+			GitShowCommand.CommitCommitterName:  commit.Committer.Name,
+			GitShowCommand.CommitCommitterEmail: commit.Committer.Email,
+			GitShowCommand.CommitComment:        commit.Message,
+		}
+
+	async def GetCommitAsync(self, ref: str = "HEAD", commitDateTime: Nullable[datetime] = None) -> Commit:
+		"""
+		Collect all commit information asynchronously like :meth:`~pyVersioning.GitHelperMixin.GetCommit`.
+
+		:param ref:            Git reference of the commit.
+		:param commitDateTime: Optional commit date and time (e.g. provided by a CI service).
+		:return:               The commit information as :class:`~pyVersioning.Commit`.
+		:raises ToolException: If ``git show`` failed.
+		"""
+		return self._CommitFromFields(await self.ExecuteGitShowBatchAsync(ref=ref), commitDateTime)
+
+	def GetCommitDate(self, ref: str = "HEAD") -> datetime:
+		"""
+		Return the commit date (memoized).
+
+		:param ref:            Git reference of the commit.
+		:return:               Commit date and time.
+		:raises ToolException: If ``git show`` failed.
+		"""
+		return datetime.fromtimestamp(int(self.ExecuteGitShow(GitShowCommand.CommitDateTime, ref)))
+
+	def GetGitDirectory(self) -> Path:
+		"""
+		Return the Git directory like ``git rev-parse --absolute-git-dir`` (memoized).
+
+		:return:               Absolute path to the Git directory.
+		:raises ToolException: If ``git rev-parse`` failed (e.g. outside of a repository).
+		"""
+		return self._Query(
+			"gitdir", "HEAD",
+			lambda repository: repository.GitDirectory,
+			("rev-parse", "--absolute-git-dir"),
+			lambda arguments, completed: Path(self._ParseFirstLine(arguments, completed))
+		)
+
+	def GetLocalBranch(self) -> str:
+		"""
+		Return the name of the checked out branch like ``git branch --show-current`` (memoized).
+
+		:return:               Branch name or an empty string for a detached ``HEAD``.
+		:raises ToolException: If ``git branch`` failed.
+		"""
+		return self._Query("branch", "HEAD", GitRepository.GetLocalBranch, ("branch", "--show-current"), self._ParseFirstLine)
+
+	async def GetLocalBranchAsync(self) -> str:
+		"""
+		Return the name of the checked out branch asynchronously like :meth:`GetLocalBranch`.
+
+		:return:               Branch name or an empty string for a detached ``HEAD``.
+		:raises ToolException: If ``git branch`` failed.
+		"""
+		return await self._QueryAsync("branch", "HEAD", GitRepository.GetLocalBranch, ("branch", "--show-current"), self._ParseFirstLine)
+
+	def GetRemote(self, localBranch: str) -> Nullable[str]:
+		"""
+		Return the remote a local branch is tracking (``branch.<branch>.remote``, memoized).
+
+		:param localBranch:    Name of the local branch.
+		:return:               Name of the remote or ``None``, if the branch isn't pushed to a remote.
+		:raises ToolException: If ``git config`` failed.
+		"""
+		return self._Query(
+			"remote", localBranch,
+			lambda repository: repository.Config.GetBranchRemote(localBranch),
+			("config", f"branch.{localBranch}.remote"),
+			self._ParseConfigValue
+		)
+
+	async def GetRemoteAsync(self, localBranch: str) -> Nullable[str]:
+		"""
+		Return the remote a local branch is tracking asynchronously like :meth:`GetRemote`.
+
+		:param localBranch:    Name of the local branch.
+		:return:               Name of the remote or ``None``, if the branch isn't pushed to a remote.
+		:raises ToolException: If ``git config`` failed.
+		"""
+		return await self._QueryAsync(
+			"remote", localBranch,
+			lambda repository: repository.Config.GetBranchRemote(localBranch),
+			("config", f"branch.{localBranch}.remote"),
+			self._ParseConfigValue
+		)
+
+	def GetRemoteBranch(self, localBranch: str) -> Nullable[str]:
+		"""
+		Return the upstream branch of a local branch (``branch.<branch>.merge``, memoized).
+
+		:param localBranch:    Name of the local branch.
+		:return:               Upstream reference like ``refs/heads/main`` or ``None``, if not configured.
+		:raises ToolException: If ``git config`` failed.
+		"""
+		return self._Query(
+			"merge", localBranch,
+			lambda repository: repository.Config.GetBranchMerge(localBranch),
+			("config", f"branch.{localBranch}.merge"),
+			self._ParseConfigValue
+		)
+
+	def GetRemoteURL(self, remote: str) -> Nullable[str]:
+		"""
+		Return the URL of a remote without credentials (``remote.<remote>.url``, memoized).
+
+		:param remote:         Name of the remote.
+		:return:               The remote's URL or ``None``, if not configured.
+		:raises ToolException: If ``git config`` failed.
+		"""
+		return self._Query(
+			"url", remote,
+			lambda repository: repository.Config.GetRemoteURL(remote),
+			("config", f"remote.{remote}.url"),
+			self._ParseRemoteURL
+		)
+
+	async def GetRemoteURLAsync(self, remote: str) -> Nullable[str]:
+		"""
+		Return the URL of a remote without credentials asynchronously like :meth:`GetRemoteURL`.
+
+		:param remote:         Name of the remote.
+		:return:               The remote's URL or ``None``, if not configured.
+		:raises ToolException: If ``git config`` failed.
+		"""
+		return await self._QueryAsync(
+			"url", remote,
+			lambda repository: repository.Config.GetRemoteURL(remote),
+			("config", f"remote.{remote}.url"),
+			self._ParseRemoteURL
+		)
+
+	@staticmethod
+	def _ParseRemoteURL(arguments: Tuple[str, ...], completed: CompletedProcess) -> Nullable[str]:
+		url = GitFacade._ParseConfigValue(arguments, completed)
+		return None if url is None else GitConfig.WithoutCredentials(url)
+
+	def GetTag(self, ref: str = "HEAD") -> str:
+		"""
+		Return the tag pointing at a commit (memoized). If multiple tags point at it, the highest version is returned.
+
+		:param ref:            Git reference of the commit.
+		:return:               Tag name or an empty string.
+		:raises ToolException: If ``git tag`` failed.
+		"""
+		return self._Query("tag", ref, lambda repository: self._ReadTag(repository, ref), ("tag", "--points-at", ref), self._ParseTags)
+
+	async def GetTagAsync(self, ref: str = "HEAD") -> str:
+		"""
+		Return the tag pointing at a commit asynchronously like :meth:`GetTag`.
+
+		:param ref:            Git reference of the commit.
+		:return:               Tag name or an empty string.
+		:raises ToolException: If ``git tag`` failed.
+		"""
+		return await self._QueryAsync("tag", ref, lambda repository: self._ReadTag(repository, ref), ("tag", "--points-at", ref), self._ParseTags)
+
+	@staticmethod
+	def _ReadTag(repository: GitRepository, ref: str) -> str:
+		tag = repository.TagIndex.GetBestTag(repository.ResolveReference(ref))
+		return tag if tag is not None else ""
+
+	def GetDescription(self, hash: str) -> Nullable[Description]:
+		"""
+		Describe a commit relative to the nearest tag (memoized).
+
+		The repository's commit-graph is used if available, otherwise a bounded breadth-first walk. If the walk can't count
+		the commits (e.g. it exceeds its limit), they are counted with ``git rev-list --count``.
+
+		:param hash:                    Hash of the commit to describe.
+		:return:                        The commit description or ``None``, if no repository reader is available.
+		:raises GitRepositoryException: If the history can't be read.
+		:raises ToolException:          If ``git rev-list`` failed.
+		"""
+		def compute() -> Nullable[Description]:
+			if self.Repository is None:
+				return None
+
+			count, nearest = self._repository.DescribeCommit(hash)
+			if count is None:
+				arguments = ("rev-list", "--count", hash)
+				count = int(self._ParseFirstLine(arguments, self._ExecuteGit(arguments)))
+
+			if nearest is None:
+				return Description(hash, count=count)
+
+			tag, _, distance = nearest
+			return Description(hash, tag, distance, count)
+
+		return self.Memoize("describe", hash, compute)
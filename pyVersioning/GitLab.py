@@ -64,7 +64,7 @@ class GitLab(CIService):
 		except KeyError as ex:
 			raise ServiceException("Can't find GitLab-CI environment variable 'CI_COMMIT_SHA'.") from ex
 
-	def GetCommitDate(self) -> datetime:
+	def GetCommitDateFromEnvironment(self) -> Nullable[datetime]:
 		"""
 		Returns the commit date as a :class:`~datetime.datetime`.
 
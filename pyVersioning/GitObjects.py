@@ -0,0 +1,471 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Data model and parsers for raw Git objects (commits, tags and trees)."""
+from datetime              import datetime
+from enum                  import Enum
+from typing                import Dict, List, Tuple, Optional as Nullable
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+from pyVersioning          import VersioningException, Commit, Person
+
+
+@export
+class GitObjectException(VersioningException):
+	"""Exception thrown when a raw Git object can't be parsed."""
+
+
+@export
+class GitObjectType(Enum):
+	"""An enumeration of Git object types."""
+	Commit = "commit"  #: A commit object.
+	Tree =   "tree"    #: A tree object (directory listing).
+	Blob =   "blob"    #: A blob object (file content).
+	Tag =    "tag"     #: An annotated tag object.
+
+
+@export
+class GitSignature(metaclass=ExtendedType, slots=True):
+	"""
+	This data structure class describes a signature line (``author``, ``committer`` or ``tagger``) of a Git object.
+	"""
+
+	_name:      str  #: Name of the person.
+	_email:     str  #: Email address of the person.
+	_timestamp: int  #: Seconds since epoch.
+	_offset:    str  #: Timezone offset like ``+0100``.
+
+	def __init__(self, name: str, email: str, timestamp: int, offset: str) -> None:
+		self._name = name
+		self._email = email
+		self._timestamp = timestamp
+		self._offset = offset
+
+	@classmethod
+	def Parse(cls, line: str) -> "GitSignature":
+		"""
+		Parse a signature line in format ``Name <email> timestamp offset``.
+
+		:param line:                The signature line without the leading keyword.
+		:return:                    The parsed signature.
+		:raises GitObjectException: If the line has no valid format.
+		"""
+		try:
+			nameAndEmail, timestamp, offset = line.rsplit(" ", 2)
+			name, email = nameAndEmail.split("<", 1)
+			return cls(name.strip(), email.rstrip(">"), int(timestamp), offset)
+		except ValueError as ex:
+			raise GitObjectException(f"Malformed signature line '{line}'.") from ex
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property to return the name of the person.
+
+		:return: Name of the person.
+		"""
+		return self._name
+
+	@readonly
+	def Email(self) -> str:
+		"""
+		Read-only property to return the email address of the person.
+
+		:return: Email address of the person.
+		"""
+		return self._email
+
+	@readonly
+	def Timestamp(self) -> int:
+		"""
+		Read-only property to return the timestamp in seconds since epoch.
+
+		:return: Timestamp of the signature.
+		"""
+		return self._timestamp
+
+	@readonly
+	def DateTime(self) -> datetime:
+		"""
+		Read-only property to return the timestamp as local date and time (same as ``git show --format=%ct``).
+
+		:return: Date and time of the signature.
+		"""
+		return datetime.fromtimestamp(self._timestamp)
+
+	def ToPerson(self) -> Person:
+		"""
+		Convert the signature to a :class:`~pyVersioning.Person`.
+
+		:return: The signature's person.
+		"""
+		return Person(name=self._name, email=self._email)
+
+
+@export
+class GitObject(metaclass=ExtendedType, slots=True):
+	"""Base-class for all raw Git objects."""
+
+	_hash:    str            #: Object's hash as hex string.
+	_type:    GitObjectType  #: Object's type.
+	_content: bytes          #: Object's raw content.
+
+	def __init__(self, hash: str, type: GitObjectType, content: bytes) -> None:
+		self._hash = hash
+		self._type = type
+		self._content = content
+
+	@readonly
+	def Hash(self) -> str:
+		"""
+		Read-only property to return the object's hash.
+
+		:return: Hash of the object as hex string.
+		"""
+		return self._hash
+
+	@readonly
+	def Type(self) -> GitObjectType:
+		"""
+		Read-only property to return the object's type.
+
+		:return: Type of the object.
+		"""
+		return self._type
+
+	@readonly
+	def Content(self) -> bytes:
+		"""
+		Read-only property to return the object's raw content.
+
+		:return: Content of the object.
+		"""
+		return self._content
+
+	@staticmethod
+	def _ParseHeaders(content: bytes) -> Tuple[List[Tuple[str, str]], str]:
+		"""
+		Split a commit or tag object into header fields and message.
+
+		Continuation lines (e.g. of ``gpgsig``) are appended to the previous header.
+		"""
+		rawHeaders, _, rawMessage = content.partition(b"\n\n")
+
+		headers: List[Tuple[str, str]] = []
+		encoding = "utf-8"
+		for line in rawHeaders.decode("utf-8", errors="replace").split("\n"):
+			if line.startswith(" ") and len(headers) > 0:
+				key, value = headers[-1]
+				headers[-1] = (key, f"{value}\n{line[1:]}")
+			elif line != "":
+				key, _, value = line.partition(" ")
+				headers.append((key, value))
+				if key == "encoding":
+					encoding = value
+
+		try:
+			message = rawMessage.decode(encoding, errors="replace")
+		except LookupError:
+			message = rawMessage.decode("utf-8", errors="replace")
+
+		return headers, message
+
+	@classmethod
+	def Parse(cls, hash: str, type: GitObjectType, content: bytes) -> "GitObject":
+		"""
+		Create a typed object instance from a raw object.
+
+		:param hash:    Object's hash.
+		:param type:    Object's type.
+		:param content: Object's raw content.
+		:return:        A :class:`GitCommitObject`, :class:`GitTagObject`, :class:`GitTreeObject` or :class:`GitObject`.
+		"""
+		if type is GitObjectType.Commit:
+			return GitCommitObject(hash, content)
+		elif type is GitObjectType.Tag:
+			return GitTagObject(hash, content)
+		elif type is GitObjectType.Tree:
+			return GitTreeObject(hash, content)
+		else:
+			return GitObject(hash, type, content)
+
+
+@export
+class GitCommitObject(GitObject):
+	"""A parsed Git commit object."""
+
+	_tree:      str              #: Hash of the commit's tree.
+	_parents:   Tuple[str, ...]  #: Hashes of the parent commits.
+	_author:    GitSignature     #: Author of the commit.
+	_committer: GitSignature     #: Committer of the commit.
+	_message:   str              #: Commit message.
+
+	def __init__(self, hash: str, content: bytes) -> None:
+		super().__init__(hash, GitObjectType.Commit, content)
+
+		headers, self._message = self._ParseHeaders(content)
+
+		parents = []
+		fields: Dict[str, str] = {}
+		for key, value in headers:
+			if key == "parent":
+				parents.append(value)
+			elif key not in fields:
+				fields[key] = value
+		self._parents = tuple(parents)
+
+		try:
+			self._tree = fields["tree"]
+			self._author = GitSignature.Parse(fields["author"])
+			self._committer = GitSignature.Parse(fields["committer"])
+		except KeyError as ex:
+			raise GitObjectException(f"Commit object '{hash}' has no '{ex.args[0]}' header.") from ex
+
+	@readonly
+	def Tree(self) -> str:
+		"""
+		Read-only property to return the hash of the commit's tree.
+
+		:return: Hash of the tree object.
+		"""
+		return self._tree
+
+	@readonly
+	def Parents(self) -> Tuple[str, ...]:
+		"""
+		Read-only property to return the hashes of all parent commits.
+
+		:return: Tuple of parent hashes.
+		"""
+		return self._parents
+
+	@readonly
+	def Author(self) -> GitSignature:
+		"""
+		Read-only property to return the author signature.
+
+		:return: Author of the commit.
+		"""
+		return self._author
+
+	@readonly
+	def Committer(self) -> GitSignature:
+		"""
+		Read-only property to return the committer signature.
+
+		:return: Committer of the commit.
+		"""
+		return self._committer
+
+	@readonly
+	def Message(self) -> str:
+		"""
+		Read-only property to return the commit message (same as ``git show --format=%B``).
+
+		:return: Commit message.
+		"""
+		return self._message
+
+	def ToCommit(self) -> Commit:
+		"""
+		Convert the raw commit object to a :class:`~pyVersioning.Commit`.
+
+		:return: The commit information.
+		"""
+		dt = self._committer.DateTime
+		return Commit(
+			hash=self._hash,
+			date=dt.date(),
+			time=dt.time(),
+			author=self._author.ToPerson(),
+			committer=self._committer.ToPerson(),
+			comment=self._message
+		)
+
+
+@export
+class GitTagObject(GitObject):
+	"""A parsed annotated Git tag object."""
+
+	_object:     str                     #: Hash of the tagged object.
+	_objectType: GitObjectType           #: Type of the tagged object.
+	_name:       str                     #: Name of the tag.
+	_tagger:     Nullable[GitSignature]  #: Tagger (optional for very old tags).
+	_message:    str                     #: Tag message.
+
+	def __init__(self, hash: str, content: bytes) -> None:
+		super().__init__(hash, GitObjectType.Tag, content)
+
+		headers, self._message = self._ParseHeaders(content)
+		fields = {key: value for key, value in reversed(headers)}
+
+		try:
+			self._object = fields["object"]
+			self._objectType = GitObjectType(fields["type"])
+			self._name = fields["tag"]
+		except KeyError as ex:
+			raise GitObjectException(f"Tag object '{hash}' has no '{ex.args[0]}' header.") from ex
+		except ValueError as ex:
+			raise GitObjectException(f"Tag object '{hash}' has an unknown object type.") from ex
+
+		self._tagger = GitSignature.Parse(fields["tagger"]) if "tagger" in fields else None
+
+	@readonly
+	def Object(self) -> str:
+		"""
+		Read-only property to return the hash of the tagged object.
+
+		:return: Hash of the tagged object.
+		"""
+		return self._object
+
+	@readonly
+	def ObjectType(self) -> GitObjectType:
+		"""
+		Read-only property to return the type of the tagged object.
+
+		:return: Type of the tagged object.
+		"""
+		return self._objectType
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property to return the tag's name.
+
+		:return: Name of the tag.
+		"""
+		return self._name
+
+	@readonly
+	def Tagger(self) -> Nullable[GitSignature]:
+		"""
+		Read-only property to return the tagger signature.
+
+		:return: Tagger of the tag or ``None``.
+		"""
+		return self._tagger
+
+	@readonly
+	def Message(self) -> str:
+		"""
+		Read-only property to return the tag message.
+
+		:return: Tag message.
+		"""
+		return self._message
+
+
+@export
+class GitTreeEntry(metaclass=ExtendedType, slots=True):
+	"""An entry in a Git tree object."""
+
+	_mode: str  #: File mode as octal string.
+	_name: str  #: File or directory name.
+	_hash: str  #: Hash of the referenced blob, tree or commit (submodule).
+
+	def __init__(self, mode: str, name: str, hash: str) -> None:
+		self._mode = mode
+		self._name = name
+		self._hash = hash
+
+	@readonly
+	def Mode(self) -> str:
+		"""
+		Read-only property to return the entry's file mode.
+
+		:return: File mode as octal string.
+		"""
+		return self._mode
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property to return the entry's name.
+
+		:return: File or directory name.
+		"""
+		return self._name
+
+	@readonly
+	def Hash(self) -> str:
+		"""
+		Read-only property to return the hash of the referenced object.
+
+		:return: Hash as hex string.
+		"""
+		return self._hash
+
+	@readonly
+	def IsTree(self) -> bool:
+		"""
+		Read-only property to check if the entry references a sub-tree.
+
+		:return: ``True``, if the entry is a directory.
+		"""
+		return self._mode == "40000"
+
+
+@export
+class GitTreeObject(GitObject):
+	"""A parsed Git tree object."""
+
+	_entries: Dict[str, GitTreeEntry]  #: Tree entries by name.
+
+	def __init__(self, hash: str, content: bytes) -> None:
+		super().__init__(hash, GitObjectType.Tree, content)
+
+		self._entries = {}
+		position = 0
+		while position < len(content):
+			spacePosition = content.index(b" ", position)
+			nulPosition = content.index(b"\x00", spacePosition)
+			mode = content[position:spacePosition].decode("ascii")
+			name = content[spacePosition + 1:nulPosition].decode("utf-8", errors="surrogateescape")
+			entryHash = content[nulPosition + 1:nulPosition + 21].hex()
+			self._entries[name] = GitTreeEntry(mode, name, entryHash)
+			position = nulPosition + 21
+
+	@readonly
+	def Entries(self) -> Dict[str, GitTreeEntry]:
+		"""
+		Read-only property to return all tree entries.
+
+		:return: Dictionary of entries by name.
+		"""
+		return self._entries
+
+	def __getitem__(self, name: str) -> GitTreeEntry:
+		return self._entries[name]
+
+	def __contains__(self, name: str) -> bool:
+		return name in self._entries
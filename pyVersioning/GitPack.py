@@ -0,0 +1,566 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Memory-mapped readers for Git packfiles, pack indices (``.idx``) and multi-pack-indices."""
+from collections import OrderedDict
+from mmap        import mmap, ACCESS_READ
+from pathlib     import Path
+from struct      import unpack_from
+from typing      import Dict, List, Optional as Nullable, Tuple, Union
+from zlib        import decompressobj, error as ZlibError
+
+from pyTooling.Decorators    import export, readonly
+from pyTooling.MetaClasses   import ExtendedType
+
+from pyVersioning            import VersioningException
+from pyVersioning.GitObjects import GitObjectType
+
+
+@export
+class PackException(VersioningException):
+	"""Exception thrown when a packfile, pack index or multi-pack-index is malformed."""
+
+
+_OBJECT_TYPES = {
+	1: GitObjectType.Commit,
+	2: GitObjectType.Tree,
+	3: GitObjectType.Blob,
+	4: GitObjectType.Tag,
+}
+_OFS_DELTA = 6
+_REF_DELTA = 7
+
+
+def _MapFile(path: Path) -> mmap:
+	with path.open("rb") as file:
+		try:
+			return mmap(file.fileno(), 0, access=ACCESS_READ)
+		except ValueError as ex:
+			raise PackException(f"File '{path}' is empty.") from ex
+
+
+def _BinarySearch(data: mmap, tableOffset: int, low: int, high: int, key: bytes) -> Nullable[int]:
+	"""Search ``key`` in a sorted table of 20-byte hashes within the index range ``[low, high)``."""
+	while low < high:
+		middle = (low + high) // 2
+		position = tableOffset + middle * 20
+		current = data[position:position + 20]
+		if current < key:
+			low = middle + 1
+		elif current > key:
+			high = middle
+		else:
+			return middle
+
+	return None
+
+
+def ApplyDelta(base: bytes, delta: bytes) -> bytes:
+	"""
+	Apply a Git delta (copy and insert instructions) to a base object.
+
+	:param base:           Content of the base object.
+	:param delta:          Delta data.
+	:return:               Content of the target object.
+	:raises PackException: If the delta is malformed or doesn't match the base object.
+	"""
+	def readSize(position: int) -> Tuple[int, int]:
+		size = shift = 0
+		while True:
+			byte = delta[position]
+			position += 1
+			size |= (byte & 0x7f) << shift
+			shift += 7
+			if not byte & 0x80:
+				return size, position
+
+	try:
+		sourceSize, position = readSize(0)
+		targetSize, position = readSize(position)
+		if sourceSize != len(base):
+			raise PackException(f"Delta expects a base object of {sourceSize} bytes, but got {len(base)} bytes.")
+
+		target = bytearray()
+		while position < len(delta):
+			opcode = delta[position]
+			position += 1
+			if opcode & 0x80:
+				offset = size = 0
+				for i in range(4):
+					if opcode & (1 << i):
+						offset |= delta[position] << (8 * i)
+						position += 1
+				for i in range(3):
+					if opcode & (0x10 << i):
+						size |= delta[position] << (8 * i)
+						position += 1
+				target += base[offset:offset + (size if size != 0 else 0x10000)]
+			elif opcode != 0:
+				target += delta[position:position + opcode]
+				position += opcode
+			else:
+				raise PackException("Delta contains the reserved opcode 0.")
+	except IndexError as ex:
+		raise PackException(f"Delta is truncated at offset {len(delta)}.") from ex
+
+	if len(target) != targetSize:
+		raise PackException(f"Delta result has {len(target)} bytes, but {targetSize} bytes were expected.")
+
+	return bytes(target)
+
+
+@export
+class PackIndex(metaclass=ExtendedType, slots=True):
+	"""
+	A memory-mapped pack index (``.idx``, version 1 and 2).
+
+	Objects are located by the 256-entry fanout table followed by a binary search in the sorted hash table, thus a
+	lookup costs O(log n) without loading the index into memory.
+	"""
+
+	_path:         Path  #: Path to the ``.idx`` file.
+	_map:          mmap  #: Memory-mapped index file.
+	_version:      int   #: Index version.
+	_count:        int   #: Number of objects.
+	_fanoutOffset: int   #: Offset of the fanout table.
+	_hashOffset:   int   #: Offset of the hash table.
+
+	def __init__(self, path: Path) -> None:
+		"""
+		Open and memory-map a pack index.
+
+		:param path:           Path to the ``.idx`` file.
+		:raises PackException: If the file is no valid pack index.
+		"""
+		self._path = path
+		self._map = _MapFile(path)
+
+		if self._map[:4] == b"\xfftOc":
+			self._version = unpack_from(">I", self._map, 4)[0]
+			if self._version != 2:
+				self.Close()
+				raise PackException(f"Pack index '{path}' has unsupported version {self._version}.")
+			self._fanoutOffset = 8
+			self._hashOffset = 8 + 256 * 4
+		else:
+			self._version = 1
+			self._fanoutOffset = 0
+			self._hashOffset = 256 * 4
+
+		self._count = unpack_from(">I", self._map, self._fanoutOffset + 255 * 4)[0]
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to return the path to the index file.
+
+		:return: Path to the ``.idx`` file.
+		"""
+		return self._path
+
+	@readonly
+	def Count(self) -> int:
+		"""
+		Read-only property to return the number of indexed objects.
+
+		:return: Number of objects.
+		"""
+		return self._count
+
+	def Close(self) -> None:
+		"""Unmap the index file."""
+		self._map.close()
+
+	def Lookup(self, hash: str) -> Nullable[int]:
+		"""
+		Find the offset of an object in the corresponding packfile.
+
+		:param hash: Object hash as hex string.
+		:return:     Offset in the packfile or ``None``, if the object isn't in this pack.
+		"""
+		key = bytes.fromhex(hash)
+		first = key[0]
+		low = unpack_from(">I", self._map, self._fanoutOffset + (first - 1) * 4)[0] if first > 0 else 0
+		high = unpack_from(">I", self._map, self._fanoutOffset + first * 4)[0]
+
+		if self._version == 1:
+			# Version 1 entries are 4-byte offsets followed by 20-byte hashes.
+			while low < high:
+				middle = (low + high) // 2
+				position = self._hashOffset + middle * 24
+				current = self._map[position + 4:position + 24]
+				if current < key:
+					low = middle + 1
+				elif current > key:
+					high = middle
+				else:
+					return unpack_from(">I", self._map, position)[0]
+			return None
+
+		index = _BinarySearch(self._map, self._hashOffset, low, high, key)
+		if index is None:
+			return None
+
+		offsetTable = self._hashOffset + self._count * 24  # skip hashes and CRC32 values
+		offset = unpack_from(">I", self._map, offsetTable + index * 4)[0]
+		if offset & 0x80000000:
+			largeOffsetTable = offsetTable + self._count * 4
+			offset = unpack_from(">Q", self._map, largeOffsetTable + (offset & 0x7fffffff) * 8)[0]
+
+		return offset
+
+
+@export
+class MultiPackIndex(metaclass=ExtendedType, slots=True):
+	"""
+	A memory-mapped multi-pack-index (``objects/pack/multi-pack-index``).
+
+	It maps object hashes of multiple packfiles to a pack and offset with a single fanout table and binary search.
+	"""
+
+	_path:               Path       #: Path to the multi-pack-index file.
+	_map:                mmap       #: Memory-mapped multi-pack-index file.
+	_packNames:          List[str]  #: Names of the indexed packs (``.idx`` files).
+	_fanoutOffset:       int        #: Offset of the OIDF chunk.
+	_hashOffset:         int        #: Offset of the OIDL chunk.
+	_objectOffset:       int        #: Offset of the OOFF chunk.
+	_largeOffsetOffset:  int        #: Offset of the LOFF chunk or -1.
+
+	def __init__(self, path: Path) -> None:
+		"""
+		Open and memory-map a multi-pack-index.
+
+		:param path:           Path to the multi-pack-index file.
+		:raises PackException: If the file is no valid SHA-1 multi-pack-index.
+		"""
+		self._path = path
+		self._map = _MapFile(path)
+
+		try:
+			signature, version, oidVersion, chunkCount, baseCount, packCount = unpack_from(">4sBBBBI", self._map, 0)
+			if signature != b"MIDX" or version != 1 or oidVersion != 1 or baseCount != 0:
+				raise PackException(f"Multi-pack-index '{path}' has an unsupported format.")
+
+			chunks: Dict[bytes, int] = {}
+			for i in range(chunkCount):
+				chunkID, offset = unpack_from(">4sQ", self._map, 12 + i * 12)
+				chunks[chunkID] = offset
+			endOfChunks = unpack_from(">4sQ", self._map, 12 + chunkCount * 12)[1]
+
+			packNamesOffset = chunks[b"PNAM"]
+			packNamesEnd = min([offset for offset in (*chunks.values(), endOfChunks) if offset > packNamesOffset])
+			names = self._map[packNamesOffset:packNamesEnd].split(b"\x00")
+			self._packNames = [name.decode("utf-8") for name in names if name != b""][:packCount]
+
+			self._fanoutOffset = chunks[b"OIDF"]
+			self._hashOffset = chunks[b"OIDL"]
+			self._objectOffset = chunks[b"OOFF"]
+			self._largeOffsetOffset = chunks.get(b"LOFF", -1)
+		except (KeyError, ValueError) as ex:
+			self.Close()
+			raise PackException(f"Multi-pack-index '{path}' is malformed.") from ex
+		except PackException:
+			self.Close()
+			raise
+
+	@readonly
+	def PackNames(self) -> List[str]:
+		"""
+		Read-only property to return the names of all indexed packs.
+
+		:return: List of pack index names (``pack-<hash>.idx``).
+		"""
+		return self._packNames
+
+	def Close(self) -> None:
+		"""Unmap the multi-pack-index file."""
+		self._map.close()
+
+	def Lookup(self, hash: str) -> Nullable[Tuple[str, int]]:
+		"""
+		Find the pack and offset of an object.
+
+		:param hash: Object hash as hex string.
+		:return:     Tuple of pack index name and offset or ``None``, if the object isn't indexed.
+		"""
+		key = bytes.fromhex(hash)
+		first = key[0]
+		low = unpack_from(">I", self._map, self._fanoutOffset + (first - 1) * 4)[0] if first > 0 else 0
+		high = unpack_from(">I", self._map, self._fanoutOffset + first * 4)[0]
+
+		index = _BinarySearch(self._map, self._hashOffset, low, high, key)
+		if index is None:
+			return None
+
+		packID, offset = unpack_from(">II", self._map, self._objectOffset + index * 8)
+		if offset & 0x80000000 and self._largeOffsetOffset >= 0:
+			offset = unpack_from(">Q", self._map, self._largeOffsetOffset + (offset & 0x7fffffff) * 8)[0]
+
+		return self._packNames[packID], offset
+
+
+@export
+class PackFile(metaclass=ExtendedType, slots=True):
+	"""
+	A memory-mapped packfile (``.pack``).
+
+	Only the requested object is inflated. Delta chains are resolved by :class:`PackStore`.
+	"""
+
+	_path: Path  #: Path to the packfile.
+	_map:  mmap  #: Memory-mapped packfile.
+
+	def __init__(self, path: Path) -> None:
+		"""
+		Open and memory-map a packfile.
+
+		:param path:           Path to the ``.pack`` file.
+		:raises PackException: If the file is no valid packfile.
+		"""
+		self._path = path
+		self._map = _MapFile(path)
+
+		if self._map[:4] != b"PACK" or unpack_from(">I", self._map, 4)[0] not in (2, 3):
+			self.Close()
+			raise PackException(f"File '{path}' is no packfile.")
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to return the path to the packfile.
+
+		:return: Path to the ``.pack`` file.
+		"""
+		return self._path
+
+	def Close(self) -> None:
+		"""Unmap the packfile."""
+		self._map.close()
+
+	def _Inflate(self, position: int, size: int) -> bytes:
+		decompressor = decompressobj()
+		chunkSize = min(max(size + 64, 512), 1 << 20)
+		chunks = []
+		while not decompressor.eof:
+			data = self._map[position:position + chunkSize]
+			if len(data) == 0:
+				raise PackException(f"Unexpected end of packfile '{self._path}'.")
+			try:
+				chunks.append(decompressor.decompress(data))
+			except ZlibError as ex:
+				raise PackException(f"Corrupt object data in packfile '{self._path}'.") from ex
+			position += chunkSize
+
+		content = b"".join(chunks)
+		if len(content) != size:
+			raise PackException(f"Object in packfile '{self._path}' has {len(content)} bytes, expected {size} bytes.")
+
+		return content
+
+	def ReadEntry(self, offset: int) -> Tuple[int, bytes, Union[None, int, str]]:
+		"""
+		Read and inflate a single pack entry without resolving deltas.
+
+		:param offset:         Offset of the entry in the packfile.
+		:return:               Tuple of pack type number, inflated data and delta base (offset for OFS deltas, hash for
+		                       REF deltas, otherwise ``None``).
+		:raises PackException: If the entry is malformed.
+		"""
+		try:
+			byte = self._map[offset]
+			typeNumber = (byte >> 4) & 0x07
+			size = byte & 0x0f
+			shift = 4
+			position = offset + 1
+			while byte & 0x80:
+				byte = self._map[position]
+				position += 1
+				size |= (byte & 0x7f) << shift
+				shift += 7
+
+			base: Union[None, int, str] = None
+			if typeNumber == _OFS_DELTA:
+				byte = self._map[position]
+				position += 1
+				distance = byte & 0x7f
+				while byte & 0x80:
+					byte = self._map[position]
+					position += 1
+					distance = ((distance + 1) << 7) | (byte & 0x7f)
+				base = offset - distance
+			elif typeNumber == _REF_DELTA:
+				base = self._map[position:position + 20].hex()
+				position += 20
+			elif typeNumber not in _OBJECT_TYPES:
+				raise PackException(f"Unknown object type {typeNumber} at offset {offset} in packfile '{self._path}'.")
+		except IndexError as ex:
+			raise PackException(f"Offset {offset} is out of range in packfile '{self._path}'.") from ex
+
+		return typeNumber, self._Inflate(position, size), base
+
+
+@export
+class PackStore(metaclass=ExtendedType, slots=True):
+	"""
+	Look up and read objects from all packfiles of a repository.
+
+	A multi-pack-index is used when present; packs not covered by it are searched via their own ``.idx`` file. Delta
+	chains are resolved with a small LRU cache of base objects, because neighbouring objects often share their bases.
+	"""
+
+	_packDirectory:  Path                                                     #: Directory containing the packfiles.
+	_multiPackIndex: Nullable[MultiPackIndex]                                 #: Optional multi-pack-index.
+	_indices:        List[PackIndex]                                          #: Pack indices not covered by the MIDX.
+	_packs:          Dict[str, PackFile]                                      #: Opened packfiles by index name.
+	_cache:          "OrderedDict[Tuple[str, int], Tuple[GitObjectType, bytes]]"  #: LRU cache of resolved objects.
+	_cacheSize:      int                                                      #: Maximum number of cached objects.
+
+	def __init__(self, packDirectory: Path, cacheSize: int = 64) -> None:
+		"""
+		Open all pack indices and the multi-pack-index of a pack directory.
+
+		:param packDirectory: Path to ``objects/pack``.
+		:param cacheSize:     Maximum number of cached base objects.
+		"""
+		self._packDirectory = packDirectory
+		self._multiPackIndex = None
+		self._indices = []
+		self._packs = {}
+		self._cache = OrderedDict()
+		self._cacheSize = cacheSize
+
+		if not packDirectory.is_dir():
+			return
+
+		covered: Tuple[str, ...] = ()
+		midxFile = packDirectory / "multi-pack-index"
+		if midxFile.is_file():
+			try:
+				self._multiPackIndex = MultiPackIndex(midxFile)
+				covered = tuple(self._multiPackIndex.PackNames)
+			except PackException:
+				self._multiPackIndex = None
+
+		for indexFile in sorted(packDirectory.glob("pack-*.idx")):
+			if indexFile.name not in covered and indexFile.with_suffix(".pack").is_file():
+				self._indices.append(PackIndex(indexFile))
+
+	def Close(self) -> None:
+		"""Unmap all pack indices and packfiles."""
+		if self._multiPackIndex is not None:
+			self._multiPackIndex.Close()
+			self._multiPackIndex = None
+		for index in self._indices:
+			index.Close()
+		for pack in self._packs.values():
+			pack.Close()
+
+		self._indices = []
+		self._packs = {}
+		self._cache.clear()
+
+	def _GetPack(self, indexName: str) -> PackFile:
+		try:
+			return self._packs[indexName]
+		except KeyError:
+			pack = PackFile((self._packDirectory / indexName).with_suffix(".pack"))
+			self._packs[indexName] = pack
+			return pack
+
+	def Lookup(self, hash: str) -> Nullable[Tuple[PackFile, int]]:
+		"""
+		Find the packfile and offset of an object.
+
+		:param hash: Object hash as hex string.
+		:return:     Tuple of packfile and offset or ``None``, if the object isn't packed.
+		"""
+		if self._multiPackIndex is not None:
+			location = self._multiPackIndex.Lookup(hash)
+			if location is not None:
+				return self._GetPack(location[0]), location[1]
+
+		for index in self._indices:
+			offset = index.Lookup(hash)
+			if offset is not None:
+				return self._GetPack(index.Path.name), offset
+
+		return None
+
+	def _Cache(self, key: Tuple[str, int], value: Tuple[GitObjectType, bytes]) -> None:
+		self._cache[key] = value
+		if len(self._cache) > self._cacheSize:
+			self._cache.popitem(last=False)
+
+	def ReadObject(self, hash: str) -> Nullable[Tuple[GitObjectType, bytes]]:
+		"""
+		Read an object and resolve its delta chain.
+
+		:param hash:           Object hash as hex string.
+		:return:               Tuple of object type and content or ``None``, if the object isn't packed.
+		:raises PackException: If the packfile is malformed or a delta base is missing.
+		"""
+		location = self.Lookup(hash)
+		if location is None:
+			return None
+
+		pack, offset = location
+		deltas: List[Tuple[Tuple[str, int], bytes]] = []
+		while True:
+			key = (pack.Path.name, offset)
+			cached = self._cache.get(key)
+			if cached is not None:
+				self._cache.move_to_end(key)
+				type, content = cached
+				break
+
+			typeNumber, data, base = pack.ReadEntry(offset)
+			if typeNumber == _OFS_DELTA:
+				deltas.append((key, data))
+				offset = base
+			elif typeNumber == _REF_DELTA:
+				deltas.append((key, data))
+				location = self.Lookup(base)
+				if location is None:
+					raise PackException(f"Delta base '{base}' of object '{hash}' isn't packed.")
+				pack, offset = location
+			else:
+				type, content = _OBJECT_TYPES[typeNumber], data
+				if len(deltas) > 0:
+					self._Cache(key, (type, content))
+				break
+
+			if len(deltas) > 10000:
+				raise PackException(f"Delta chain of object '{hash}' is too long.")
+
+		for key, delta in reversed(deltas):
+			content = ApplyDelta(content, delta)
+			self._Cache(key, (type, content))
+
+		return type, content
@@ -0,0 +1,716 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A pure-Python reader for Git repositories, which needs no ``git`` executable."""
+from collections.abc import Mapping
+from pathlib         import Path
+from typing          import Callable, Dict, Iterable, Iterator, List, Optional as Nullable, Tuple
+from zlib            import decompress, error as ZlibError
+
+from pyTooling.Decorators     import export, readonly
+from pyTooling.MetaClasses    import ExtendedType
+from pyTooling.Versioning     import SemanticVersion
+
+from pyVersioning             import VersioningException, Commit, Git
+from pyVersioning.CommitGraph import CommitGraph, CommitGraphException, CommitWalker
+from pyVersioning.GitConfig   import GitConfig, GitConfigException
+from pyVersioning.GitObjects  import GitObject, GitObjectType, GitCommitObject, GitTagObject, GitObjectException
+from pyVersioning.GitPack     import PackStore, PackException
+
+
+@export
+class GitRepositoryException(VersioningException):
+	"""
+	Exception thrown when a repository can't be read by :class:`GitRepository`.
+
+	Callers should fall back to query the ``git`` executable.
+	"""
+
+
+def _ParsePackedRefs(content: str) -> Dict[str, Tuple[str, Nullable[str]]]:
+	"""
+	Parse ``packed-refs`` into a mapping of reference names to target hash and optional peeled hash (``^`` lines).
+
+	If the header (``# pack-refs with: ...``) declares the trait ``fully-peeled`` (all references) or ``peeled`` (tags
+	only), a reference without ``^`` line doesn't point at a tag object. Its target is returned as peeled hash too, thus
+	callers don't need to peel it.
+	"""
+	references: Dict[str, Tuple[str, Nullable[str]]] = {}
+	traits: Tuple[str, ...] = ()
+	lastRef: Nullable[str] = None
+	for line in content.splitlines():
+		if line.startswith("# pack-refs with:"):
+			traits = tuple(line[17:].split())
+		elif line.startswith("#") or line == "":
+			continue
+		elif line.startswith("^"):
+			if lastRef is not None:
+				references[lastRef] = (references[lastRef][0], line[1:])
+		else:
+			hash, _, lastRef = line.partition(" ")
+			peeled = "fully-peeled" in traits or ("peeled" in traits and lastRef.startswith("refs/tags/"))
+			references[lastRef] = (hash, hash if peeled else None)
+
+	return references
+
+
+def _FileStamp(path: Path) -> Nullable[Tuple[int, int]]:
+	try:
+		status = path.stat()
+	except (FileNotFoundError, NotADirectoryError):
+		return None
+
+	return status.st_mtime_ns, status.st_size
+
+
+@export
+class TagTargets(metaclass=ExtendedType, slots=True):
+	"""
+	A read-only mapping of peeled commit hashes to tag names.
+
+	Tag names of a commit are sorted by :meth:`TagIndex.SortTags` on first access and memoized, thus only tags of looked
+	up commits are parsed as semantic versions. Checking for a commit (``in``) doesn't sort.
+	"""
+
+	_tags:   Dict[str, List[str]]   #: Unsorted tag names by commit hash.
+	_sorted: Dict[str, List[str]]   #: Memoized sorted tag names by commit hash.
+
+	def __init__(self, tags: Dict[str, List[str]]) -> None:
+		"""
+		Initialize a mapping of tags by commit.
+
+		:param tags: Unsorted tag names by commit hash.
+		"""
+		self._tags = tags
+		self._sorted = {}
+
+	def __getitem__(self, hash: str) -> List[str]:
+		try:
+			return self._sorted[hash]
+		except KeyError:
+			tags = self._sorted[hash] = TagIndex.SortTags(self._tags[hash])
+			return tags
+
+	def __contains__(self, hash: object) -> bool:
+		return hash in self._tags
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._tags)
+
+	def __len__(self) -> int:
+		return len(self._tags)
+
+	def get(self, hash: str, default: Nullable[List[str]] = None) -> Nullable[List[str]]:
+		"""
+		Return the sorted tag names of a commit.
+
+		:param hash:    Hash of the commit.
+		:param default: Value returned, if no tag points at the commit.
+		:return:        Tag names (highest version first) or ``default``.
+		"""
+		return self[hash] if hash in self._tags else default
+
+
+Mapping.register(TagTargets)
+
+
+@export
+class TagIndex(metaclass=ExtendedType, slots=True):
+	"""
+	An index of all tags by their peeled target commit.
+
+	The index is built from ``packed-refs`` (using the peeled ``^`` lines) and loose references in ``refs/tags``. It's
+	cached by file modification time and size, thus :meth:`Refresh` only re-reads changed files. Tags without a peeled
+	line are peeled once per target object, unless ``packed-refs`` declares them as (fully) peeled.
+
+	If multiple tags point at a commit, they are ordered by :class:`~pyTooling.Versioning.SemanticVersion` (highest
+	first). Tags that aren't semantic versions follow in alphabetical order. Tags are sorted per commit on first lookup.
+	"""
+
+	_commonDirectory: Path                                   #: Common Git directory containing ``refs`` and ``packed-refs``.
+	_peel:            Callable[[str], str]                   #: Callback to peel an object hash to a non-tag object.
+	_packedStamp:     Nullable[Tuple[int, int]]              #: Modification time and size of ``packed-refs``.
+	_packedTags:      Dict[str, Tuple[str, Nullable[str]]]   #: Packed tags with target and optional peeled hash.
+	_looseStamps:     Dict[Path, Tuple[int, int]]            #: Modification time and size of loose tag files.
+	_looseTags:       Dict[str, str]                         #: Loose tags with target hash.
+	_peeled:          Dict[str, str]                         #: Cache of peeled target hashes.
+	_byCommit:        Nullable[TagTargets]                   #: Tag names by peeled commit hash.
+
+	def __init__(self, commonDirectory: Path, peel: Callable[[str], str]) -> None:
+		"""
+		Initialize a tag index.
+
+		:param commonDirectory: Common Git directory.
+		:param peel:            Callback to peel an annotated tag object to the tagged object's hash.
+		"""
+		self._commonDirectory = commonDirectory
+		self._peel = peel
+		self._packedStamp = None
+		self._packedTags = {}
+		self._looseStamps = {}
+		self._looseTags = {}
+		self._peeled = {}
+		self._byCommit = None
+
+	@staticmethod
+	def SortTags(names: Iterable[str]) -> List[str]:
+		"""
+		Sort tag names by semantic version (highest first). Other tag names follow in alphabetical order.
+
+		:param names: Tag names.
+		:return:      Sorted list of tag names.
+		"""
+		versions = []
+		others = []
+		for name in sorted(names):
+			try:
+				versions.append((SemanticVersion.Parse(name), name))
+			except ValueError:
+				others.append(name)
+
+		versions.sort(key=lambda item: item[0], reverse=True)
+		return [name for _, name in versions] + others
+
+	def Refresh(self) -> bool:
+		"""
+		Re-read ``packed-refs`` and loose tag files, if their modification time or size changed.
+
+		:return:                        ``True``, if the index was rebuilt.
+		:raises GitRepositoryException: If an annotated tag can't be peeled.
+		"""
+		changed = False
+
+		packedRefsFile = self._commonDirectory / "packed-refs"
+		stamp = _FileStamp(packedRefsFile)
+		if stamp != self._packedStamp or self._byCommit is None:
+			content = packedRefsFile.read_text(encoding="utf-8") if stamp is not None else ""
+			self._packedTags = {
+				name[10:]: target for name, target in _ParsePackedRefs(content).items() if name.startswith("refs/tags/")
+			}
+			self._packedStamp = stamp
+			changed = True
+
+		looseStamps = {}
+		tagsDirectory = self._commonDirectory / "refs" / "tags"
+		if tagsDirectory.is_dir():
+			for file in tagsDirectory.rglob("*"):
+				stamp = _FileStamp(file)
+				if stamp is not None and file.is_file():
+					looseStamps[file] = stamp
+
+		if looseStamps != self._looseStamps or self._byCommit is None:
+			self._looseTags = {
+				file.relative_to(tagsDirectory).as_posix(): file.read_text(encoding="utf-8").strip() for file in looseStamps
+			}
+			self._looseStamps = looseStamps
+			changed = True
+
+		if changed:
+			targets: Dict[str, Tuple[str, Nullable[str]]] = dict(self._packedTags)
+			targets.update({name: (target, None) for name, target in self._looseTags.items()})
+
+			byCommit: Dict[str, List[str]] = {}
+			for name, (target, peeled) in targets.items():
+				if peeled is None:
+					try:
+						peeled = self._peeled[target]
+					except KeyError:
+						peeled = self._peeled[target] = self._peel(target)
+				byCommit.setdefault(peeled, []).append(name)
+
+			self._byCommit = TagTargets(byCommit)
+
+		return changed
+
+	@readonly
+	def Targets(self) -> TagTargets:
+		"""
+		Read-only property to return all tags by their peeled target commit.
+
+		:return: Mapping of commit hashes to tag names (highest version first).
+		"""
+		self.Refresh()
+		return self._byCommit
+
+	def GetTags(self, hash: str) -> List[str]:
+		"""
+		Return all tags pointing at a commit.
+
+		:param hash: Hash of the commit.
+		:return:     Tag names (highest version first).
+		"""
+		self.Refresh()
+		return self._byCommit.get(hash, [])
+
+	def GetBestTag(self, hash: str) -> Nullable[str]:
+		"""
+		Return the tag with the highest semantic version pointing at a commit.
+
+		:param hash: Hash of the commit.
+		:return:     Tag name or ``None``, if no tag points at the commit.
+		"""
+		tags = self.GetTags(hash)
+		return tags[0] if len(tags) > 0 else None
+
+
+@export
+class GitRepository(metaclass=ExtendedType, slots=True):
+	"""
+	Read ``HEAD``, references, configuration and objects directly from a repository's ``.git`` directory.
+
+	Supported are loose and packed references (``packed-refs``) as well as zlib-compressed loose objects and objects in
+	packfiles (see :class:`~pyVersioning.GitPack.PackStore`). Linked worktrees and submodules (``.git`` files with a
+	``gitdir:`` line) are supported too.
+	"""
+
+	_workingDirectory: Path                                 #: Root directory of the working tree.
+	_gitDirectory:     Path                                 #: Git directory (worktree specific for linked worktrees).
+	_commonDirectory:  Path                                 #: Common Git directory (objects, refs, config).
+	_packedRefs:       Nullable[Dict[str, Tuple[str, Nullable[str]]]]  #: Packed references with optional peeled hash.
+	_config:           Nullable[GitConfig]                  #: Configuration (read on first use).
+	_objects:          Dict[str, GitObject]                 #: Cache of read objects.
+	_packs:            Nullable[PackStore]                  #: Reader for packed objects (opened on first use).
+	_commitGraph:      Nullable[CommitGraph]                #: Commit-graph (opened on first use).
+	_tagIndex:         TagIndex                             #: Index of tags by peeled target.
+
+	def __init__(self, workingDirectory: Path, gitDirectory: Path) -> None:
+		"""
+		Initialize a repository reader.
+
+		:param workingDirectory: Root directory of the working tree.
+		:param gitDirectory:     Git directory.
+		"""
+		self._workingDirectory = workingDirectory
+		self._gitDirectory = gitDirectory
+		self._packedRefs = None
+		self._config = None
+		self._objects = {}
+		self._packs = None
+		self._commitGraph = None
+
+		commonDirFile = gitDirectory / "commondir"
+		if commonDirFile.is_file():
+			self._commonDirectory = (gitDirectory / commonDirFile.read_text(encoding="utf-8").strip()).resolve()
+		else:
+			self._commonDirectory = gitDirectory
+
+		self._tagIndex = TagIndex(self._commonDirectory, self.PeelObject)
+
+	@classmethod
+	def Discover(cls, path: Nullable[Path] = None) -> Nullable["GitRepository"]:
+		"""
+		Search the Git directory in ``path`` and all its parent directories.
+
+		:param path: Start directory. If ``None``, the current working directory is used.
+		:return:     A repository reader or ``None``, if no Git directory was found.
+		"""
+		path = (Path.cwd() if path is None else path).resolve()
+		for directory in (path, *path.parents):
+			dotGit = directory / ".git"
+			if dotGit.is_dir():
+				return cls(directory, dotGit)
+			elif dotGit.is_file():
+				content = dotGit.read_text(encoding="utf-8").strip()
+				if content.startswith("gitdir:"):
+					return cls(directory, (directory / content[7:].strip()).resolve())
+
+		return None
+
+	@readonly
+	def WorkingDirectory(self) -> Path:
+		"""
+		Read-only property to return the root directory of the working tree.
+
+		:return: Path to the working tree.
+		"""
+		return self._workingDirectory
+
+	@readonly
+	def GitDirectory(self) -> Path:
+		"""
+		Read-only property to return the Git directory.
+
+		:return: Path to the Git directory.
+		"""
+		return self._gitDirectory
+
+	@readonly
+	def CommonDirectory(self) -> Path:
+		"""
+		Read-only property to return the common Git directory containing objects, references and configuration.
+
+		:return: Path to the common Git directory.
+		"""
+		return self._commonDirectory
+
+	def Close(self) -> None:
+		"""Unmap all opened packfiles, indices and commit-graph files."""
+		if self._packs is not None:
+			self._packs.Close()
+			self._packs = None
+		if self._commitGraph is not None:
+			self._commitGraph.Close()
+			self._commitGraph = None
+
+	def _ReadPackedRefs(self) -> Dict[str, Tuple[str, Nullable[str]]]:
+		if self._packedRefs is None:
+			try:
+				content = (self._commonDirectory / "packed-refs").read_text(encoding="utf-8")
+			except FileNotFoundError:
+				content = ""
+			self._packedRefs = _ParsePackedRefs(content)
+
+		return self._packedRefs
+
+	def _ReadLooseReference(self, name: str) -> Nullable[str]:
+		# Per-worktree references are stored in the worktree's Git directory, all others in the common directory.
+		directory = self._gitDirectory if name == "HEAD" or not name.startswith("refs/") else self._commonDirectory
+		try:
+			return (directory / name).read_text(encoding="utf-8").strip()
+		except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+			return None
+
+	def ReadSymbolicReference(self, name: str = "HEAD") -> Nullable[str]:
+		"""
+		Read the target of a symbolic reference.
+
+		:param name: Name of the symbolic reference.
+		:return:     Target reference name (e.g. ``refs/heads/main``) or ``None``, if it's not a symbolic reference.
+		"""
+		content = self._ReadLooseReference(name)
+		if content is not None and content.startswith("ref:"):
+			return content[4:].strip()
+
+		return None
+
+	def ResolveReference(self, name: str = "HEAD") -> str:
+		"""
+		Resolve a (symbolic) reference to an object hash. Full object hashes are returned unchanged.
+
+		:param name:                    Full reference name like ``HEAD`` or ``refs/heads/main``.
+		:return:                        The object hash.
+		:raises GitRepositoryException: If the reference doesn't exist.
+		"""
+		if len(name) == 40 and all(c in "0123456789abcdef" for c in name):
+			return name
+
+		for _ in range(10):
+			content = self._ReadLooseReference(name)
+			if content is None:
+				try:
+					return self._ReadPackedRefs()[name][0]
+				except KeyError:
+					raise GitRepositoryException(f"Reference '{name}' doesn't exist.")
+			elif content.startswith("ref:"):
+				name = content[4:].strip()
+			else:
+				return content
+
+		raise GitRepositoryException(f"Reference '{name}' is nested too deeply.")
+
+	def ReadObject(self, hash: str) -> GitObject:
+		"""
+		Read and parse an object.
+
+		:param hash:                    The object's hash.
+		:return:                        The parsed object.
+		:raises GitRepositoryException: If the object doesn't exist or can't be read.
+		"""
+		try:
+			return self._objects[hash]
+		except KeyError:
+			pass
+
+		objectFile = self._commonDirectory / "objects" / hash[:2] / hash[2:]
+		try:
+			raw = decompress(objectFile.read_bytes())
+		except FileNotFoundError:
+			raw = None
+		except (OSError, ZlibError) as ex:
+			raise GitRepositoryException(f"Object '{hash}' can't be read.") from ex
+
+		try:
+			if raw is not None:
+				header, _, content = raw.partition(b"\x00")
+				type, size = header.decode("ascii").split(" ")
+				if int(size) != len(content):
+					raise GitRepositoryException(f"Object '{hash}' is truncated.")
+				obj = GitObject.Parse(hash, GitObjectType(type), content)
+			else:
+				if self._packs is None:
+					self._packs = PackStore(self._commonDirectory / "objects" / "pack")
+				packed = self._packs.ReadObject(hash)
+				if packed is None:
+					raise GitRepositoryException(f"Object '{hash}' doesn't exist.")
+				obj = GitObject.Parse(hash, *packed)
+		except (ValueError, GitObjectException, PackException) as ex:
+			raise GitRepositoryException(f"Object '{hash}' is malformed.") from ex
+
+		self._objects[hash] = obj
+		return obj
+
+	def PeelObject(self, hash: str) -> str:
+		"""
+		Follow annotated tags until a non-tag object is reached.
+
+		:param hash:                    Hash of an object.
+		:return:                        Hash of the first non-tag object.
+		:raises GitRepositoryException: If an object can't be read.
+		"""
+		for _ in range(10):
+			obj = self.ReadObject(hash)
+			if not isinstance(obj, GitTagObject):
+				return hash
+			hash = obj.Object
+
+		raise GitRepositoryException(f"Tag '{hash}' is nested too deeply.")
+
+	def ReadCommit(self, ref: str = "HEAD") -> GitCommitObject:
+		"""
+		Read a commit object referenced by a (symbolic) reference.
+
+		:param ref:                     Full reference name like ``HEAD`` or ``refs/heads/main``.
+		:return:                        The parsed commit object.
+		:raises GitRepositoryException: If the reference or commit doesn't exist.
+		"""
+		obj = self.ReadObject(self.PeelObject(self.ResolveReference(ref)))
+		if not isinstance(obj, GitCommitObject):
+			raise GitRepositoryException(f"Reference '{ref}' doesn't point to a commit.")
+
+		return obj
+
+	def _ReadCommitObject(self, hash: str) -> GitCommitObject:
+		obj = self.ReadObject(hash)
+		if not isinstance(obj, GitCommitObject):
+			raise GitRepositoryException(f"Object '{hash}' is not a commit.")
+
+		return obj
+
+	def GetShallowCommits(self) -> Tuple[str, ...]:
+		"""
+		Return the commits of a shallow clone, whose parents are missing.
+
+		:return: Hashes listed in ``.git/shallow``.
+		"""
+		try:
+			return tuple((self._commonDirectory / "shallow").read_text(encoding="ascii").split())
+		except FileNotFoundError:
+			return ()
+
+	def GetStateFiles(self) -> List[Path]:
+		"""
+		Return the files, whose change can alter the collected Git information (e.g. for build system dependency files).
+
+		These are ``HEAD``, the current branch's loose reference, ``packed-refs``, ``shallow``, the loose tags and the
+		configuration files (remotes). If the branch's loose reference doesn't exist (yet), its nearest existing parent
+		directory is listed instead, because that directory changes when the reference is created. The tags directories
+		are listed for the same reason.
+
+		:return: Existing files and directories.
+		"""
+		files = [self._gitDirectory / "HEAD"]
+
+		branch = self.ReadSymbolicReference()
+		if branch is not None:
+			reference = self._commonDirectory / branch
+			while not reference.exists() and reference != self._commonDirectory:
+				reference = reference.parent
+			files.append(reference)
+
+		for name in ("packed-refs", "shallow"):
+			if (self._commonDirectory / name).is_file():
+				files.append(self._commonDirectory / name)
+
+		tagsDirectory = self._commonDirectory / "refs" / "tags"
+		if tagsDirectory.is_dir():
+			files.append(tagsDirectory)
+			files.extend(sorted(tagsDirectory.rglob("*")))
+
+		files.extend(file for file in self.Config.Files if file.is_file())
+
+		return list(dict.fromkeys(files))
+
+	def GetCommitWalker(self) -> CommitWalker:
+		"""
+		Create a history walker, which uses the repository's commit-graph if present.
+
+		:return:                        A commit walker.
+		:raises GitRepositoryException: If the commit-graph is malformed.
+		"""
+		if self._commitGraph is None:
+			try:
+				self._commitGraph = CommitGraph.Open(self._commonDirectory / "objects")
+			except CommitGraphException as ex:
+				raise GitRepositoryException("Commit-graph can't be read.") from ex
+
+		return CommitWalker(self._ReadCommitObject, self._commitGraph, self.GetShallowCommits())
+
+	def DescribeCommit(self, hash: str) -> Tuple[Nullable[int], Nullable[Tuple[str, str, int]]]:
+		"""
+		Count the commits in the history of a commit and find its nearest tag (see :class:`CommitWalker`).
+
+		:param hash:                    Hash of the commit to describe.
+		:return:                        Tuple of the number of commits (``None``, if the walk limit was exceeded) and the
+		                                nearest tag as tuple of tag name, tagged commit hash and distance (``None``, if no
+		                                tag was found).
+		:raises GitRepositoryException: If the history can't be read or the hash is invalid.
+		"""
+		walker = self.GetCommitWalker()
+		try:
+			return walker.CountCommits(hash), walker.FindNearestTag(hash, self.GetTagTargets())
+		except CommitGraphException as ex:
+			raise GitRepositoryException(f"History of '{hash}' can't be read from the commit-graph.") from ex
+
+	@readonly
+	def Config(self) -> GitConfig:
+		"""
+		Read-only property to return the repository's configuration.
+
+		The configuration files (including ``include``, ``includeIf`` and worktree configs) are read only once.
+
+		:return:                        The repository's configuration.
+		:raises GitRepositoryException: If a configuration file can't be parsed.
+		"""
+		if self._config is None:
+			try:
+				self._config = GitConfig.ForRepository(self._gitDirectory, self._commonDirectory, self.GetLocalBranch())
+			except GitConfigException as ex:
+				raise GitRepositoryException("Configuration can't be read.") from ex
+
+		return self._config
+
+	def GetConfigValue(self, name: str) -> Nullable[str]:
+		"""
+		Read a configuration value like ``remote.origin.url``.
+
+		:param name:                    Name of the configuration value (section, optional subsection and key separated by
+		                                dots).
+		:return:                        The value or ``None``, if not set.
+		:raises GitRepositoryException: If a configuration file can't be parsed.
+		"""
+		return self.Config.GetValue(name)
+
+	def GetLocalBranch(self) -> str:
+		"""
+		Return the name of the checked out branch.
+
+		:return: Branch name or an empty string for a detached ``HEAD``.
+		"""
+		target = self.ReadSymbolicReference("HEAD")
+		if target is not None and target.startswith("refs/heads/"):
+			return target[11:]
+
+		return ""
+
+	def GetRemote(self, localBranch: str) -> str:
+		"""
+		Return the name of the remote the local branch is tracking.
+
+		:param localBranch:             Name of the local branch.
+		:return:                        Name of the remote.
+		:raises GitRepositoryException: If the branch doesn't track a remote.
+		"""
+		remote = self.Config.GetBranchRemote(localBranch)
+		if remote is None:
+			raise GitRepositoryException(f"Branch '{localBranch}' is not pushed to a remote.")
+
+		return remote
+
+	def GetRemoteURL(self, remote: str) -> str:
+		"""
+		Return the URL of a remote without credentials.
+
+		:param remote:                  Name of the remote.
+		:return:                        The remote's URL.
+		:raises GitRepositoryException: If the remote has no URL.
+		"""
+		url = self.Config.GetRemoteURL(remote)
+		if url is None:
+			raise GitRepositoryException(f"Remote '{remote}' has no URL.")
+
+		return url
+
+	@readonly
+	def TagIndex(self) -> TagIndex:
+		"""
+		Read-only property to return the index of all tags by their peeled target commit.
+
+		:return: The tag index.
+		"""
+		return self._tagIndex
+
+	def GetTagTargets(self) -> TagTargets:
+		"""
+		Return all tags by their peeled target commit.
+
+		:return:                        Mapping of commit hashes to tag names (highest version first).
+		:raises GitRepositoryException: If a tag object can't be read.
+		"""
+		return self._tagIndex.Targets
+
+	def GetTags(self, hash: str) -> List[str]:
+		"""
+		Return all tags pointing at a commit (like ``git tag --points-at``).
+
+		:param hash:                    Hash of the commit.
+		:return:                        Tag names (highest version first).
+		:raises GitRepositoryException: If a tag object can't be read.
+		"""
+		return self._tagIndex.GetTags(hash)
+
+	def GetLastCommit(self) -> Commit:
+		"""
+		Return the commit information of ``HEAD``.
+
+		:return:                        The commit information.
+		:raises GitRepositoryException: If ``HEAD`` can't be resolved.
+		"""
+		return self.ReadCommit("HEAD").ToCommit()
+
+	def GetGitInformation(self) -> Git:
+		"""
+		Collect commit, tag, branch and remote URL like :meth:`pyVersioning.Versioning.GetGitInformation`.
+
+		:return:                        The collected Git information.
+		:raises GitRepositoryException: If any information can't be read from the repository.
+		"""
+		if self.GetConfigValue("extensions.objectformat") not in (None, "sha1"):
+			raise GitRepositoryException("Only SHA-1 repositories are supported.")
+
+		commit = self.GetLastCommit()
+		tags = self.GetTags(commit.hash)
+		branch = self.GetLocalBranch()
+
+		return Git(
+			commit=commit,
+			tag=tags[0] if len(tags) > 0 else "",
+			branch=branch,
+			repository=self.GetRemoteURL(self.GetRemote(branch))
+		)
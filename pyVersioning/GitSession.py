@@ -0,0 +1,264 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A persistent ``git cat-file --batch`` session to look up Git objects without spawning a process per object."""
+from atexit      import register as atexit_register, unregister as atexit_unregister
+from pathlib     import Path
+from subprocess  import Popen, PIPE, TimeoutExpired
+from types       import TracebackType
+from typing      import Generator, Iterable, Optional as Nullable, Type
+
+from pyTooling.Decorators    import export, readonly
+from pyTooling.MetaClasses   import ExtendedType
+
+from pyVersioning            import ToolException
+from pyVersioning.GitObjects import GitObject, GitObjectType, GitCommitObject, GitTagObject, GitTreeObject
+
+
+@export
+class GitSession(metaclass=ExtendedType, slots=True):
+	"""
+	A Git session keeps one ``git cat-file --batch`` process open for all object lookups within a run.
+
+	The process is started on first use. Object requests and responses are streamed through its pipes, thus the cost
+	per object is one pipe round trip instead of one process spawn. The process is terminated by :meth:`Close`, when
+	leaving a ``with`` statement or at interpreter exit.
+	"""
+
+	_workingDirectory: Nullable[Path]   #: Working directory of the Git process.
+	_process:          Nullable[Popen]  #: The ``git cat-file`` process.
+	_requestCount:     int              #: Number of requested objects.
+	_spawnCount:       int              #: Number of spawned processes.
+
+	def __init__(self, workingDirectory: Nullable[Path] = None) -> None:
+		"""
+		Initialize a Git session.
+
+		:param workingDirectory: Working directory within the Git repository. If ``None``, the current directory is used.
+		"""
+		self._workingDirectory = workingDirectory
+		self._process = None
+		self._requestCount = 0
+		self._spawnCount = 0
+
+	def __enter__(self) -> "GitSession":
+		return self
+
+	def __exit__(
+		self,
+		excType: Nullable[Type[BaseException]],
+		excValue: Nullable[BaseException],
+		traceback: Nullable[TracebackType]
+	) -> None:
+		self.Close()
+
+	@readonly
+	def IsOpen(self) -> bool:
+		"""
+		Read-only property to check if the ``git cat-file`` process is running.
+
+		:return: ``True``, if the process is running.
+		"""
+		return self._process is not None
+
+	@readonly
+	def RequestCount(self) -> int:
+		"""
+		Read-only property to return the number of objects requested in this session.
+
+		:return: Number of requested objects.
+		"""
+		return self._requestCount
+
+	@readonly
+	def SpawnCount(self) -> int:
+		"""
+		Read-only property to return the number of processes spawned by this session.
+
+		:return: Number of spawned processes.
+		"""
+		return self._spawnCount
+
+	def Open(self) -> None:
+		"""
+		Start the ``git cat-file --batch`` process, if not already running.
+
+		:raises ToolException: If Git can't be started.
+		"""
+		if self._process is not None:
+			return
+
+		command = "git"
+		arguments = ("cat-file", "--batch")
+		try:
+			self._process = Popen((command, *arguments), stdin=PIPE, stdout=PIPE, stderr=PIPE, cwd=self._workingDirectory)
+		except OSError as ex:
+			raise ToolException(f"{command} {' '.join(arguments)}", str(ex)) from ex
+
+		self._spawnCount += 1
+		atexit_register(self.Close)
+
+	def Close(self) -> None:
+		"""Close the pipes and terminate the ``git cat-file`` process."""
+		if self._process is None:
+			return
+
+		process = self._process
+		self._process = None
+		atexit_unregister(self.Close)
+
+		try:
+			process.stdin.close()
+		except OSError:
+			pass
+
+		try:
+			process.wait(timeout=5)
+		except TimeoutExpired:
+			process.kill()
+			process.wait()
+
+		process.stdout.close()
+		process.stderr.close()
+
+	def _Fail(self, message: str) -> ToolException:
+		process = self._process
+		self._process = None
+		atexit_unregister(self.Close)
+
+		if process is not None:
+			try:
+				_, error = process.communicate(timeout=5)
+			except (OSError, ValueError, TimeoutExpired):
+				process.kill()
+				process.wait()
+				error = b""
+
+			if error != b"":
+				message = f"{message} {error.decode('utf-8', errors='replace').strip()}"
+
+		return ToolException("git cat-file --batch", message)
+
+	def _Request(self, ref: str) -> None:
+		if "\n" in ref:
+			raise ValueError(f"Object name '{ref}' contains a line break.")
+
+		self.Open()
+		try:
+			self._process.stdin.write(f"{ref}\n".encode("utf-8"))
+			self._process.stdin.flush()
+		except OSError as ex:
+			raise self._Fail(f"Can't send request for '{ref}'.") from ex
+
+		self._requestCount += 1
+
+	def _Response(self, ref: str) -> Nullable[GitObject]:
+		header = self._process.stdout.readline()
+		if header == b"":
+			raise self._Fail(f"Unexpected end of stream while reading '{ref}'.")
+
+		line = header.decode("utf-8").rstrip("\n")
+		if line.endswith((" missing", " ambiguous")):
+			return None
+
+		fields = line.rsplit(" ", 2)
+		if len(fields) != 3:
+			raise self._Fail(f"Malformed response header '{header!r}' for '{ref}'.")
+
+		hash, type, size = fields
+		content = self._process.stdout.read(int(size) + 1)
+		if len(content) != int(size) + 1:
+			raise self._Fail(f"Unexpected end of stream while reading '{ref}'.")
+
+		return GitObject.Parse(hash, GitObjectType(type), content[:-1])
+
+	def ReadObject(self, ref: str) -> Nullable[GitObject]:
+		"""
+		Read a single object.
+
+		:param ref:            Object name, e.g. a hash, ``HEAD``, ``v1.0.0^{commit}`` or ``HEAD:path/to/file``.
+		:return:               The parsed object or ``None``, if the object doesn't exist.
+		:raises ToolException: If the communication with Git failed.
+		"""
+		self._Request(ref)
+		return self._Response(ref)
+
+	def ReadObjects(self, refs: Iterable[str]) -> Generator[Nullable[GitObject], None, None]:
+		"""
+		Stream multiple objects through the session.
+
+		:param refs:           Object names.
+		:return:               A generator of parsed objects (or ``None`` for missing objects) in request order.
+		:raises ToolException: If the communication with Git failed.
+		"""
+		for ref in refs:
+			yield self.ReadObject(ref)
+
+	def ReadCommit(self, ref: str = "HEAD") -> GitCommitObject:
+		"""
+		Read a commit object. Annotated tags are peeled to their commit.
+
+		:param ref:            A commit-ish object name.
+		:return:               The parsed commit object.
+		:raises ToolException: If the object doesn't exist or isn't a commit.
+		"""
+		obj = self.ReadObject(f"{ref}^{{commit}}")
+		if not isinstance(obj, GitCommitObject):
+			raise ToolException("git cat-file --batch", f"'{ref}' is not a commit.")
+
+		return obj
+
+	def ReadTag(self, ref: str) -> GitTagObject:
+		"""
+		Read an annotated tag object.
+
+		:param ref:            A tag name or hash of a tag object.
+		:return:               The parsed tag object.
+		:raises ToolException: If the object doesn't exist or isn't an annotated tag.
+		"""
+		obj = self.ReadObject(ref)
+		if not isinstance(obj, GitTagObject):
+			raise ToolException("git cat-file --batch", f"'{ref}' is not an annotated tag.")
+
+		return obj
+
+	def ReadTree(self, ref: str = "HEAD") -> GitTreeObject:
+		"""
+		Read a tree object. Commits and tags are peeled to their tree.
+
+		:param ref:            A tree-ish object name, e.g. ``HEAD`` or ``HEAD:src``.
+		:return:               The parsed tree object.
+		:raises ToolException: If the object doesn't exist or isn't a tree.
+		"""
+		obj = self.ReadObject(f"{ref}^{{tree}}")
+		if not isinstance(obj, GitTreeObject):
+			raise ToolException("git cat-file --batch", f"'{ref}' is not a tree.")
+
+		return obj
@@ -0,0 +1,180 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A mapping of template variables, whose values are provided on first access."""
+from collections.abc import MutableMapping
+from typing          import Any, Callable, Dict, Iterable, Iterator, Optional as Nullable, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+
+@export
+class VariableNamespace(metaclass=ExtendedType, slots=True):
+	"""
+	A mapping of variable names to values, which are either assigned directly or resolved on first access by a registered
+	provider.
+
+	Resolved values are memoized. If a provider raises an exception, the exception surfaces at the access of that variable
+	and the provider stays registered, thus the next access retries. Checking for a variable (``in``) and iterating
+	variable names doesn't resolve values, but iterating values or items (like ``str.format(**namespace)``) resolves all of
+	them.
+
+	Variables keep their order of first assignment or registration.
+	"""
+
+	_values:    Dict[str, Any]                  #: Resolved or assigned values.
+	_providers: Dict[str, Callable[[], Any]]    #: Providers of unresolved values.
+	_order:     Dict[str, None]                 #: Variable names in order of first assignment or registration.
+
+	def __init__(self, values: Nullable[Dict[str, Any]] = None) -> None:
+		"""
+		Initialize a variable namespace.
+
+		:param values: Optional initial values.
+		"""
+		self._values = {}
+		self._providers = {}
+		self._order = {}
+
+		if values is not None:
+			for name, value in values.items():
+				self[name] = value
+
+	def Register(self, name: str, provider: Callable[[], Any]) -> None:
+		"""
+		Register a provider for a variable. A previously assigned or resolved value is discarded.
+
+		:param name:     Variable name.
+		:param provider: Callable without parameters returning the variable's value. It's called on first access.
+		"""
+		self._values.pop(name, None)
+		self._providers[name] = provider
+		self._order[name] = None
+
+	def IsResolved(self, name: str) -> bool:
+		"""
+		Check if a variable's value was assigned or already provided.
+
+		:param name:      Variable name.
+		:return:          ``True``, if the variable has a value.
+		:raises KeyError: If the variable doesn't exist.
+		"""
+		if name in self._values:
+			return True
+		elif name in self._providers:
+			return False
+
+		raise KeyError(name)
+
+	def Resolve(self, *names: str) -> None:
+		"""
+		Resolve the given variables or, if no names are given, all variables.
+
+		:param names:     Variable names.
+		:raises KeyError: If a variable doesn't exist.
+		"""
+		for name in names if len(names) > 0 else tuple(self._providers):
+			self[name]
+
+	def __getitem__(self, name: str) -> Any:
+		try:
+			return self._values[name]
+		except KeyError:
+			pass
+
+		provider = self._providers[name]
+		value = provider()
+		if self._providers.get(name) is provider:
+			del self._providers[name]
+			self._values[name] = value
+
+		return value
+
+	def __setitem__(self, name: str, value: Any) -> None:
+		self._providers.pop(name, None)
+		self._values[name] = value
+		self._order[name] = None
+
+	def __delitem__(self, name: str) -> None:
+		if self._values.pop(name, self) is self and self._providers.pop(name, None) is None:
+			raise KeyError(name)
+
+		del self._order[name]
+
+	def __contains__(self, name: object) -> bool:
+		return name in self._order
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(tuple(self._order))
+
+	def __len__(self) -> int:
+		return len(self._order)
+
+	def __repr__(self) -> str:
+		names = ", ".join(name if name in self._values else f"{name}=<unresolved>" for name in self._order)
+		return f"VariableNamespace({names})"
+
+	def get(self, name: str, default: Any = None) -> Any:
+		"""
+		Return a variable's value (resolving it if needed) or a default value.
+
+		:param name:    Variable name.
+		:param default: Default value, if the variable doesn't exist.
+		:return:        The variable's value or the default value.
+		"""
+		return self[name] if name in self._order else default
+
+	def keys(self) -> Tuple[str, ...]:
+		"""
+		Return all variable names without resolving values.
+
+		:return: Tuple of variable names.
+		"""
+		return tuple(self._order)
+
+	def values(self) -> Iterable[Any]:
+		"""
+		Return all values. Unresolved values are resolved.
+
+		:return: Generator of values.
+		"""
+		return (self[name] for name in self.keys())
+
+	def items(self) -> Iterable[Tuple[str, Any]]:
+		"""
+		Return all variable names and values. Unresolved values are resolved.
+
+		:return: Generator of pairs of name and value.
+		"""
+		return ((name, self[name]) for name in self.keys())
+
+
+MutableMapping.register(VariableNamespace)
@@ -0,0 +1,418 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A long-running server answering template requests over a Unix domain socket with warm versioning information."""
+from json         import dumps as json_dumps, loads as json_loads
+from pathlib      import Path
+from socket       import socket, SOCK_STREAM
+from threading    import Lock
+from typing       import Any, Callable, Dict, Iterable, List, Optional as Nullable, Tuple, Union
+
+try:
+	from socket import AF_UNIX
+except ImportError:  # pragma: no cover
+	AF_UNIX = None
+
+from pyTooling.Decorators       import export, readonly
+from pyTooling.MetaClasses      import ExtendedType
+
+from pyVersioning               import VersioningException, ToolException, Versioning
+from pyVersioning.Configuration import Configuration
+from pyVersioning.GitRepository import GitRepository, GitRepositoryException
+
+
+@export
+class ServerException(VersioningException):
+	"""
+	Exception thrown when a server can't be started or when it refuses to answer a request.
+
+	Clients should fall back to collect the information themselves.
+	"""
+
+
+def _Stamp(paths: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
+	stamp = []
+	for path in paths:
+		try:
+			status = path.stat()
+		except (FileNotFoundError, NotADirectoryError):
+			stamp.append((path.as_posix(), -1, -1))
+		else:
+			stamp.append((path.as_posix(), status.st_mtime_ns, status.st_size))
+
+	return tuple(stamp)
+
+
+@export
+class WarmVersioning(metaclass=ExtendedType, slots=True):
+	"""
+	A warm :class:`~pyVersioning.Versioning` instance shared by many requests.
+
+	The versioning information is recreated, if the configuration file or the Git repository's state (``HEAD``,
+	references, tags and remotes) changes. If the Git facade has no repository reader, the Git directory is located once
+	per refresh with ``git rev-parse``. A build time derived from the current time is refreshed on every access. All
+	methods are thread-safe.
+	"""
+
+	_initialize:  Callable[[], Tuple[Versioning, Configuration]]         #: Creates the versioning information.
+	_watchFiles:  List[Path]                                             #: Additional files invalidating the information.
+	_versioning:  Nullable[Versioning]                                   #: Warm versioning information.
+	_config:      Nullable[Configuration]                                #: Configuration of the versioning information.
+	_stamp:       Nullable[Tuple[Tuple[str, int, int], ...]]             #: State of the watched files at creation.
+	_stateReader: Union[None, bool, GitRepository]                       #: Reader for Git state files (``False``, if not found).
+	_refreshes:   int                                                    #: Number of times the information was created.
+	_lock:        Lock                                                   #: Serializes refreshing and resolving.
+
+	def __init__(
+		self,
+		initialize: Callable[[], Tuple[Versioning, Configuration]],
+		watchFiles: Nullable[List[Path]] = None
+	) -> None:
+		"""
+		Initialize a warm versioning instance.
+
+		:param initialize: Callable creating the versioning information with loaded configuration and registered data
+		                   providers. It's called for the first access and whenever the watched files changed.
+		:param watchFiles: Additional files (e.g. the configuration file), whose change invalidates the information.
+		"""
+		self._initialize = initialize
+		self._watchFiles = [] if watchFiles is None else watchFiles
+		self._versioning = None
+		self._config = None
+		self._stamp = None
+		self._stateReader = None
+		self._refreshes = 0
+		self._lock = Lock()
+
+	@readonly
+	def Refreshes(self) -> int:
+		"""
+		Read-only property to return how often the versioning information was created.
+
+		:return: Number of refreshes.
+		"""
+		return self._refreshes
+
+	def _WatchedFiles(self) -> List[Path]:
+		files = list(self._watchFiles)
+		repository = self._versioning.GitFacade.Repository
+		if repository is None:
+			repository = self._StateReader()
+
+		if repository is not None:
+			try:
+				files.extend(repository.GetStateFiles())
+			except GitRepositoryException:
+				files.extend((repository.GitDirectory / "HEAD", repository.CommonDirectory / "packed-refs", repository.CommonDirectory / "refs"))
+
+		return files
+
+	def _StateReader(self) -> Nullable[GitRepository]:
+		# Without a repository reader (e.g. an unsupported object format), the Git data would never be invalidated. Thus,
+		# ask Git for the Git directory, which is enough to read the state files.
+		if self._stateReader is None:
+			try:
+				gitDirectory = self._versioning.GitFacade.GetGitDirectory()
+			except ToolException:
+				self._stateReader = False
+			else:
+				self._stateReader = GitRepository(gitDirectory.parent, gitDirectory)
+
+		return self._stateReader if self._stateReader is not False else None
+
+	def _Refresh(self) -> Versioning:
+		if self._versioning is not None and self._stamp == _Stamp(self._WatchedFiles()):
+			if "build.date" in self._versioning.VolatileFields:
+				versioning = self._versioning
+				build = self._config.build
+				versioning.Variables.Register("build", lambda: versioning.GetBuild(build))
+
+			return self._versioning
+
+		if self._versioning is not None:
+			self._versioning.Close()
+			self._versioning = None
+		if isinstance(self._stateReader, GitRepository):
+			self._stateReader.Close()
+		self._stateReader = None
+
+		self._versioning, self._config = self._initialize()
+		self._stamp = _Stamp(self._WatchedFiles())
+		self._refreshes += 1
+		return self._versioning
+
+	def Refresh(self) -> Versioning:
+		"""
+		Return the versioning information. It's (re)created, if it doesn't exist yet or if a watched file changed.
+
+		:return: The versioning information.
+		"""
+		with self._lock:
+			return self._Refresh()
+
+	def Resolve(self, fields: Iterable[str]) -> Dict[str, Any]:
+		"""
+		Refresh the versioning information and resolve the variables referenced by the given field paths.
+
+		The returned variables are detached from the versioning information, thus templates can be rendered concurrently
+		(see :meth:`CompiledTemplate.Render <pyVersioning.Template.CompiledTemplate.Render>`).
+
+		:param fields: Referenced field paths like ``git.commit.hash``.
+		:return:       Resolved variables by name. Unknown variables are omitted.
+		"""
+		with self._lock:
+			variables = self._Refresh().Variables
+			names = {field.partition(".")[0] for field in fields}
+			return {name: variables[name] for name in names if name in variables}
+
+	def Close(self) -> None:
+		"""Close the versioning information, e.g. to write the Git information cache."""
+		with self._lock:
+			if self._versioning is not None:
+				self._versioning.Close()
+				self._versioning = None
+			if isinstance(self._stateReader, GitRepository):
+				self._stateReader.Close()
+			self._stateReader = None
+
+
+@export
+class VersioningServer(metaclass=ExtendedType, slots=True):
+	"""
+	A server keeping a :class:`WarmVersioning` instance behind a Unix domain socket.
+
+	Each connection carries one request and one response, both encoded as a single line of JSON. Requests are answered
+	one after another. A client, which doesn't send its request or receive the response within the connection timeout, or
+	which disconnects early, is dropped without affecting other clients.
+
+	Requests:
+
+	* ``{"command": "field", "field": "git.commit.hash", "settings": {...}}``
+	* ``{"command": "fillout", "template": "...", "settings": {...}}``
+	* ``{"command": "ping"}``
+	* ``{"command": "stop"}``
+
+	Responses are ``{"content": "..."}`` or ``{"error": "..."}``. Requests, whose settings differ from the server's
+	settings (see :meth:`Handle`), are refused.
+	"""
+
+	_socketPath:  Path                                                   #: Path of the Unix domain socket.
+	_warm:        WarmVersioning                                         #: Warm versioning information.
+	_settings:    Dict[str, Any]                                         #: Settings, which requests must match.
+	_requests:    int                                                    #: Number of answered requests.
+	_running:     bool                                                   #: ``False``, if a stop was requested.
+	_timeout:     float                                                  #: Timeout for reading a request and writing a response.
+
+	DEFAULT_SOCKET_PATH = Path(".pyVersioning.sock")                        #: Default path of the Unix domain socket.
+	DEFAULT_TIMEOUT =     10.0                                              #: Default connection timeout in seconds.
+	LOCAL_VARIABLES =     ("env", "appveyor", "github", "gitlab", "travis")  #: Variables describing the server's environment.
+
+	def __init__(
+		self,
+		socketPath: Path,
+		initialize: Callable[[], Tuple[Versioning, Configuration]],
+		settings: Nullable[Dict[str, Any]] = None,
+		watchFiles: Nullable[List[Path]] = None,
+		timeout: float = DEFAULT_TIMEOUT
+	) -> None:
+		"""
+		Initialize a server.
+
+		:param socketPath: Path of the Unix domain socket.
+		:param initialize: Callable creating the versioning information (see :class:`WarmVersioning`).
+		:param settings:   Settings like the configuration file, which requests must match.
+		:param watchFiles: Additional files (e.g. the configuration file), whose change invalidates the information.
+		:param timeout:    Timeout per connection for reading the request and writing the response in seconds.
+		"""
+		self._socketPath = socketPath
+		self._warm = WarmVersioning(initialize, watchFiles)
+		self._settings = {} if settings is None else settings
+		self._requests = 0
+		self._running = False
+		self._timeout = timeout
+
+	@readonly
+	def SocketPath(self) -> Path:
+		"""
+		Read-only property to return the path of the Unix domain socket.
+
+		:return: Socket path.
+		"""
+		return self._socketPath
+
+	@readonly
+	def Requests(self) -> int:
+		"""
+		Read-only property to return the number of answered requests.
+
+		:return: Number of requests.
+		"""
+		return self._requests
+
+	@readonly
+	def Refreshes(self) -> int:
+		"""
+		Read-only property to return how often the versioning information was created.
+
+		:return: Number of refreshes.
+		"""
+		return self._warm.Refreshes
+
+	def Handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+		"""
+		Answer a request.
+
+		Requests are refused, if their ``settings`` differ from the server's settings, or if the template references
+		variables describing the environment (e.g. ``env``), because the server's environment differs from the client's
+		environment.
+
+		:param request: Decoded request.
+		:return:        Response with either ``content`` or ``error``.
+		"""
+		command = request.get("command")
+		if command == "ping":
+			return {"content": ""}
+		elif command == "stop":
+			self._running = False
+			return {"content": ""}
+		elif command == "field":
+			template = f"{{{request.get('field')}}}"
+		elif command == "fillout":
+			template = request.get("template")
+		else:
+			return {"error": f"Unknown command '{command}'."}
+
+		if not isinstance(template, str):
+			return {"error": f"Request '{command}' has no template."}
+		elif request.get("settings") != self._settings:
+			return {"error": "Request settings differ from server settings."}
+
+		try:
+			compiled = self._warm.Refresh().TemplateCache.Compile(template)
+			if any(field.partition(".")[0] in self.LOCAL_VARIABLES for field in compiled.Fields):
+				return {"error": f"Template references variables of the environment ({', '.join(self.LOCAL_VARIABLES)})."}
+
+			return {"content": compiled.Render(self._warm.Resolve(compiled.Fields))}
+		except (Exception, SystemExit) as ex:
+			return {"error": f"{ex.__class__.__name__}: {ex}"}
+		finally:
+			self._requests += 1
+
+	def Serve(self) -> None:
+		"""
+		Listen on the Unix domain socket and answer requests until a ``stop`` request is received.
+
+		A stale socket file of a terminated server is replaced. The socket file is removed, when the server stops.
+
+		:raises ServerException: If Unix domain sockets aren't supported or another server is listening on the socket.
+		"""
+		if AF_UNIX is None:
+			raise ServerException("Unix domain sockets aren't supported on this platform.")
+
+		if self._socketPath.exists():
+			try:
+				VersioningClient(self._socketPath).Request({"command": "ping"})
+			except OSError:
+				self._socketPath.unlink()
+			else:
+				raise ServerException(f"Another server is listening on '{self._socketPath}'.")
+
+		with socket(AF_UNIX, SOCK_STREAM) as server:
+			server.bind(str(self._socketPath))
+			try:
+				server.listen()
+				self._running = True
+				while self._running:
+					connection, _ = server.accept()
+					connection.settimeout(self._timeout)
+					try:
+						with connection, connection.makefile("rwb") as stream:
+							try:
+								response = self.Handle(json_loads(stream.readline()))
+							except ValueError as ex:
+								response = {"error": f"Malformed request: {ex}"}
+
+							stream.write(json_dumps(response).encode("utf-8") + b"\n")
+					except OSError:
+						# The client timed out or disconnected (e.g. BrokenPipeError, ConnectionResetError); Handle doesn't raise.
+						pass
+			finally:
+				self._socketPath.unlink(missing_ok=True)
+				self._warm.Close()
+
+
+@export
+class VersioningClient(metaclass=ExtendedType, slots=True):
+	"""A client sending requests to a :class:`VersioningServer`."""
+
+	_socketPath: Path   #: Path of the server's Unix domain socket.
+	_timeout:    float  #: Timeout for connecting and receiving the response in seconds.
+
+	DEFAULT_TIMEOUT = 60.0  #: Default timeout in seconds.
+
+	def __init__(self, socketPath: Path, timeout: float = DEFAULT_TIMEOUT) -> None:
+		"""
+		Initialize a client.
+
+		:param socketPath: Path of the server's Unix domain socket.
+		:param timeout:    Timeout for connecting and receiving the response in seconds.
+		"""
+		self._socketPath = socketPath
+		self._timeout = timeout
+
+	def Request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+		"""
+		Send a request and return the server's response.
+
+		:param request:          Request to send.
+		:return:                 Decoded response.
+		:raises OSError:         If no server is listening on the socket (or Unix domain sockets aren't supported).
+		:raises ServerException: If the server refused the request.
+		"""
+		if AF_UNIX is None:
+			raise OSError("Unix domain sockets aren't supported on this platform.")
+
+		with socket(AF_UNIX, SOCK_STREAM) as connection:
+			connection.settimeout(self._timeout)
+			connection.connect(str(self._socketPath))
+			with connection.makefile("rwb") as stream:
+				stream.write(json_dumps(request).encode("utf-8") + b"\n")
+				stream.flush()
+				line = stream.readline()
+
+		try:
+			response = json_loads(line)
+		except ValueError as ex:
+			raise ServerException(f"Malformed response from server at '{self._socketPath}'.") from ex
+
+		if "error" in response:
+			raise ServerException(response["error"])
+
+		return response
@@ -0,0 +1,265 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Immutable snapshots of all variables for embedding pyVersioning in Python programs like build drivers."""
+from dataclasses  import fields as dataclass_fields, is_dataclass
+from pathlib      import Path
+from typing       import Any, Dict, Iterator, Mapping, Optional as Nullable, Tuple, Union
+
+from pyTooling.Decorators       import export
+from pyTooling.MetaClasses      import ExtendedType
+from pyTooling.Versioning       import SemanticVersion
+
+from pyVersioning               import SelfDescriptive, Versioning
+from pyVersioning.Configuration import Configuration
+from pyVersioning.Template      import TemplateCache
+
+
+@export
+class Record(SelfDescriptive):
+	"""
+	An immutable, hashable and picklable copy of a structured value like :class:`~pyVersioning.Project`.
+
+	Fields are accessed as attributes (``record.name``) or by index (``record["name"]``). The string representation of
+	the copied value is kept, thus templates render a record like the copied value.
+	"""
+
+	_text:   str                          #: String representation of the copied value.
+	_items:  Tuple[Tuple[str, Any], ...]  #: Field names and (frozen) values.
+	_fields: Dict[str, Any]               #: Field values by name.
+	_hash:   int                          #: Hash of the string representation and the fields.
+
+	def __init__(self, text: str, items: Tuple[Tuple[str, Any], ...]) -> None:
+		"""
+		Initialize a record.
+
+		:param text:  String representation of the copied value.
+		:param items: Field names and values. Values must be immutable and hashable (see :func:`Freeze`).
+		"""
+		self._text = text
+		self._items = items
+		self._fields = dict(items)
+		self._hash = hash((text, items))
+
+	def __getattr__(self, name: str) -> Any:
+		if name.startswith("__") or name in ("_text", "_items", "_fields", "_hash"):
+			raise AttributeError(name)
+
+		try:
+			return self._fields[name]
+		except KeyError:
+			raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+	def __getitem__(self, name: str) -> Any:
+		return self._fields[name]
+
+	def Keys(self) -> Iterator[str]:
+		for name, _ in self._items:
+			yield name
+
+	def KeyValuePairs(self) -> Iterator[Tuple[str, Any]]:
+		yield from self._items
+
+	def __eq__(self, other: Any) -> bool:
+		return isinstance(other, Record) and self._text == other._text and self._items == other._items
+
+	def __hash__(self) -> int:
+		return self._hash
+
+	def __reduce__(self) -> Tuple[type, Tuple[str, Tuple[Tuple[str, Any], ...]]]:
+		return Record, (self._text, self._items)
+
+	def __format__(self, formatSpec: str) -> str:
+		return format(self._text, formatSpec)
+
+	def __str__(self) -> str:
+		return self._text
+
+	def __repr__(self) -> str:
+		return f"Record({self._text!r})"
+
+
+@export
+def Freeze(value: Any) -> Any:
+	"""
+	Convert a value into an immutable, hashable and picklable value.
+
+	Values describing themselves (see :class:`~pyVersioning.SelfDescriptive`), data classes (e.g. the environment) and
+	mappings are converted to :class:`Record` instances, lists and tuples to tuples. Other values (e.g. strings, dates or
+	versions) are considered immutable and are kept.
+
+	:param value: Value to convert.
+	:return:      The converted value.
+	"""
+	if isinstance(value, Record):
+		return value
+	elif isinstance(value, SelfDescriptive):
+		return Record(str(value), tuple((key, Freeze(child)) for key, child in value.KeyValuePairs()))
+	elif is_dataclass(value) and not isinstance(value, type):
+		return Record(str(value), tuple((field.name, Freeze(getattr(value, field.name))) for field in dataclass_fields(value)))
+	elif isinstance(value, Mapping):
+		return Record(str(value), tuple((str(key), Freeze(child)) for key, child in value.items()))
+	elif isinstance(value, (list, tuple)):
+		return tuple(Freeze(child) for child in value)
+	else:
+		return value
+
+
+@export
+class Snapshot(metaclass=ExtendedType, slots=True):
+	"""
+	An immutable, hashable and picklable snapshot of all variables.
+
+	A snapshot is a read-only mapping of variable names to frozen values (see :func:`Freeze`). It doesn't depend on a
+	terminal, a Git process or the configuration file, thus it can be shared by threads, sent to worker processes and used
+	as a cache key. Derived snapshots (see :meth:`Derive`) share all unchanged variables.
+
+	.. code-block:: Python
+
+	   snapshot = Snapshot.Collect(Path(".pyVersioning.yml"))
+	   for variant in ("Debug", "Release"):
+	     content = snapshot.Derive(projectVariant=variant).Render(template)
+	"""
+
+	_variables: Dict[str, Any]  #: Frozen variables by name. It's never modified.
+	_hash:      int             #: Hash of all variables.
+
+	_templates = TemplateCache()  #: Compiled templates shared by all snapshots.
+
+	def __init__(self, variables: Mapping[str, Any]) -> None:
+		"""
+		Initialize a snapshot.
+
+		:param variables: Variables to freeze, e.g. :attr:`Versioning.Variables <pyVersioning.Versioning.Variables>`. All
+		                  variables are resolved.
+		"""
+		self._variables = {name: Freeze(value) for name, value in variables.items()}
+		self._hash = hash(tuple(self._variables.items()))
+
+	@classmethod
+	def Collect(
+		cls,
+		configFile: Nullable[Path] = None,
+		cacheFile: Nullable[Path] = None,
+		volatilePlaceholders: bool = False
+	) -> "Snapshot":
+		"""
+		Collect all variables without a terminal and return them as snapshot.
+
+		:param configFile:           Path to the configuration file. If ``None``, an empty configuration is used.
+		:param cacheFile:            Optional path to an on-disk cache of the collected Git information.
+		:param volatilePlaceholders: If ``True``, volatile fields are fixed placeholders.
+		:return:                     The snapshot.
+		:raises VersioningException: If information can't be collected.
+		"""
+		config = Configuration() if configFile is None else Configuration(configFile)
+		with Versioning(cacheFile=cacheFile, volatilePlaceholders=volatilePlaceholders) as versioning:
+			versioning.LoadDataFromConfiguration(config)
+			versioning.CollectData()
+			return versioning.CreateSnapshot()
+
+	def Derive(
+		self,
+		projectName: Nullable[str] = None,
+		projectVersion: Union[str, SemanticVersion, None] = None,
+		projectVariant: Nullable[str] = None,
+		compilerName: Nullable[str] = None,
+		compilerVersion: Union[str, SemanticVersion, None] = None,
+		compilerConfiguration: Nullable[str] = None,
+		compilerOptions: Nullable[str] = None,
+		**variables: Any
+	) -> "Snapshot":
+		"""
+		Create a snapshot with overridden project or compiler fields and with additional or replaced variables. This
+		snapshot isn't modified.
+
+		:param projectName:           New project name or ``None`` to keep it.
+		:param projectVersion:        New project version or ``None`` to keep it.
+		:param projectVariant:        New project variant or ``None`` to keep it.
+		:param compilerName:          New compiler name or ``None`` to keep it.
+		:param compilerVersion:       New compiler version or ``None`` to keep it.
+		:param compilerConfiguration: New compiler configuration or ``None`` to keep it.
+		:param compilerOptions:       New compiler options or ``None`` to keep it.
+		:param variables:             Additional or replaced variables.
+		:return:                      The derived snapshot.
+		"""
+		derived = dict(self._variables)
+		if projectName is not None or projectVersion is not None or projectVariant is not None:
+			derived["project"] = Versioning.DeriveProject(derived.get("project"), projectName, projectVersion, projectVariant)
+		if any(override is not None for override in (compilerName, compilerVersion, compilerConfiguration, compilerOptions)):
+			derived["build"] = Versioning.DeriveBuild(derived["build"], compilerName, compilerVersion, compilerConfiguration, compilerOptions)
+		derived.update(variables)
+
+		return Snapshot(derived)
+
+	def Render(self, template: str, **kwargs: Any) -> str:
+		"""
+		Fill out a template with the variables of this snapshot.
+
+		:param template:        Template.
+		:param kwargs:          Additional variables.
+		:return:                The rendered content.
+		:raises KeyError:       If a variable doesn't exist.
+		:raises AttributeError: If a field doesn't exist.
+		"""
+		return self._templates.Compile(template).Render(self, **kwargs)
+
+	def __getitem__(self, name: str) -> Any:
+		return self._variables[name]
+
+	def __contains__(self, name: object) -> bool:
+		return name in self._variables
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._variables)
+
+	def __len__(self) -> int:
+		return len(self._variables)
+
+	def get(self, name: str, default: Any = None) -> Any:
+		return self._variables.get(name, default)
+
+	def keys(self) -> Tuple[str, ...]:
+		return tuple(self._variables)
+
+	def items(self) -> Tuple[Tuple[str, Any], ...]:
+		return tuple(self._variables.items())
+
+	def __eq__(self, other: Any) -> bool:
+		return isinstance(other, Snapshot) and self._hash == other._hash and self._variables == other._variables
+
+	def __hash__(self) -> int:
+		return self._hash
+
+	def __reduce__(self) -> Tuple[type, Tuple[Dict[str, Any]]]:
+		return Snapshot, (self._variables, )
+
+	def __repr__(self) -> str:
+		return f"Snapshot({', '.join(self._variables)})"
@@ -0,0 +1,845 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A compiler for :meth:`str.format` templates, which parses a template once and renders it many times."""
+from hashlib      import sha256
+from json         import dumps as json_dumps, loads as json_loads
+from operator     import attrgetter
+from os           import O_CREAT, O_EXCL, O_WRONLY, fdopen, getpid, linesep, open as os_open, replace as os_replace
+from pathlib      import Path
+from secrets      import token_hex
+from shutil       import copyfile
+from string       import Formatter
+from sys          import maxsize
+from threading    import Lock, get_ident
+from typing       import Any, Callable, Dict, FrozenSet, Generator, Iterable, List, Mapping, Optional as Nullable, Set, Tuple, Union
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+
+def _ToKey(key: str) -> Union[int, str]:
+	if not key.isdecimal():
+		return key
+	elif (number := int(key)) > maxsize:
+		raise ValueError("Too many decimal digits in format string")
+
+	return number
+
+
+def _SplitFieldName(fieldName: str) -> Tuple[Union[int, str], Tuple[Tuple[bool, Union[int, str]], ...]]:
+	"""
+	Split a field name like ``git.commit[0].hash`` into the variable name and attribute (``True``) and index (``False``)
+	lookups with the same rules and error messages as :meth:`str.format`.
+	"""
+	length = len(fieldName)
+	index = 0
+	while index < length and fieldName[index] not in ".[":
+		index += 1
+	name = fieldName[:index]
+
+	path: List[Tuple[bool, Union[int, str]]] = []
+	while index < length:
+		if fieldName[index] == ".":
+			start = index = index + 1
+			while index < length and fieldName[index] not in ".[":
+				index += 1
+			if index == start:
+				raise ValueError("Empty attribute in format string")
+			path.append((True, fieldName[start:index]))
+		elif fieldName[index] == "[":
+			start = index + 1
+			index = fieldName.find("]", start)
+			if index == -1:
+				raise ValueError("Missing ']' in format string")
+			elif index == start:
+				raise ValueError("Empty attribute in format string")
+			path.append((False, _ToKey(fieldName[start:index])))
+			index += 1
+			if index < length and fieldName[index] not in ".[":
+				raise ValueError("Only '.' or '[' may follow ']' in format field specifier")
+
+	return _ToKey(name), tuple(path)
+
+
+def _GetPath(path: Tuple[Tuple[bool, Union[int, str]], ...]) -> Callable[[Any], Any]:
+	"""Create a function resolving attribute and index lookups like :meth:`str.format` does."""
+	if all(isAttribute for isAttribute, _ in path):
+		return attrgetter(".".join(key for _, key in path))
+
+	def getter(value: Any) -> Any:
+		for isAttribute, key in path:
+			value = getattr(value, key) if isAttribute else value[key]
+		return value
+
+	return getter
+
+
+@export
+class TemplateField(metaclass=ExtendedType, slots=True):
+	"""
+	A replacement field of a compiled template like ``{git.commit.hash!s:>40}``.
+
+	A field consists of a variable name, a path of attribute (``.name``) and index (``[key]``) lookups, an optional
+	conversion (``!s``, ``!r`` or ``!a``) and a format spec. Format specs containing replacement fields themselves are
+	compiled to a nested :class:`CompiledTemplate`.
+	"""
+
+	_name:       Union[int, str]                                 #: Variable name (or positional index).
+	_path:       Tuple[Tuple[bool, Union[int, str]], ...]        #: Attribute (``True``) and index (``False``) lookups.
+	_conversion: Nullable[str]                                   #: Conversion character.
+	_spec:       Union[str, "CompiledTemplate"]                  #: Format spec.
+	_getter:     Nullable[Callable[[Any], Any]]                  #: Function resolving the lookup path.
+
+	def __init__(
+		self,
+		name: Union[int, str],
+		path: Tuple[Tuple[bool, Union[int, str]], ...],
+		conversion: Nullable[str],
+		spec: Union[str, "CompiledTemplate"]
+	) -> None:
+		self._name = name
+		self._path = path
+		self._conversion = conversion
+		self._spec = spec
+		self._getter = _GetPath(path) if len(path) > 0 else None
+
+	@readonly
+	def Name(self) -> Union[int, str]:
+		"""
+		Read-only property to return the variable name (first part of the field name).
+
+		:return: Variable name. Positional fields (``{}`` or ``{0}``) return an integer.
+		"""
+		return self._name
+
+	@readonly
+	def Path(self) -> Tuple[Tuple[bool, Union[int, str]], ...]:
+		"""
+		Read-only property to return the lookup path after the variable name.
+
+		:return: Tuple of lookups. Each lookup is a pair of an attribute flag and the attribute name or index key.
+		"""
+		return self._path
+
+	@readonly
+	def Conversion(self) -> Nullable[str]:
+		"""
+		Read-only property to return the conversion character.
+
+		:return: ``s``, ``r``, ``a`` or ``None``.
+		"""
+		return self._conversion
+
+	@readonly
+	def Spec(self) -> Union[str, "CompiledTemplate"]:
+		"""
+		Read-only property to return the format spec.
+
+		:return: Format spec or a compiled template, if the format spec contains replacement fields.
+		"""
+		return self._spec
+
+	@readonly
+	def FieldPath(self) -> Nullable[str]:
+		"""
+		Read-only property to return the dotted path of variable name and attribute lookups like ``git.commit.hash``.
+
+		The path ends before the first index lookup, because the result of an index lookup can't be analyzed statically.
+
+		:return: Dotted path or ``None`` for positional fields.
+		"""
+		if self._name.__class__ is int:
+			return None
+
+		path = [self._name]
+		for isAttribute, key in self._path:
+			if not isAttribute:
+				break
+			path.append(key)
+
+		return ".".join(path)
+
+	def Render(self, variables: Mapping[str, Any], kwargs: Mapping[str, Any]) -> str:
+		"""
+		Resolve, convert and format the field's value.
+
+		:param variables:   Variables to resolve the field from.
+		:param kwargs:      Additional variables, which take precedence.
+		:return:            The formatted value.
+		:raises KeyError:   If the variable doesn't exist.
+		:raises IndexError: If the field is positional, as templates are rendered by keyword only.
+		"""
+		name = self._name
+		if name.__class__ is int:
+			raise IndexError(f"Replacement index {name} out of range for positional args tuple")
+
+		value = kwargs[name] if name in kwargs else variables[name]
+		if self._getter is not None:
+			value = self._getter(value)
+
+		conversion = self._conversion
+		if conversion is not None:
+			if conversion == "s":
+				value = str(value)
+			elif conversion == "r":
+				value = repr(value)
+			elif conversion == "a":
+				value = ascii(value)
+			else:
+				raise ValueError(f"Unknown conversion specifier {conversion}")
+
+		spec = self._spec
+		return format(value, spec if spec.__class__ is str else spec._Render(variables, kwargs))
+
+
+@export
+class CompiledTemplate(metaclass=ExtendedType, slots=True):
+	"""
+	A template parsed into a sequence of literal chunks and :class:`replacement fields <TemplateField>`.
+
+	Rendering a compiled template is equivalent to ``template.format(**variables, **kwargs)``, including the escaping of
+	``{{`` and ``}}``, but parses the template only once.
+	"""
+
+	_hash:  str                                   #: SHA-256 hash of the template's content.
+	_parts: Tuple[Union[str, TemplateField], ...]  #: Literal chunks and replacement fields.
+
+	def __init__(self, hash: str, parts: Tuple[Union[str, TemplateField], ...]) -> None:
+		self._hash = hash
+		self._parts = parts
+
+	@staticmethod
+	def Hash(template: str) -> str:
+		"""
+		Compute the content hash of a template.
+
+		:param template: Template content.
+		:return:         Hex digest of the template's content.
+		"""
+		return sha256(template.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+	@classmethod
+	def Compile(cls, template: str, depth: int = 2) -> "CompiledTemplate":
+		"""
+		Parse a template with the same parser as :meth:`str.format`.
+
+		:param template:    Template content.
+		:param depth:       Allowed nesting of replacement fields in format specs.
+		:return:            The compiled template.
+		:raises ValueError: If the template has a syntax error.
+		"""
+		if depth < 0:
+			raise ValueError("Max string recursion exceeded")
+
+		parts: List[Union[str, TemplateField]] = []
+		for literal, fieldName, spec, conversion in Formatter().parse(template):
+			if literal != "":
+				if len(parts) > 0 and parts[-1].__class__ is str:
+					parts[-1] += literal
+				else:
+					parts.append(literal)
+
+			if fieldName is not None:
+				name, path = _SplitFieldName(fieldName)
+				if name == "":
+					name = 0
+				if "{" in spec:
+					spec = cls.Compile(spec, depth - 1)
+				parts.append(TemplateField(name, path, conversion, spec))
+
+		return cls(cls.Hash(template), tuple(parts))
+
+	@readonly
+	def ContentHash(self) -> str:
+		"""
+		Read-only property to return the SHA-256 hash of the template's content.
+
+		:return: Hex digest.
+		"""
+		return self._hash
+
+	@readonly
+	def Parts(self) -> Tuple[Union[str, TemplateField], ...]:
+		"""
+		Read-only property to return the literal chunks and replacement fields.
+
+		:return: Tuple of literal strings and :class:`TemplateField` instances.
+		"""
+		return self._parts
+
+	@readonly
+	def Fields(self) -> FrozenSet[str]:
+		"""
+		Read-only property to return the dotted paths of all fields referenced by the template (see
+		:attr:`TemplateField.FieldPath`), including fields in nested format specs.
+
+		:return: Set of field paths like ``{"version", "git.commit.hash"}``.
+		"""
+		fields: Set[str] = set()
+		for part in self._parts:
+			if part.__class__ is str:
+				continue
+
+			path = part.FieldPath
+			if path is not None:
+				fields.add(path)
+			if part._spec.__class__ is not str:
+				fields |= part._spec.Fields
+
+		return frozenset(fields)
+
+	def Render(self, variables: Mapping[str, Any], **kwargs: Any) -> str:
+		"""
+		Fill out the template like ``template.format(**variables, **kwargs)``.
+
+		:param variables:       Variables referenced by the template.
+		:param kwargs:          Additional variables, which take precedence.
+		:return:                The rendered content.
+		:raises KeyError:       If a variable doesn't exist.
+		:raises AttributeError: If an attribute doesn't exist.
+		:raises TypeError:      If a keyword argument is also a variable.
+		"""
+		for name in kwargs:
+			if name in variables:
+				raise TypeError(f"str.format() got multiple values for keyword argument '{name}'")
+
+		return self._Render(variables, kwargs)
+
+	def RenderKey(self, variables: Mapping[str, Any], **kwargs: Any) -> str:
+		"""
+		Compute a key identifying the rendered content without rendering the whole template.
+
+		The key is a hash of the template's content hash and the formatted values of all replacement fields. Thus, it
+		depends only on the variable values referenced by the template (see :class:`RenderCache`).
+
+		:param variables:       Variables referenced by the template.
+		:param kwargs:          Additional variables, which take precedence.
+		:return:                Hex digest.
+		:raises KeyError:       If a variable doesn't exist.
+		:raises AttributeError: If an attribute doesn't exist.
+		"""
+		key = sha256(self._hash.encode("ascii"))
+		for part in self._parts:
+			if part.__class__ is not str:
+				value = part.Render(variables, kwargs).encode("utf-8", errors="surrogatepass")
+				key.update(len(value).to_bytes(8, "little"))
+				key.update(value)
+
+		return key.hexdigest()
+
+	def _Render(self, variables: Mapping[str, Any], kwargs: Mapping[str, Any]) -> str:
+		return "".join([part if part.__class__ is str else part.Render(variables, kwargs) for part in self._parts])
+
+	def ToData(self) -> List[Any]:
+		"""
+		Convert the compiled template to JSON compatible data.
+
+		:return: List of literal strings and dictionaries describing replacement fields.
+		"""
+		return [part if isinstance(part, str) else {
+			"name":       part._name,
+			"path":       [list(lookup) for lookup in part._path],
+			"conversion": part._conversion,
+			"spec":       part._spec if isinstance(part._spec, str) else part._spec.ToData()
+		} for part in self._parts]
+
+	@classmethod
+	def FromData(cls, hash: str, data: List[Any]) -> "CompiledTemplate":
+		"""
+		Create a compiled template from data created by :meth:`ToData`.
+
+		:param hash: SHA-256 hash of the template's content.
+		:param data: List of literal strings and dictionaries describing replacement fields.
+		:return:     The compiled template.
+		"""
+		return cls(hash, tuple(part if isinstance(part, str) else TemplateField(
+			part["name"],
+			tuple((isAttribute, key) for isAttribute, key in part["path"]),
+			part["conversion"],
+			part["spec"] if isinstance(part["spec"], str) else cls.FromData(hash, part["spec"])
+		) for part in data))
+
+
+SECTION_MARKER = "pyVersioning:section"  #: Text marking the first line of a template section (e.g. in a comment).
+
+
+@export
+def SplitSections(template: str, marker: str = SECTION_MARKER) -> List[str]:
+	"""
+	Split a template into sections. Each line containing the marker starts a new section.
+
+	The marker is usually placed in a comment like ``/* pyVersioning:section */``, thus a template with sections can still
+	be filled out as a whole.
+
+	:param template: Template to split.
+	:param marker:   Text marking the first line of a section.
+	:return:         List of sections. The first section is the text before the first marker (can be empty).
+	"""
+	sections = [[]]
+	for line in template.splitlines(keepends=True):
+		if marker in line:
+			sections.append([])
+		sections[-1].append(line)
+
+	return ["".join(section) for section in sections]
+
+
+@export
+class TemplateStream(metaclass=ExtendedType, slots=True):
+	"""
+	A template file, which is read, compiled and rendered in chunks, thus memory usage doesn't depend on the file size.
+
+	Chunks are cut only between literal text and replacement fields, so replacement fields and escaped braces spanning a
+	read boundary are handled like :meth:`str.format` does for the whole file. If no valid cut is found in a chunk (e.g. a
+	very long replacement field), the next chunk is appended before cutting again.
+	"""
+
+	_path:      Path  #: Path to the template file.
+	_chunkSize: int   #: Number of characters read at once.
+
+	DEFAULT_CHUNK_SIZE = 1024 * 1024  #: Default number of characters read at once.
+
+	def __init__(self, path: Path, chunkSize: int = DEFAULT_CHUNK_SIZE) -> None:
+		"""
+		Initialize a template stream.
+
+		:param path:      Path to the template file (UTF-8 encoded).
+		:param chunkSize: Number of characters read at once.
+		"""
+		self._path = path
+		self._chunkSize = chunkSize
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to return the path to the template file.
+
+		:return: Path to the template file.
+		"""
+		return self._path
+
+	def Chunks(self) -> Generator[CompiledTemplate, None, None]:
+		"""
+		Read the template file and compile it chunk by chunk.
+
+		:return:            Generator of compiled chunks.
+		:raises ValueError: If the template has a syntax error.
+		"""
+		with self._path.open("r", encoding="utf-8") as source:
+			buffer = ""
+			while (data := source.read(self._chunkSize)) != "":
+				buffer += data
+				compiled, buffer = self._Cut(buffer)
+				if compiled is not None:
+					yield compiled
+
+		if buffer != "":
+			yield CompiledTemplate.Compile(buffer)
+
+	@staticmethod
+	def _Cut(buffer: str) -> Tuple[Nullable[CompiledTemplate], str]:
+		"""
+		Compile the longest prefix of the buffer ending in front of the last replacement field or escape sequence.
+
+		A prefix, which compiles without error, ends at the same boundary, as if the whole file was parsed, because the
+		parser of :meth:`str.format` scans from left to right without looking behind a closing brace.
+
+		:param buffer: Text read from the template file, but not rendered yet.
+		:return:       A tuple of the compiled prefix (or ``None``) and the remaining text.
+		"""
+		lastOpen = buffer.rfind("{")
+		candidates = {len(buffer), lastOpen, buffer.rfind("}"), buffer.rfind("{", 0, lastOpen) if lastOpen > 0 else -1}
+		for cut in sorted(candidates, reverse=True):
+			if cut <= 0:
+				break
+
+			try:
+				return CompiledTemplate.Compile(buffer[:cut]), buffer[cut:]
+			except ValueError:
+				continue
+
+		return None, buffer
+
+	def Fields(self) -> FrozenSet[str]:
+		"""
+		Read the template file and return the dotted paths of all referenced fields (see :attr:`CompiledTemplate.Fields`).
+
+		:return:            Set of field paths.
+		:raises ValueError: If the template has a syntax error.
+		"""
+		fields: Set[str] = set()
+		for chunk in self.Chunks():
+			fields |= chunk.Fields
+
+		return frozenset(fields)
+
+	def Render(self, write: Callable[[str], Any], variables: Mapping[str, Any], **kwargs: Any) -> None:
+		"""
+		Fill out the template chunk by chunk like ``template.format(**variables, **kwargs)``.
+
+		:param write:           Callable receiving each rendered chunk, e.g. the ``write`` method of an output file.
+		:param variables:       Variables referenced by the template.
+		:param kwargs:          Additional variables, which take precedence.
+		:raises KeyError:       If a variable doesn't exist.
+		:raises AttributeError: If an attribute doesn't exist.
+		:raises ValueError:     If the template has a syntax error.
+		"""
+		for chunk in self.Chunks():
+			write(chunk.Render(variables, **kwargs))
+
+
+@export
+class FieldReferences(metaclass=ExtendedType, slots=True):
+	"""
+	A set of referenced field paths like ``git.commit.hash`` used to decide, which information needs to be collected.
+
+	A path is contained, if it's referenced, if it's a prefix of a referenced path (``git`` is needed to resolve
+	``git.commit.hash``) or if a prefix of it is referenced (``{git.commit!s}`` needs all fields of the commit).
+	"""
+
+	_paths:    Nullable[FrozenSet[str]]  #: Referenced paths or ``None`` for all paths.
+	_prefixes: FrozenSet[str]            #: Referenced paths and all their prefixes.
+
+	def __init__(self, paths: Nullable[Iterable[str]] = None) -> None:
+		"""
+		Initialize a set of referenced field paths.
+
+		:param paths: Referenced field paths, e.g. from :attr:`CompiledTemplate.Fields`. If ``None``, all paths are
+		              referenced.
+		"""
+		if paths is None:
+			self._paths = None
+			self._prefixes = frozenset()
+			return
+
+		self._paths = frozenset(paths)
+		prefixes = set()
+		for path in self._paths:
+			parts = path.split(".")
+			prefixes.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+		self._prefixes = frozenset(prefixes)
+
+	@readonly
+	def IsAll(self) -> bool:
+		"""
+		Read-only property to return whether all paths are referenced.
+
+		:return: ``True``, if all paths are referenced.
+		"""
+		return self._paths is None
+
+	@readonly
+	def Paths(self) -> Nullable[FrozenSet[str]]:
+		"""
+		Read-only property to return the referenced paths.
+
+		:return: Set of referenced paths or ``None``, if all paths are referenced.
+		"""
+		return self._paths
+
+	def __contains__(self, path: str) -> bool:
+		if self._paths is None or path in self._prefixes:
+			return True
+
+		while (index := path.rfind(".")) >= 0:
+			path = path[:index]
+			if path in self._paths:
+				return True
+
+		return False
+
+	def __repr__(self) -> str:
+		return "FieldReferences(all)" if self._paths is None else f"FieldReferences({sorted(self._paths)})"
+
+
+@export
+class TemplateCache(metaclass=ExtendedType, slots=True):
+	"""
+	A cache of compiled templates in memory and optionally on disk, keyed by the template's content hash.
+
+	On disk, each compiled template is stored as a JSON file named by its content hash. Files are replaced atomically.
+	Unreadable or outdated files are ignored and overwritten.
+
+	The cache can be used by several threads (e.g. ``batch --jobs``). Lookups, compilations and writes are serialized, thus
+	each template is compiled and written at most once.
+	"""
+
+	_directory: Nullable[Path]               #: Directory for compiled templates on disk.
+	_memory:    Dict[str, CompiledTemplate]  #: Compiled templates in memory.
+	_hits:      int                          #: Number of templates found in memory or on disk.
+	_misses:    int                          #: Number of compiled templates.
+	_lock:      Lock                         #: Serializes accessing the memory, the directory and the counters.
+
+	FORMAT = 1  #: Version of the on-disk format.
+
+	def __init__(self, directory: Nullable[Path] = None) -> None:
+		"""
+		Initialize a template cache.
+
+		:param directory: Directory for compiled templates on disk. If ``None``, templates are cached in memory only.
+		"""
+		self._directory = directory
+		self._memory = {}
+		self._hits = 0
+		self._misses = 0
+		self._lock = Lock()
+
+	@readonly
+	def Directory(self) -> Nullable[Path]:
+		"""
+		Read-only property to return the directory for compiled templates on disk.
+
+		:return: Directory or ``None``, if templates are cached in memory only.
+		"""
+		return self._directory
+
+	@readonly
+	def Hits(self) -> int:
+		"""
+		Read-only property to return the number of templates found in memory or on disk.
+
+		:return: Number of cache hits.
+		"""
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		"""
+		Read-only property to return the number of compiled templates.
+
+		:return: Number of cache misses.
+		"""
+		return self._misses
+
+	def Compile(self, template: str) -> CompiledTemplate:
+		"""
+		Return the compiled template from memory or disk, or compile and cache it.
+
+		:param template:    Template content.
+		:return:            The compiled template.
+		:raises ValueError: If the template has a syntax error.
+		"""
+		hash = CompiledTemplate.Hash(template)
+		with self._lock:
+			try:
+				compiled = self._memory[hash]
+			except KeyError:
+				pass
+			else:
+				self._hits += 1
+				return compiled
+
+			compiled = self._Load(hash)
+			if compiled is not None:
+				self._hits += 1
+			else:
+				self._misses += 1
+				compiled = CompiledTemplate.Compile(template)
+				self._Store(compiled)
+
+			self._memory[hash] = compiled
+			return compiled
+
+	def _Load(self, hash: str) -> Nullable[CompiledTemplate]:
+		if self._directory is None:
+			return None
+
+		try:
+			content = json_loads((self._directory / f"{hash}.json").read_text(encoding="utf-8"))
+			if content["format"] != self.FORMAT or content["hash"] != hash:
+				return None
+
+			return CompiledTemplate.FromData(hash, content["parts"])
+		except (OSError, ValueError, KeyError, TypeError):
+			return None
+
+	def _Store(self, compiled: CompiledTemplate) -> None:
+		if self._directory is None:
+			return
+
+		path = self._directory / f"{compiled.ContentHash}.json"
+		temporaryPath = path.with_name(f"{path.name}.{getpid()}.{get_ident()}.tmp")
+		try:
+			self._directory.mkdir(parents=True, exist_ok=True)
+			temporaryPath.write_text(
+				json_dumps({"format": self.FORMAT, "hash": compiled.ContentHash, "parts": compiled.ToData()}),
+				encoding="utf-8"
+			)
+			os_replace(temporaryPath, path)
+		except OSError:
+			temporaryPath.unlink(missing_ok=True)
+
+
+@export
+class RenderCache(metaclass=ExtendedType, slots=True):
+	"""
+	A content-addressed cache of rendered templates on disk, which can be shared e.g. by all jobs of a CI pipeline.
+
+	Entries are keyed by :meth:`CompiledTemplate.RenderKey`. Each entry refers to an object file named by the SHA-256 hash
+	of its content, thus identical outputs are stored once. Files are replaced atomically. Unreadable entries and entries
+	with a missing object are ignored and overwritten.
+
+	The cache can be used by several threads (e.g. ``batch --jobs``) and processes. Each write uses a unique temporary
+	file, and objects and entries are published by an atomic rename.
+	"""
+
+	_directory: Path  #: Cache directory.
+	_hits:      int   #: Number of outputs found in the cache.
+	_misses:    int   #: Number of outputs stored in the cache.
+	_lock:      Lock  #: Serializes publishing objects and entries and updating the counters.
+
+	FORMAT = 1  #: Version of the on-disk format.
+
+	def __init__(self, directory: Path) -> None:
+		"""
+		Initialize a render cache.
+
+		:param directory: Cache directory.
+		"""
+		self._directory = directory
+		self._hits = 0
+		self._misses = 0
+		self._lock = Lock()
+
+	@readonly
+	def Directory(self) -> Path:
+		"""
+		Read-only property to return the cache directory.
+
+		:return: Cache directory.
+		"""
+		return self._directory
+
+	@readonly
+	def Hits(self) -> int:
+		"""
+		Read-only property to return the number of outputs found in the cache.
+
+		:return: Number of cache hits.
+		"""
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		"""
+		Read-only property to return the number of outputs stored in the cache.
+
+		:return: Number of cache misses.
+		"""
+		return self._misses
+
+	def Load(self, key: str) -> Nullable[Tuple[Path, str]]:
+		"""
+		Look up a rendered output.
+
+		:param key: Render key (see :meth:`CompiledTemplate.RenderKey`).
+		:return:    Tuple of the object file and its content hash, or ``None`` if the key isn't cached.
+		"""
+		try:
+			content = json_loads((self._directory / f"{key}.json").read_text(encoding="utf-8"))
+			if content["format"] != self.FORMAT or content["key"] != key:
+				raise ValueError()
+
+			contentHash = content["content"]
+			objectFile = self._directory / "objects" / contentHash
+			if not objectFile.is_file():
+				raise ValueError()
+		except (OSError, ValueError, KeyError, TypeError):
+			with self._lock:
+				self._misses += 1
+			return None
+
+		with self._lock:
+			self._hits += 1
+		return objectFile, contentHash
+
+	def Store(self, key: str, content: str) -> Tuple[Path, str]:
+		"""
+		Store a rendered output.
+
+		The object file is written like an output file (text mode, UTF-8), thus its content hash matches the output file.
+
+		:param key:      Render key (see :meth:`CompiledTemplate.RenderKey`).
+		:param content:  Rendered content.
+		:return:         Tuple of the object file and its content hash.
+		:raises OSError: If the cache directory isn't writable.
+		"""
+		objectsDirectory = self._directory / "objects"
+		objectsDirectory.mkdir(parents=True, exist_ok=True)
+
+		# Encode like a file written in text mode, so the hash matches output files written by write_text().
+		data = (content if linesep == "\n" else content.replace("\n", linesep)).encode("utf-8")
+		contentHash = sha256(data).hexdigest()
+		objectFile = objectsDirectory / contentHash
+		entry = self._directory / f"{key}.json"
+		entryData = json_dumps({"format": self.FORMAT, "key": key, "content": contentHash}).encode("utf-8")
+
+		temporaryFiles = []
+		try:
+			for directory, fileData in ((objectsDirectory, data), (self._directory, entryData)):
+				# A random name is unique across threads and processes (also on other hosts sharing the cache). Like output
+				# files, the file is created with the process' umask applied.
+				temporaryPath = directory / f".{token_hex(16)}.tmp"
+				handle = os_open(temporaryPath, O_WRONLY | O_CREAT | O_EXCL, 0o666)
+				temporaryFiles.append(temporaryPath)
+				with fdopen(handle, "wb") as file:
+					file.write(fileData)
+
+			with self._lock:
+				os_replace(temporaryFiles[0], objectFile)
+				os_replace(temporaryFiles[1], entry)
+		except OSError:
+			for temporaryPath in temporaryFiles:
+				temporaryPath.unlink(missing_ok=True)
+			raise
+
+		return objectFile, contentHash
+
+	@staticmethod
+	def Place(objectFile: Path, outputFile: Path) -> None:
+		"""
+		Place a cached object file as output file. The output file is replaced atomically.
+
+		The object file is copied, not hard linked: the output file gets a new modification time (thus build tools rebuild
+		its dependents, even if an older content is placed again) and tools editing the output file in place can't alter
+		the cached object.
+
+		:param objectFile: Object file in the cache.
+		:param outputFile: Output file.
+		"""
+		temporaryPath = outputFile.with_name(f".{outputFile.name}.{getpid()}.{get_ident()}.tmp")
+		temporaryPath.unlink(missing_ok=True)
+		try:
+			copyfile(objectFile, temporaryPath)
+			os_replace(temporaryPath, outputFile)
+		except BaseException:
+			temporaryPath.unlink(missing_ok=True)
+			raise
@@ -0,0 +1,148 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""A Bazel persistent worker answering work requests of the JSON worker protocol."""
+from concurrent.futures import Future, ThreadPoolExecutor
+from json               import dumps as json_dumps, loads as json_loads
+from threading          import Lock
+from typing             import Any, Callable, Dict, List, Optional as Nullable, TextIO, Tuple
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+
+@export
+class PersistentWorker(metaclass=ExtendedType, slots=True):
+	"""
+	A `Bazel persistent worker <https://bazel.build/remote/persistent>`__ using the JSON worker protocol.
+
+	Bazel starts the worker once with ``--persistent_worker`` and writes work requests as newline-delimited JSON to the
+	worker's STDIN, e.g. ``{"arguments": ["fillout", "version.h.template", "version.h"], "requestId": 1}``. Each request
+	is answered by a work response on STDOUT, e.g. ``{"exitCode": 0, "output": "", "requestId": 1}``.
+
+	Requests without a ``requestId`` (singleplex workers) are executed one after another. Requests with a ``requestId``
+	(multiplex workers) are executed concurrently by a pool of threads and answered in the order of completion. A request
+	with ``"cancel": true`` cancels the pending request with the same ``requestId``, if it hasn't started yet.
+	"""
+
+	_handler:    Callable[[List[str]], Tuple[int, str]]  #: Executes the arguments of a work request.
+	_jobs:       Nullable[int]                           #: Maximum number of concurrently executed requests.
+	_pending:    Dict[int, Future]                       #: Pending multiplex requests by request ID.
+	_lock:       Lock                                    #: Serializes writing responses and accessing pending requests.
+	_requests:   int                                     #: Number of answered requests.
+
+	def __init__(self, handler: Callable[[List[str]], Tuple[int, str]], jobs: Nullable[int] = None) -> None:
+		"""
+		Initialize a persistent worker.
+
+		:param handler: Callable executing the arguments of a work request. It returns the exit code and the output (e.g.
+		                error messages). It's called concurrently for multiplex requests.
+		:param jobs:    Maximum number of concurrently executed multiplex requests. If ``None``, the default of
+		                :class:`~concurrent.futures.ThreadPoolExecutor` is used.
+		"""
+		self._handler = handler
+		self._jobs = jobs
+		self._pending = {}
+		self._lock = Lock()
+		self._requests = 0
+
+	@readonly
+	def Requests(self) -> int:
+		"""
+		Read-only property to return the number of answered requests.
+
+		:return: Number of requests.
+		"""
+		return self._requests
+
+	def Execute(self, arguments: List[str]) -> Tuple[int, str]:
+		"""
+		Execute the arguments of a work request. Exceptions are reported as exit code 1.
+
+		:param arguments: Arguments of the work request.
+		:return:          Exit code and output.
+		"""
+		try:
+			return self._handler(arguments)
+		except SystemExit as ex:
+			return ex.code if isinstance(ex.code, int) else 1, "" if ex.code is None or isinstance(ex.code, int) else str(ex.code)
+		except Exception as ex:
+			return 1, f"{ex.__class__.__name__}: {ex}"
+
+	def _Respond(self, output: TextIO, response: Dict[str, Any]) -> None:
+		with self._lock:
+			output.write(json_dumps(response) + "\n")
+			output.flush()
+			self._requests += 1
+
+	def _Completed(self, output: TextIO, requestID: int, future: Future) -> None:
+		with self._lock:
+			self._pending.pop(requestID, None)
+
+		if future.cancelled():
+			self._Respond(output, {"requestId": requestID, "wasCancelled": True})
+		else:
+			exitCode, message = future.result()
+			self._Respond(output, {"exitCode": exitCode, "output": message, "requestId": requestID})
+
+	def Run(self, input: TextIO, output: TextIO) -> None:
+		"""
+		Read work requests from the input stream and write work responses to the output stream until the input stream is
+		closed.
+
+		:param input:  Stream of work requests (STDIN).
+		:param output: Stream of work responses (STDOUT). Nothing else must be written to this stream.
+		"""
+		with ThreadPoolExecutor(max_workers=self._jobs) as pool:
+			for line in input:
+				if line.strip() == "":
+					continue
+
+				try:
+					request = json_loads(line)
+					arguments = [str(argument) for argument in request.get("arguments", [])]
+					requestID = int(request.get("requestId", 0))
+				except (ValueError, TypeError, AttributeError) as ex:
+					self._Respond(output, {"exitCode": 2, "output": f"Malformed work request: {ex}"})
+					continue
+
+				if request.get("cancel", False):
+					with self._lock:
+						future = self._pending.get(requestID)
+					if future is not None:
+						future.cancel()
+				elif requestID == 0:
+					exitCode, message = self.Execute(arguments)
+					self._Respond(output, {"exitCode": exitCode, "output": message})
+				else:
+					with self._lock:
+						future = pool.submit(self.Execute, arguments)
+						self._pending[requestID] = future
+					future.add_done_callback(lambda future, requestID=requestID: self._Completed(output, requestID, future))
@@ -35,19 +35,22 @@ __license__ =   "Apache License, Version 2.0"
 __version__ =   "0.18.4"
 __keywords__ =  ["Python3", "Template", "Versioning", "Git"]
 
-from dataclasses  import make_dataclass
-from datetime     import date, time, datetime
+from asyncio      import gather, to_thread
+from collections  import ChainMap
+from dataclasses  import fields as dataclass_fields, is_dataclass, make_dataclass
+from datetime     import date, time, datetime, timezone
 from enum         import Enum, auto
 from os           import environ
-from subprocess   import run as subprocess_run, PIPE, CalledProcessError
-from typing       import Union, Any, Dict, Tuple, ClassVar, Generator, Optional as Nullable, List
+from pathlib      import Path
+from subprocess   import run as subprocess_run, PIPE, CalledProcessError, CompletedProcess
+from typing       import Union, Any, Callable, Dict, FrozenSet, Tuple, ClassVar, Generator, Iterable, Mapping, Optional as Nullable, List
 
 from pyTooling.Decorators       import export, readonly
 from pyTooling.MetaClasses      import ExtendedType
 from pyTooling.Versioning       import SemanticVersion
 from pyTooling.TerminalUI       import ILineTerminal
 
-from pyVersioning.Configuration import Configuration, Project, Compiler, Build
+from pyVersioning.Configuration import Configuration, Project, Compiler, Build, Matrix
 
 
 @export
@@ -307,24 +310,102 @@ class Commit(SelfDescriptive):
 		return f"{self._date} {self._time} - {self._committer} - {self._hash} - {self._oneline}"
 
 
+@export
+class Description(SelfDescriptive):
+	"""
+	This data structure class describes a commit relative to the nearest tag (like ``git describe --tags``) and the
+	number of commits in its history (like ``git rev-list --count``).
+	"""
+
+	_tag:      str  #: Nearest tag reachable from the commit.
+	_distance: int  #: Number of commits since the nearest tag.
+	_count:    int  #: Number of commits reachable from the commit.
+	_hash:     str  #: Hash of the described commit.
+
+	_public: ClassVar[Tuple[str, ...]] = ("tag", "distance", "count")
+
+	def __init__(self, hash: str, tag: str = "", distance: int = 0, count: int = 0) -> None:
+		"""
+		Initialize a commit description.
+
+		:param hash:     The described commit's hash.
+		:param tag:      The nearest tag.
+		:param distance: The number of commits since the nearest tag.
+		:param count:    The number of commits reachable from the described commit.
+		"""
+		self._hash = hash
+		self._tag = tag
+		self._distance = distance
+		self._count = count
+
+	@readonly
+	def tag(self) -> str:
+		"""
+		Read-only property to return the nearest tag.
+
+		:return: Name of the nearest tag or an empty string, if no tag is reachable.
+		"""
+		return self._tag
+
+	@readonly
+	def distance(self) -> int:
+		"""
+		Read-only property to return the number of commits since the nearest tag.
+
+		:return: Number of commits.
+		"""
+		return self._distance
+
+	@readonly
+	def count(self) -> int:
+		"""
+		Read-only property to return the number of commits reachable from the described commit.
+
+		:return: Number of commits.
+		"""
+		return self._count
+
+	def __str__(self) -> str:
+		"""
+		Return a string representation like ``git describe --tags``.
+
+		:returns: The tag, if the commit is tagged, otherwise tag, distance and abbreviated hash.
+		"""
+		if self._tag == "":
+			return self._hash[:7]
+		elif self._distance == 0:
+			return self._tag
+		else:
+			return f"{self._tag}-{self._distance}-g{self._hash[:7]}"
+
+
 @export
 class Git(SelfDescriptive):
 	"""
 	This data structure class describes all collected data from Git.
 	"""
-	_commit:     Commit  #: Git commit information
-	_reference:  str     #: Git reference (branch or tag)
-	_tag:        str     #: Git tag
-	_branch:     str     #: Git branch
-	_repository: str     #: Git repository URL
+	_commit:     Commit       #: Git commit information
+	_reference:  str          #: Git reference (branch or tag)
+	_tag:        str          #: Git tag
+	_branch:     str          #: Git branch
+	_repository: str          #: Git repository URL
+	_describe:   Description  #: Nearest tag and commit counts
 
-	_public: ClassVar[Tuple[str, ...]] = ("commit", "reference", "tag", "branch", "repository")
+	_public: ClassVar[Tuple[str, ...]] = ("commit", "reference", "tag", "branch", "repository", "describe")
 
-	def __init__(self, commit: Commit, repository: str, tag: str = "", branch: str = "") -> None:
+	def __init__(
+		self,
+		commit: Commit,
+		repository: str,
+		tag: str = "",
+		branch: str = "",
+		describe: Nullable[Description] = None
+	) -> None:
 		self._commit = commit
 		self._tag = tag
 		self._branch = branch
 		self._repository = repository
+		self._describe = describe if describe is not None else Description(commit._hash, tag)
 
 		if tag != "":
 			self._reference = tag
@@ -380,6 +461,15 @@ class Git(SelfDescriptive):
 		"""
 		return self._repository
 
+	@readonly
+	def describe(self) -> Description:
+		"""
+		Read-only property to return the nearest tag, the number of commits since that tag and the total commit count.
+
+		:return: The commit description as :class:`Description`.
+		"""
+		return self._describe
+
 	def __str__(self) -> str:
 		"""
 		Return a string representation of a repository.
@@ -573,6 +663,14 @@ class Platforms(Enum):
 	Travis =      auto()    #: A CI service operated by `Travis <https://www.travis-ci.com/>`__.
 
 
+@export
+class Volatility(Enum):
+	"""An enumeration of how often a variable's value changes. Members are ordered from stable to volatile."""
+	Stable = auto()    #: Changes only with the configuration (e.g. project, version or compiler).
+	Commit = auto()    #: Changes with the checked out commit (e.g. commit hash or branch).
+	Build =  auto()    #: Changes on every run for the same commit (e.g. build time or environment).
+
+
 @export
 class Platform(SelfDescriptive):
 	""".. todo:: Platform needs documentation"""
@@ -588,6 +686,45 @@ class Platform(SelfDescriptive):
 		return self._ciService
 
 
+@export
+class VolatilePlaceholder(metaclass=ExtendedType, slots=True):
+	"""
+	A fixed placeholder for volatile variables like the environment, which would change the output on every run.
+
+	Any attribute, index or call returns the placeholder itself. It renders as an empty string and is empty, if iterated.
+	"""
+
+	def __getattr__(self, name: str) -> "VolatilePlaceholder":
+		if name.startswith("__"):
+			raise AttributeError(name)
+
+		return self
+
+	def __getitem__(self, key: Any) -> "VolatilePlaceholder":
+		return self
+
+	def __call__(self, *args: Any, **kwargs: Any) -> "VolatilePlaceholder":
+		return self
+
+	def __iter__(self) -> Generator[Any, None, None]:
+		yield from ()
+
+	def __format__(self, formatSpec: str) -> str:
+		return ""
+
+	def __str__(self) -> str:
+		return ""
+
+	def __eq__(self, other: Any) -> bool:
+		return isinstance(other, VolatilePlaceholder)
+
+	def __hash__(self) -> int:
+		return hash(VolatilePlaceholder)
+
+	def __reduce__(self) -> Tuple[type, Tuple]:
+		return VolatilePlaceholder, ()
+
+
 @export
 class BaseService(metaclass=ExtendedType):
 	"""Base-class to collect platform and environment information from e.g. environment variables."""
@@ -624,15 +761,25 @@ class GitHelperMixin(metaclass=ExtendedType, mixin=True):
 		GitShowCommand.CommitComment:        "%B",
 	}
 
+	def _ExecuteGit(self, arguments: Tuple[str, ...]) -> CompletedProcess:
+		"""
+		Run ``git`` with the given arguments and capture its output.
+
+		:param arguments:      Arguments passed to ``git``.
+		:return:               The completed process.
+		:raises ToolException: If ``git`` can't be started.
+		"""
+		try:
+			return subprocess_run(("git", *arguments), stdout=PIPE, stderr=PIPE)
+		except (CalledProcessError, OSError) as ex:
+			raise ToolException(f"git {' '.join(arguments)}", str(ex))
+
 	def ExecuteGitShow(self, cmd: GitShowCommand, ref: str = "HEAD") -> str:
 		format = f"--format='{self.__GIT_SHOW_COMMAND_TO_FORMAT_LOOKUP[cmd]}'"
 
 		command = "git"
 		arguments = ("show", "-s", format, ref)
-		try:
-			completed = subprocess_run((command, *arguments), stdout=PIPE, stderr=PIPE)
-		except CalledProcessError as ex:
-			raise ToolException(f"{command} {' '.join(arguments)}", str(ex))
+		completed = self._ExecuteGit(arguments)
 
 		if completed.returncode == 0:
 			comment = completed.stdout.decode("utf-8")
@@ -641,19 +788,162 @@ class GitHelperMixin(metaclass=ExtendedType, mixin=True):
 			message = completed.stderr.decode("utf-8")
 			raise ToolException(f"{command} {' '.join(arguments)}", message)
 
+	def ExecuteGitShowBatch(
+		self,
+		commands: Iterable[GitShowCommand] = tuple(GitShowCommand),
+		ref: str = "HEAD"
+	) -> Dict[GitShowCommand, str]:
+		"""
+		Query multiple commit fields with a single ``git show`` invocation.
+
+		Fields are separated by NUL characters and the record is terminated by an ASCII record separator, thus multi-line
+		fields like the commit comment (``%B``) are parsed safely.
+
+		:param commands:       Commit fields to query.
+		:param ref:            Git reference of the commit.
+		:return:               Dictionary of queried fields and their values.
+		:raises ToolException: If ``git show`` failed.
+		"""
+		commands = tuple(commands)
+		arguments = self._GitShowBatchArguments(commands, ref)
+		return self._ParseGitShowBatch(commands, arguments, self._ExecuteGit(arguments))
+
+	def _GitShowBatchArguments(self, commands: Tuple[GitShowCommand, ...], ref: str) -> Tuple[str, ...]:
+		format = "%x00".join(self.__GIT_SHOW_COMMAND_TO_FORMAT_LOOKUP[cmd] for cmd in commands)
+		return ("show", "-s", f"--format={format}%x1e", ref)
+
+	def _ParseGitShowBatch(
+		self,
+		commands: Tuple[GitShowCommand, ...],
+		arguments: Tuple[str, ...],
+		completed: CompletedProcess
+	) -> Dict[GitShowCommand, str]:
+		command = "git"
+		if completed.returncode != 0:
+			message = completed.stderr.decode("utf-8")
+			raise ToolException(f"{command} {' '.join(arguments)}", message)
+
+		record = completed.stdout.decode("utf-8").split("\x1e", 1)[0]
+		values = record.split("\x00")
+		if len(values) != len(commands):
+			raise ToolException(f"{command} {' '.join(arguments)}", f"Expected {len(commands)} fields, but got {len(values)}.")
+
+		return {cmd: value for cmd, value in zip(commands, values)}
+
+	def GetCommit(
+		self,
+		ref: str = "HEAD",
+		commitDateTime: Nullable[datetime] = None,
+		commands: Iterable[GitShowCommand] = tuple(GitShowCommand)
+	) -> Commit:
+		"""
+		Collect commit information (hash, date, author, committer, comment) with a single ``git show`` invocation.
+
+		:param ref:            Git reference of the commit.
+		:param commitDateTime: Optional commit date and time (e.g. provided by a CI service). If ``None``, it's queried too.
+		:param commands:       Commit fields to query. Fields not queried are empty (the date is the Unix epoch).
+		:return:               The commit information as :class:`Commit`.
+		:raises ToolException: If ``git show`` failed.
+		"""
+		commands = [cmd for cmd in commands if cmd is not GitShowCommand.CommitDateTime or commitDateTime is None]
+		fields = self.ExecuteGitShowBatch(commands, ref) if len(commands) > 0 else {}
+		return self._CommitFromFields(fields, commitDateTime)
+
+	@staticmethod
+	def _CommitFromFields(fields: Dict[GitShowCommand, str], commitDateTime: Nullable[datetime] = None) -> Commit:
+		if commitDateTime is None:
+			commitDateTime = datetime.fromtimestamp(int(fields.get(GitShowCommand.CommitDateTime, "0")))
+
+		return Commit(
+			hash=fields.get(GitShowCommand.CommitHash, ""),
+			date=commitDateTime.date(),
+			time=commitDateTime.time(),
+			author=Person(
+				name=fields.get(GitShowCommand.CommitAuthorName, ""),
+				email=fields.get(GitShowCommand.CommitAuthorEmail, "")
+			),
+			committer=Person(
+				name=fields.get(GitShowCommand.CommitCommitterName, ""),
+				email=fields.get(GitShowCommand.CommitCommitterEmail, "")
+			),
+			comment=fields.get(GitShowCommand.CommitComment, "")
+		)
+
 
 @export
 class Versioning(ILineTerminal, GitHelperMixin):
-	_variables: Dict[str, Any]
-	_platform:  Platforms = Platforms.Workstation
-	_service:   BaseService
+	_COMMIT_FIELD_PATHS: ClassVar[Dict[GitShowCommand, Tuple[str, ...]]] = {
+		GitShowCommand.CommitHash:           ("git.commit.hash", "git.describe"),
+		GitShowCommand.CommitDateTime:       ("git.commit.date", "git.commit.time"),
+		GitShowCommand.CommitAuthorName:     ("git.commit.author.name", ),
+		GitShowCommand.CommitAuthorEmail:    ("git.commit.author.email", ),
+		GitShowCommand.CommitCommitterName:  ("git.commit.committer.name", ),
+		GitShowCommand.CommitCommitterEmail: ("git.commit.committer.email", ),
+		GitShowCommand.CommitComment:        ("git.commit.comment", "git.commit.oneline"),
+	}  #: Field paths requiring a commit field.
+
+	_variables:     "VariableNamespace"
+	_platform:      Platforms = Platforms.Workstation
+	_service:       BaseService
+	_git:           "GitFacade"
+	_cacheFile:     Nullable[Path]
+	_templates:     "TemplateCache"
+	_timestamp:     str
+	_placeholders:  bool
+
+	FIELD_VOLATILITY: ClassVar[Dict[str, Volatility]] = {
+		"version":    Volatility.Stable,
+		"project":    Volatility.Stable,
+		"tool":       Volatility.Stable,
+		"platform":   Volatility.Stable,
+		"build":      Volatility.Stable,
+		"build.date": Volatility.Build,
+		"build.time": Volatility.Build,
+		"git":        Volatility.Commit,
+		"env":        Volatility.Build,
+		"appveyor":   Volatility.Build,
+		"github":     Volatility.Build,
+		"gitlab":     Volatility.Build,
+		"travis":     Volatility.Build,
+	}  #: Volatility of field paths. Descendants of a field path share its volatility unless listed themselves.
+
+	BUILD_TIMESTAMPS: ClassVar[Tuple[str, ...]] = ("now", "commit")  #: Sources of the build time.
+	VOLATILE_MODES:   ClassVar[Tuple[str, ...]] = ("keep", "placeholder")  #: Renderings of volatile fields.
+
+	def __init__(
+		self,
+		terminal: Nullable[ILineTerminal] = None,
+		git: Nullable["GitFacade"] = None,
+		cacheFile: Nullable[Path] = None,
+		templateCacheDirectory: Nullable[Path] = None,
+		volatilePlaceholders: bool = False
+	) -> None:
+		"""
+		Initialize the versioning data collection.
+
+		:param terminal:  Terminal for messages. If ``None``, no messages are written, but errors are still raised.
+		:param git:       Facade for all Git queries of this run. If ``None``, a facade for the current directory is created.
+		:param cacheFile: Optional path to an on-disk cache of the collected Git information (see
+		                  :class:`~pyVersioning.GitCache.GitCache`). If ``None``, no cache is used.
+		:param templateCacheDirectory: Optional directory for compiled templates (see
+		                  :class:`~pyVersioning.Template.TemplateCache`). If ``None``, templates are cached in memory only.
+		:param volatilePlaceholders: If ``True``, volatile fields (see :attr:`VolatileFields`) are rendered as fixed
+		                  placeholders. This can also be enabled by the configuration file (``build.volatile``).
+		"""
+		from pyVersioning.GitFacade import GitFacade
+		from pyVersioning.Namespace import VariableNamespace
+		from pyVersioning.Template  import TemplateCache
 
-	def __init__(self, terminal: ILineTerminal) -> None:
 		super().__init__(terminal)
 
-		self._variables = {
+		self._variables = VariableNamespace({
 			"tool": Tool("pyVersioning", SemanticVersion.Parse(f"v{__version__}"))
-		}
+		})
+		self._git = git if git is not None else GitFacade.Discover()
+		self._cacheFile = cacheFile
+		self._templates = TemplateCache(templateCacheDirectory)
+		self._timestamp = "now"
+		self._placeholders = volatilePlaceholders
 
 		if "APPVEYOR" in environ:
 			self._platform = Platforms.AppVeyor
@@ -669,23 +959,249 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		self.WriteDebug(f"Detected platform: {self._platform.name}")
 
 	@readonly
-	def Variables(self) -> Dict[str, Any]:
+	def Variables(self) -> "VariableNamespace":
+		"""
+		Read-only property to return the variables available in templates.
+
+		Values are provided on first access and then memoized. Errors while collecting a value surface, when the variable
+		is accessed.
+
+		:return: The variable namespace.
+		"""
 		return self._variables
 
 	@readonly
 	def Platform(self) -> Platforms:
 		return self._platform
 
+	@readonly
+	def GitFacade(self) -> "GitFacade":
+		"""
+		Read-only property to return the facade shared by all Git queries of this run (including the CI service's).
+
+		:return: The Git facade.
+		"""
+		return self._git
+
+	@readonly
+	def GitSession(self) -> "GitSession":
+		"""
+		Read-only property to return the Git session shared by all Git object lookups of this run.
+
+		:return: The Git session.
+		"""
+		return self._git.Session
+
+	@readonly
+	def VolatileFields(self) -> FrozenSet[str]:
+		"""
+		Read-only property to return the field paths, whose values change on every run for the same commit.
+
+		The environment and the CI service variables (e.g. build numbers) are always volatile. The build date and time are
+		volatile, unless ``SOURCE_DATE_EPOCH`` is set or the build time is derived from the commit (``build.timestamp``).
+
+		:return: Set of volatile field paths.
+		"""
+		return frozenset(path for path, volatility in self.FieldVolatility.items() if volatility is Volatility.Build)
+
+	@readonly
+	def FieldVolatility(self) -> Dict[str, Volatility]:
+		"""
+		Read-only property to return the volatility of field paths (see :attr:`FIELD_VOLATILITY`) for this run.
+
+		The build date and time change only with the commit, if ``SOURCE_DATE_EPOCH`` is set or the build time is derived
+		from the commit (``build.timestamp``).
+
+		:return: Dictionary of field paths and their volatility.
+		"""
+		volatility = dict(self.FIELD_VOLATILITY)
+		if "SOURCE_DATE_EPOCH" in environ or self._timestamp == "commit":
+			volatility["build.date"] = volatility["build.time"] = Volatility.Commit
+
+		return volatility
+
+	def GetVolatility(self, paths: Iterable[str]) -> Volatility:
+		"""
+		Return the volatility of a set of field paths, e.g. the fields referenced by a template.
+
+		A field path like ``build.date.year`` gets the volatility of its nearest listed ancestor (``build.date``). A field
+		path like ``build`` gets the highest volatility of itself and its listed descendants. Unknown field paths (e.g.
+		additional variables of a template) are stable.
+
+		:param paths: Field paths.
+		:return:      The highest volatility of all field paths.
+		"""
+		fieldVolatility = self.FieldVolatility
+		result = Volatility.Stable
+		for path in paths:
+			field = path
+			while field not in fieldVolatility and "." in field:
+				field = field.rpartition(".")[0]
+
+			volatilities = [fieldVolatility.get(field, Volatility.Stable)]
+			volatilities.extend(volatility for name, volatility in fieldVolatility.items() if name.startswith(f"{path}."))
+			result = max(result, *volatilities, key=lambda volatility: volatility.value)
+
+		return result
+
+	def FlattenVariables(self, variables: Nullable[Mapping[str, Any]] = None) -> Generator[Tuple[str, Any], None, None]:
+		"""
+		Flatten the tree of variables into field paths and values, e.g. ``("git.commit.hash", "8b0a...")``.
+
+		Values describing themselves (see :class:`SelfDescriptive`) and data classes (e.g. the environment) are descended
+		into, all other values are leaves.
+
+		:param variables: Variables to flatten. If ``None``, :attr:`Variables` is used.
+		:return:          A generator of pairs of field path and leaf value.
+		"""
+		def flatten(path: str, value: Any) -> Generator[Tuple[str, Any], None, None]:
+			if isinstance(value, SelfDescriptive):
+				for key, child in value.KeyValuePairs():
+					yield from flatten(f"{path}.{key}", child)
+			elif is_dataclass(value):
+				for field in dataclass_fields(value):
+					yield from flatten(f"{path}.{field.name}", getattr(value, field.name))
+			else:
+				yield path, value
+
+		for name, value in (self._variables if variables is None else variables).items():
+			yield from flatten(name, value)
+
+	@readonly
+	def VolatilePlaceholders(self) -> bool:
+		"""
+		Read-only property to return whether volatile fields are rendered as fixed placeholders.
+
+		:return: ``True``, if volatile fields are rendered as placeholders.
+		"""
+		return self._placeholders
+
+	@readonly
+	def TemplateCache(self) -> "TemplateCache":
+		"""
+		Read-only property to return the cache of compiled templates used by :meth:`FillOutTemplate`.
+
+		:return: The template cache.
+		"""
+		return self._templates
+
+	def Close(self) -> None:
+		"""Release all resources like the Git session's ``git cat-file`` process or memory-mapped packfiles."""
+		self.WriteDebug(f"Git queries: {self._git.Hits} cached, {self._git.Misses} computed, {self._git.SpawnCount} processes spawned.")
+		self._git.Close()
+
+	def __enter__(self) -> "Versioning":
+		return self
+
+	def __exit__(self, *_: Any) -> None:
+		self.Close()
+
 	def LoadDataFromConfiguration(self, config: Configuration) -> None:
-		"""Preload versioning information from a configuration file."""
+		"""Preload versioning information from a configuration file. Values are provided on first access."""
+		if config.build is not None:
+			for name, value, allowed in (
+				("timestamp", config.build.timestamp, self.BUILD_TIMESTAMPS),
+				("volatile", config.build.volatile, self.VOLATILE_MODES)
+			):
+				if value not in allowed:
+					self.WriteFatal(f"Unknown value '{value}' for 'build.{name}' in configuration file. Allowed values: {', '.join(allowed)}.")
+					raise VersioningException(f"Unknown value '{value}' for 'build.{name}'.")
+
+			self._timestamp = config.build.timestamp
+			self._placeholders |= config.build.volatile == "placeholder"
+
+		self._variables.Register("version", lambda: self.GetVersion(config.project))
+		self._variables.Register("project", lambda: self.GetProject(config.project))
+		self._variables.Register("build",   lambda: self.GetBuild(config.build))
+
+	def CollectData(self, fields: Nullable["FieldReferences"] = None) -> None:
+		"""
+		Register providers for versioning information from environment including CI services (if available).
+
+		Information is collected on first access of a variable (see :attr:`Variables`).
+
+		:param fields: Field paths referenced by the templates to fill out (see
+		               :attr:`~pyVersioning.Template.CompiledTemplate.Fields`). Only Git information needed for these
+		               paths is collected. If ``None``, all information is collected.
+		"""
+		self._CreateService()
+
+		self._variables.Register("git",      lambda: self._ProvideGitInformation(fields))
+		self._variables.Register("platform", self._service.GetPlatform)
+		self._variables.Register("env",      self._Volatile(self.GetEnvironment))
+
+	async def CollectDataAsync(self, fields: Nullable["FieldReferences"] = None) -> None:
+		"""
+		Collect versioning information like :meth:`CollectData` without blocking the event loop.
+
+		Git information is collected right away, if it's referenced. Independent Git queries (commit, tag, branch and
+		remote) run concurrently as ``asyncio`` subprocesses, if they can't be answered by the repository reader. The
+		history walk for the commit description runs in a worker thread.
+
+		:param fields: Field paths referenced by the templates to fill out. If ``None``, all information is collected.
+		"""
+		self.CollectData(fields)
+
+		if fields is None or "git" in fields:
+			self._variables["git"] = await self._ProvideGitInformationAsync(fields)
+
+	def _Volatile(self, provider: Callable[[], Any]) -> Callable[[], Any]:
+		"""Return the provider of a volatile variable or, if volatile fields are rendered as placeholders, a placeholder."""
+		return VolatilePlaceholder if self._placeholders else provider
+
+	def _ProvideGitInformation(self, fields: Nullable["FieldReferences"]) -> Git:
+		cache, key, git = self._LoadCachedGitInformation()
+		if git is not None:
+			return git
 
-		self._variables["version"] = self.GetVersion(config.project)
-		self._variables["project"] = self.GetProject(config.project)
-		self._variables["build"]   = self.GetBuild(config.build)
+		git = self.GetGitInformation(fields)
+		if fields is None or "git.describe" in fields:
+			self._DescribeGit(git)
+		if cache is not None and (fields is None or fields.IsAll):
+			cache.Store(key, git)
 
-	def CollectData(self) -> None:
-		"""Collect versioning information from environment including CI services (if available)."""
+		return git
 
+	async def _ProvideGitInformationAsync(self, fields: Nullable["FieldReferences"]) -> Git:
+		cache, key, git = self._LoadCachedGitInformation()
+		if git is not None:
+			return git
+
+		git = await self.GetGitInformationAsync(fields)
+		if fields is None or "git.describe" in fields:
+			await to_thread(self._DescribeGit, git)
+		if cache is not None and (fields is None or fields.IsAll):
+			cache.Store(key, git)
+
+		return git
+
+	def _LoadCachedGitInformation(self) -> Tuple[Nullable["GitCache"], Nullable[str], Nullable[Git]]:
+		"""
+		Look up the collected Git information in the on-disk cache.
+
+		The cache is used on workstations only, because CI services provide most information by environment variables.
+
+		:return: A tuple of cache, cache key and cached Git information. The cache is ``None``, if caching is disabled or
+		         the repository state can't be read. The Git information is ``None`` on a cache miss.
+		"""
+		from pyVersioning.GitCache      import GitCache
+		from pyVersioning.GitRepository import GitRepositoryException
+
+		if self._cacheFile is None or self._platform is not Platforms.Workstation or self._git.Repository is None:
+			return None, None, None
+
+		cache = GitCache(self._cacheFile, self._git.Repository)
+		try:
+			key = cache.ComputeKey()
+		except GitRepositoryException as ex:
+			self.WriteDebug(f"Can't compute cache key: {ex}")
+			return None, None, None
+
+		git = cache.Load(key)
+		self.WriteDebug(f"Git information {'loaded from' if git is not None else 'not found in'} cache '{self._cacheFile}'.")
+		return cache, key, git
+
+	def _CreateService(self) -> None:
 		from pyVersioning.AppVeyor      import AppVeyor
 		from pyVersioning.CIService     import WorkStation
 		from pyVersioning.GitLab        import GitLab
@@ -693,29 +1209,44 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		from pyVersioning.Travis        import Travis
 
 		if self._platform is Platforms.AppVeyor:
-			self._service                = AppVeyor()
-			self._variables["appveyor"]  = self._service.GetEnvironment()
+			self._service                = AppVeyor(self._git)
+			self._variables.Register("appveyor", self._Volatile(self._service.GetEnvironment))
 		elif self._platform is Platforms.GitHub:
-			self._service                = GitHub()
-			self._variables["github"]    = self._service.GetEnvironment()
+			self._service                = GitHub(self._git)
+			self._variables.Register("github", self._Volatile(self._service.GetEnvironment))
 		elif self._platform is Platforms.GitLab:
-			self._service                = GitLab()
-			self._variables["gitlab"]    = self._service.GetEnvironment()
+			self._service                = GitLab(self._git)
+			self._variables.Register("gitlab", self._Volatile(self._service.GetEnvironment))
 		elif self._platform is Platforms.Travis:
-			self._service                = Travis()
-			self._variables["travis"]    = self._service.GetEnvironment()
+			self._service                = Travis(self._git)
+			self._variables.Register("travis", self._Volatile(self._service.GetEnvironment))
 		else:
 			self._service                = WorkStation()
 
-		self._variables["git"]      = self.GetGitInformation()
-		self._variables["platform"] = self._service.GetPlatform()
-		self._variables["env"]      = self.GetEnvironment()
+	def CalculateData(self) -> None:
+		self._DescribeGit(self._variables["git"])
 
-		self.CalculateData()
+	def _DescribeGit(self, git: Git) -> None:
+		description = self.GetGitDescription(git.commit.hash)
+		if description is not None:
+			git._describe = description
 
-	def CalculateData(self) -> None:
-		if self._variables["git"].tag != "":
-			pass
+	def GetGitDescription(self, hash: str) -> Nullable[Description]:
+		"""
+		Find the nearest tag, the number of commits since that tag and the number of commits in the history of a commit.
+
+		The repository's commit-graph is used if available, otherwise a bounded breadth-first walk.
+
+		:param hash: Hash of the commit to describe.
+		:return:     The commit description or ``None``, if the history can't be read.
+		"""
+		from pyVersioning.GitRepository import GitRepositoryException
+
+		try:
+			return self._git.GetDescription(hash)
+		except (GitRepositoryException, ToolException) as ex:
+			self.WriteDebug(f"Can't describe commit '{hash}': {ex}")
+			return None
 
 	def GetVersion(self, config: Project) -> SemanticVersion:
 		if config.version is not None:
@@ -723,38 +1254,121 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		else:
 			return SemanticVersion.Parse("0.0.0")
 
-	def GetGitInformation(self) -> Git:
+	def _GetGitRequirements(self, fields: Nullable["FieldReferences"]) -> Tuple[Tuple[GitShowCommand, ...], bool, bool, bool]:
+		"""
+		Determine the Git information needed for the referenced field paths.
+
+		:param fields: Referenced field paths. If ``None``, all Git information is needed.
+		:return:       A tuple of needed commit fields and flags whether tag, branch and remote URL are needed.
+		"""
+		if fields is None:
+			return tuple(GitShowCommand), True, True, True
+
+		return (
+			tuple(cmd for cmd, paths in self._COMMIT_FIELD_PATHS.items() if any(path in fields for path in paths)),
+			"git.tag" in fields or "git.reference" in fields or "git.describe" in fields,
+			"git.branch" in fields or "git.reference" in fields,
+			"git.repository" in fields
+		)
+
+	def GetGitInformation(self, fields: Nullable["FieldReferences"] = None) -> Git:
+		"""
+		Collect commit, tag, branch and remote URL.
+
+		:param fields: Referenced field paths. Git information not needed for these paths isn't collected and left empty.
+		               If ``None``, all information is collected.
+		:return:       The collected Git information.
+		"""
+		commands, needsTag, needsBranch, needsRepository = self._GetGitRequirements(fields)
+
+		branch = ""
+		if needsBranch or (needsRepository and self._platform is Platforms.Workstation):
+			branch = self.GetGitLocalBranch()
+
+		repository = ""
+		if needsRepository:
+			if self._platform is Platforms.Workstation:
+				repository = self.GetGitRemoteURL(self.GetGitRemote(branch))
+			else:
+				repository = self.GetGitRemoteURL()
+
 		return Git(
-			commit=self.GetLastCommit(),
-			tag=self.GetGitTag(),
-			branch=self.GetGitLocalBranch(),
-			repository=self.GetGitRemoteURL()
+			commit=self.GetLastCommit(commands),
+			tag=self.GetGitTag() if needsTag else "",
+			branch=branch if needsBranch else "",
+			repository=repository
 		)
 
-	def GetLastCommit(self) -> Commit:
-		dt = self.GetCommitDate()
+	async def GetGitInformationAsync(self, fields: Nullable["FieldReferences"] = None) -> Git:
+		"""
+		Collect commit, tag, branch and remote URL like :meth:`GetGitInformation`, but run independent queries concurrently.
 
-		return Commit(
-			hash=self.GetGitHash(),
-			date=dt.date(),
-			time=dt.time(),
-			author=self.GetCommitAuthor(),
-			committer=self.GetCommitCommitter(),
-			comment=self.GetCommitComment()
+		If any commit field is needed, all commit fields are queried, because they share a single process.
+
+		:param fields: Referenced field paths. If ``None``, all information is collected.
+		:return:       The collected Git information.
+		"""
+		commands, needsTag, needsBranch, needsRepository = self._GetGitRequirements(fields)
+
+		async def GetCommit() -> Commit:
+			if len(commands) == 0:
+				return self._CommitFromFields({})
+			elif self._platform is not Platforms.Workstation:
+				return await self._service.GetLastCommitAsync()
+			else:
+				return await self._git.GetCommitAsync()
+
+		async def GetNothing() -> str:
+			return ""
+
+		if self._platform is not Platforms.Workstation:
+			return Git(
+				commit=await GetCommit(),
+				tag=self._service.GetGitTag() if needsTag else "",
+				branch=self._service.GetGitBranch() if needsBranch else "",
+				repository=self._service.GetGitRepository() if needsRepository else ""
+			)
+
+		async def GetRemoteURL() -> str:
+			localBranch = await self._git.GetLocalBranchAsync()
+			remote = self._CheckGitRemote(localBranch, await self._git.GetRemoteAsync(localBranch))
+			return self._CheckGitRemoteURL(remote, await self._git.GetRemoteURLAsync(remote))
+
+		try:
+			commit, tag, branch, repository = await gather(
+				GetCommit(),
+				self._git.GetTagAsync() if needsTag else GetNothing(),
+				self._git.GetLocalBranchAsync() if needsBranch else GetNothing(),
+				GetRemoteURL() if needsRepository else GetNothing()
+			)
+		except ToolException as ex:
+			self.WriteFatal(f"Message from '{ex.command}': {ex.errorMessage}")
+			raise
+
+		return Git(
+			commit=commit,
+			tag=tag,
+			branch=branch,
+			repository=repository
 		)
 
+	def GetLastCommit(self, commands: Iterable[GitShowCommand] = tuple(GitShowCommand)) -> Commit:
+		if self._platform is not Platforms.Workstation:
+			return self._service.GetLastCommit(commands)
+
+		return self._git.GetCommit(commands=commands)
+
 	def GetGitHash(self) -> str:
 		if self._platform is not Platforms.Workstation:
 			return self._service.GetGitHash()
 
-		return self.ExecuteGitShow(GitShowCommand.CommitHash)
+		return self._git.ExecuteGitShow(GitShowCommand.CommitHash)
 
 	def GetCommitDate(self) -> datetime:
 		if self._platform is not Platforms.Workstation:
 			return self._service.GetCommitDate()
 
-		datetimeString = self.ExecuteGitShow(GitShowCommand.CommitDateTime)
-		return datetime.fromtimestamp(int(datetimeString))
+		return self._git.GetCommitDate()
 
 	def GetCommitAuthor(self) -> Person:
 		return Person(
@@ -763,10 +1377,10 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		)
 
 	def GetCommitAuthorName(self) -> str:
-		return self.ExecuteGitShow(GitShowCommand.CommitAuthorName)
+		return self._git.ExecuteGitShow(GitShowCommand.CommitAuthorName)
 
 	def GetCommitAuthorEmail(self) -> str:
-		return self.ExecuteGitShow(GitShowCommand.CommitAuthorEmail)
+		return self._git.ExecuteGitShow(GitShowCommand.CommitAuthorEmail)
 
 	def GetCommitCommitter(self) -> Person:
 		return Person(
@@ -775,30 +1389,23 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		)
 
 	def GetCommitCommitterName(self) -> str:
-		return self.ExecuteGitShow(GitShowCommand.CommitCommitterName)
+		return self._git.ExecuteGitShow(GitShowCommand.CommitCommitterName)
 
 	def GetCommitCommitterEmail(self) -> str:
-		return self.ExecuteGitShow(GitShowCommand.CommitCommitterEmail)
+		return self._git.ExecuteGitShow(GitShowCommand.CommitCommitterEmail)
 
 	def GetCommitComment(self) -> str:
-		return self.ExecuteGitShow(GitShowCommand.CommitComment)
+		return self._git.ExecuteGitShow(GitShowCommand.CommitComment)
 
 	def GetGitLocalBranch(self) -> str:
 		if self._platform is not Platforms.Workstation:
 			return self._service.GetGitBranch()
 
-		command = "git"
-		arguments = ("branch", "--show-current")
 		try:
-			completed = subprocess_run((command, *arguments), stdout=PIPE, stderr=PIPE)
-		except CalledProcessError:
-			return ""
-
-		if completed.returncode == 0:
-			return completed.stdout.decode("utf-8").split("\n")[0]
-		else:
-			message = completed.stderr.decode("utf-8")
-			self.WriteFatal(f"Message from '{command} {' '.join(arguments)}': {message}")
+			return self._git.GetLocalBranch()
+		except ToolException as ex:
+			self.WriteFatal(f"Message from '{ex.command}': {ex.errorMessage}")
+			raise
 
 	def GetGitRemoteBranch(self, localBranch: Nullable[str] = None) -> str:
 		if self._platform is not Platforms.Workstation:
@@ -807,58 +1414,51 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		if localBranch is None:
 			localBranch = self.GetGitLocalBranch()
 
-		command = "git"
-		arguments = ("config", f"branch.{localBranch}.merge")
 		try:
-			completed = subprocess_run((command, *arguments), stdout=PIPE, stderr=PIPE)
-		except CalledProcessError:
-			raise Exception()  # XXX: needs error message
+			remoteBranch = self._git.GetRemoteBranch(localBranch)
+		except ToolException as ex:
+			self.WriteFatal(f"Message from '{ex.command}': {ex.errorMessage}")
+			raise
 
-		if completed.returncode == 0:
-			return completed.stdout.decode("utf-8").split("\n")[0]
-		else:
-			message = completed.stderr.decode("utf-8")
-			self.WriteFatal(f"Message from '{command} {' '.join(arguments)}': {message}")
-			raise Exception()  # XXX: needs error message
+		if remoteBranch is None:
+			self.WriteFatal(f"Branch '{localBranch}' has no upstream branch.")
+			raise VersioningException(f"Branch '{localBranch}' has no upstream branch.")
+
+		return remoteBranch
 
 	def GetGitRemote(self, localBranch: Nullable[str] = None) -> str:
 		if localBranch is None:
 			localBranch = self.GetGitLocalBranch()
 
-		command = "git"
-		arguments = ("config", f"branch.{localBranch}.remote")
 		try:
-			completed = subprocess_run((command, *arguments), stdout=PIPE, stderr=PIPE)
-		except CalledProcessError:
-			raise Exception()  # XXX: needs error message
+			remote = self._git.GetRemote(localBranch)
+		except ToolException as ex:
+			self.WriteFatal(f"Message from '{ex.command}': {ex.errorMessage}")
+			raise
 
-		if completed.returncode == 0:
-			return completed.stdout.decode("utf-8").split("\n")[0]
-		elif completed.returncode == 1:
+		return self._CheckGitRemote(localBranch, remote)
+
+	def _CheckGitRemote(self, localBranch: str, remote: Nullable[str]) -> str:
+		if remote is None:
 			self.WriteWarning(f"Branch '{localBranch}' is not pushed to a remote.")
 			return f"(local) {localBranch}"
-		else:
-			message = completed.stderr.decode("utf-8")
-			self.WriteFatal(f"Message from '{command} {' '.join(arguments)}': {message}")
-			raise Exception()  # XXX: needs error message
+
+		return remote
 
 	def GetGitTag(self) -> str:
+		"""
+		Return the tag pointing at ``HEAD``. If multiple tags point at ``HEAD``, the highest semantic version is returned.
+
+		:return: Tag name or an empty string.
+		"""
 		if self._platform is not Platforms.Workstation:
 			return self._service.GetGitTag()
 
-		command = "git"
-		arguments = ("tag", "--points-at", "HEAD")
 		try:
-			completed = subprocess_run((command, *arguments), stdout=PIPE, stderr=PIPE)
-		except CalledProcessError:
-			raise Exception()  # XXX: needs error message
-
-		if completed.returncode == 0:
-			return completed.stdout.decode("utf-8").split("\n")[0]
-		else:
-			message = completed.stderr.decode("utf-8")
-			self.WriteFatal(f"Message from '{command} {' '.join(arguments)}': {message}")
-			raise Exception()  # XXX: needs error message
+			return self._git.GetTag()
+		except ToolException as ex:
+			self.WriteFatal(f"Message from '{ex.command}': {ex.errorMessage}")
+			raise
 
 	def GetGitRemoteURL(self, remote: Nullable[str] = None) -> str:
 		if self._platform is not Platforms.Workstation:
@@ -867,19 +1467,20 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		if remote is None:
 			remote = self.GetGitRemote()
 
-		command = "git"
-		arguments = ("config", f"remote.{remote}.url")
 		try:
-			completed = subprocess_run((command, *arguments), stdout=PIPE, stderr=PIPE)
-		except CalledProcessError:
-			raise Exception()  # XXX: needs error message
+			url = self._git.GetRemoteURL(remote)
+		except ToolException as ex:
+			self.WriteFatal(f"Message from '{ex.command}': {ex.errorMessage}")
+			raise
 
-		if completed.returncode == 0:
-			return completed.stdout.decode("utf-8").split("\n")[0]
-		else:
-			message = completed.stderr.decode("utf-8")
-			self.WriteFatal(f"Message from '{command} {' '.join(arguments)}': {message}")
-			raise Exception()  # XXX: needs error message
+		return self._CheckGitRemoteURL(remote, url)
+
+	def _CheckGitRemoteURL(self, remote: str, url: Nullable[str]) -> str:
+		if url is None:
+			self.WriteFatal(f"Remote '{remote}' has no URL.")
+			raise VersioningException(f"Remote '{remote}' has no URL.")
+
+		return url
 
 	# 		self.WriteFatal(f"Message from '{command}': {message}")
 
@@ -891,13 +1492,40 @@ class Versioning(ILineTerminal, GitHelperMixin):
 		)
 
 	def GetBuild(self, config: Build) -> Build:
-		dt = datetime.now()
+		dt = self.GetBuildDateTime()
 		return Build(
 			date=dt.date(),
 			time=dt.time(),
-			compiler=self.GetCompiler(config.compiler)
+			compiler=self.GetCompiler(config.compiler) if config is not None and config.compiler is not None else Compiler("", "v0.0.0")
 		)
 
+	def GetBuildDateTime(self) -> datetime:
+		"""
+		Determine the build's date and time.
+
+		#. If ``SOURCE_DATE_EPOCH`` is set, it's used as UTC time (see `reproducible-builds.org
+		   <https://reproducible-builds.org/specs/source-date-epoch/>`__).
+		#. If the build time is derived from the commit (``build.timestamp: commit``), the commit's date and time is used.
+		#. Otherwise, the current date and time is used. If volatile fields are rendered as placeholders, the Unix epoch is
+		   used instead.
+
+		:return:                    The build's date and time.
+		:raises VersioningException: If ``SOURCE_DATE_EPOCH`` isn't a valid Unix timestamp.
+		"""
+		if "SOURCE_DATE_EPOCH" in environ:
+			value = environ["SOURCE_DATE_EPOCH"]
+			try:
+				return datetime.fromtimestamp(int(value), timezone.utc)
+			except (ValueError, OverflowError, OSError):
+				self.WriteFatal(f"Environment variable 'SOURCE_DATE_EPOCH' isn't a valid Unix timestamp: '{value}'")
+				raise VersioningException(f"Invalid SOURCE_DATE_EPOCH '{value}'.")
+		elif self._timestamp == "commit":
+			return self.GetCommitDate()
+		elif self._placeholders:
+			return datetime(1970, 1, 1)
+
+		return datetime.now()
+
 	def GetCompiler(self, config: Compiler) -> Compiler:
 		return Compiler(
 			name=config.name,
@@ -936,9 +1564,166 @@ class Versioning(ILineTerminal, GitHelperMixin):
 
 		return Environment(**env)
 
-	def FillOutTemplate(self, template: str, **kwargs) -> str:
-		# apply variables
+	def FillOutTemplate(self, template: str, variables: Nullable[Mapping[str, Any]] = None, /, **kwargs) -> str:
+		"""
+		Fill out a template with the collected variables.
+
+		:param template:             Template.
+		:param variables:            Variables (e.g. of a matrix cell, see :meth:`GetMatrixVariables`). If ``None``,
+		                             :attr:`Variables` is used.
+		:param kwargs:               Additional variables.
+		:return:                     The filled out template.
+		:raises VersioningException: If the template accesses an unknown field (without terminal).
+		"""
+		try:
+			return self._templates.Compile(template).Render(self._variables if variables is None else variables, **kwargs)
+		except AttributeError as ex:
+			raise self._TemplateError(ex) from ex
+
+	def _TemplateError(self, ex: AttributeError) -> VersioningException:
+		# With a terminal, the fatal message exits the application. Otherwise, the caller raises the returned exception.
+		message = f"Syntax error in template. Accessing field '{ex.name}' of '{ex.obj.__class__.__name__}'."
+		self.WriteFatal(message)
+		return VersioningException(message)
+
+	@staticmethod
+	def DeriveProject(
+		project: Nullable[Project],
+		name: Nullable[str] = None,
+		version: Union[str, SemanticVersion, None] = None,
+		variant: Nullable[str] = None
+	) -> Project:
+		"""
+		Create a copy of a project description with some fields replaced. The given project isn't modified.
+
+		:param project: Project to copy. If ``None``, fields not given are empty.
+		:param name:    New name or ``None`` to keep the name.
+		:param version: New version or ``None`` to keep the version.
+		:param variant: New variant or ``None`` to keep the variant.
+		:return:        The derived project description.
+		"""
+		return Project(
+			name if name is not None or project is None else project.name,
+			version if version is not None or project is None else project.version,
+			variant if variant is not None or project is None else project.variant
+		)
+
+	@staticmethod
+	def DeriveBuild(
+		build: Build,
+		compilerName: Nullable[str] = None,
+		compilerVersion: Union[str, SemanticVersion, None] = None,
+		compilerConfiguration: Nullable[str] = None,
+		compilerOptions: Nullable[str] = None
+	) -> Build:
+		"""
+		Create a copy of a build description with some compiler fields replaced. The given build isn't modified.
+
+		:param build:                 Build to copy.
+		:param compilerName:          New compiler name or ``None`` to keep the name.
+		:param compilerVersion:       New compiler version or ``None`` to keep the version.
+		:param compilerConfiguration: New compiler configuration or ``None`` to keep the configuration.
+		:param compilerOptions:       New compiler options or ``None`` to keep the options.
+		:return:                      The derived build description.
+		"""
+		compiler = build.compiler
+		return Build(
+			build.date,
+			build.time,
+			Compiler(
+				compilerName if compilerName is not None else compiler.name,
+				compilerVersion if compilerVersion is not None else compiler.version,
+				compilerConfiguration if compilerConfiguration is not None else compiler.configuration,
+				compilerOptions if compilerOptions is not None else compiler.options
+			)
+		)
+
+	def CreateSnapshot(self) -> "Snapshot":
+		"""
+		Create an immutable snapshot of all variables (see :class:`~pyVersioning.Snapshot.Snapshot`). All variables are
+		collected, if not done yet.
+
+		:return: The snapshot.
+		"""
+		from pyVersioning.Snapshot import Snapshot
+
+		return Snapshot(self._variables)
+
+	def GetMatrixVariables(self, matrix: Matrix) -> List[Mapping[str, Any]]:
+		"""
+		Create the variables of each cell of a matrix of project variants and compilers.
+
+		Each cell overrides the variables ``project`` (variant) and ``build`` (compiler) and shares all other variables, thus
+		Git and CI information is collected only once for all cells.
+
+		:param matrix: Matrix from the configuration file.
+		:return:       List of variables per cell, ordered by variant and then by compiler.
+		"""
+		project = self._variables["project"]
+		build = self._variables["build"]
+		compilers = [self.GetCompiler(compiler) for compiler in matrix.compilers] if len(matrix.compilers) > 0 else [build.compiler]
+
+		return [
+			ChainMap({
+				"project": Project(project.name, project.version, variant),
+				"build":   Build(build.date, build.time, compiler)
+			}, self._variables)
+			for variant in (matrix.variants if len(matrix.variants) > 0 else [project.variant])
+			for compiler in compilers
+		]
+
+	def GetRenderKey(self, template: str, variables: Nullable[Mapping[str, Any]] = None, /, **kwargs) -> str:
+		"""
+		Compute the key of the rendered template for a :class:`~pyVersioning.Template.RenderCache`.
+
+		:param template:             Template.
+		:param variables:            Variables (e.g. of a matrix cell). If ``None``, :attr:`Variables` is used.
+		:param kwargs:               Additional variables.
+		:return:                     Hash of the template and the formatted values of its fields.
+		:raises VersioningException: If the template accesses an unknown field (without terminal).
+		"""
+		try:
+			return self._templates.Compile(template).RenderKey(self._variables if variables is None else variables, **kwargs)
+		except AttributeError as ex:
+			raise self._TemplateError(ex) from ex
+
+	def FillOutSplitTemplate(self, template: str, **kwargs) -> Tuple[str, str]:
+		"""
+		Fill out a template and split the result into a stable and a volatile part by the volatility of the fields.
+
+		The template is split into sections by lines containing the section marker (see
+		:func:`~pyVersioning.Template.SplitSections`). The first section (e.g. a file header and includes) is part of both
+		results. Every other section is part of the volatile result, if any referenced field isn't stable (see
+		:meth:`GetVolatility`), otherwise it's part of the stable result. Thus, e.g. a C source file can be split into two
+		translation units, whereby the stable one changes only with the configuration.
+
+		:param template: Template with sections.
+		:param kwargs:   Additional variables.
+		:return:         Tuple of the stable and the volatile result.
+		"""
+		from pyVersioning.Template import SplitSections
+
+		header, *sections = SplitSections(template)
+		header = self.FillOutTemplate(header, **kwargs)
+		stable = [header]
+		volatile = [header]
+		for section in sections:
+			compiled = self._templates.Compile(section)
+			isStable = self.GetVolatility(compiled.Fields) is Volatility.Stable
+			(stable if isStable else volatile).append(self.FillOutTemplate(section, **kwargs))
+
+		return "".join(stable), "".join(volatile)
+
+	def FillOutTemplateStream(self, template: "TemplateStream", write: Callable[[str], Any], **kwargs) -> None:
+		"""
+		Fill out a template file chunk by chunk like :meth:`FillOutTemplate`, thus memory usage doesn't depend on its size.
+
+		:param template:             Template file read in chunks.
+		:param write:                Callable receiving each rendered chunk, e.g. the ``write`` method of an output file.
+		:param kwargs:               Additional variables.
+		:raises VersioningException: If the template accesses an unknown field (without terminal).
+		"""
 		try:
-			return template.format(**self._variables, **kwargs)
+			template.Render(write, self._variables, **kwargs)
 		except AttributeError as ex:
-			self.WriteFatal(f"Syntax error in template. Accessing field '{ex.name}' of '{ex.obj.__class__.__name__}'.")
+			raise self._TemplateError(ex) from ex
@@ -91,7 +91,22 @@ typedef struct {
 	Build      build;
 } VersioningInformation;
 
+typedef struct {
+	Version    version;
+	Project    project;
+	Compiler   compiler;
+} StableVersioningInformation;
+
+typedef struct {
+	Git        git;
+	DateTime   build;
+} VolatileVersioningInformation;
+
 
 extern const VersioningInformation versioningInformation;
 
+// Split variant (versioning.split.c.template): stable and volatile data are defined in separate translation units.
+extern const StableVersioningInformation   stableVersioningInformation;
+extern const VolatileVersioningInformation volatileVersioningInformation;
+
 #endif /* VERSIONING_H */
@@ -110,8 +110,23 @@ struct VersioningInformation {
 	Build      build;
 };
 
+struct StableVersioningInformation {
+	Version    version;
+	Project    project;
+	Compiler   compiler;
+};
+
+struct VolatileVersioningInformation {
+	Git        git;
+	DateTime   build;
+};
+
 } // namespace pyVersioning
 
 extern const pyVersioning::VersioningInformation versioningInformation;
 
+// Split variant (versioning.split.cpp.template): stable and volatile data are defined in separate translation units.
+extern const pyVersioning::StableVersioningInformation   stableVersioningInformation;
+extern const pyVersioning::VolatileVersioningInformation volatileVersioningInformation;
+
 #endif /* VERSIONING_H */
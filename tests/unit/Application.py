@@ -29,9 +29,13 @@
 # ==================================================================================================================== #
 #
 """Unit tests for pyVersioning application using mocking."""
+from hashlib              import sha256
 from io                   import StringIO
 from json                 import loads as json_loads
+from pathlib              import Path
 from re                   import compile as re_compile
+from tempfile             import TemporaryDirectory
+from textwrap             import dedent
 from typing               import Tuple
 from unittest             import TestCase
 from unittest.mock        import patch
@@ -176,6 +180,27 @@ class Application(TestCase):
 
 		# self.assertEqual("1.1", json["format"])
 
+	@patch("sys.argv", ["pyVersioning.py", "status"])
+	def test_Status(self) -> None:
+		print()
+
+		app = pyV_Application()
+		app._errorCount = 0
+		app._stdout, app._stderr = out, err = StringIO(), StringIO()
+		try:
+			app.Run()
+		except SystemExit as ex:
+			self.assertEqual(0, ex.code)
+
+		stdout, stderr = self._PrintToStdOutAndStdErr(out, err)
+		status = dict(line.partition(" ")[::2] for line in self._RemoveColorCodes(stdout).splitlines())
+
+		self.assertRegex(status["STABLE_GIT_COMMIT_HASH"], r"^[0-9a-f]{40}$")
+		self.assertIn("STABLE_VERSION", status)
+		self.assertIn("BUILD_TIME", status)
+		self.assertNotIn("STABLE_BUILD_TIME", status)
+		self.assertFalse(any(key.startswith(("ENV_", "STABLE_ENV_")) for key in status))
+
 	@patch("sys.argv", ["pyVersioning.py", "--config-file=tests/unit/CIServices/.pyVersioning.yml", "json"])
 	def test_JSON_WithoutError(self) -> None:
 		print()
@@ -212,6 +237,232 @@ class Application(TestCase):
 
 		self.assertEqual("1.1", json["format"])
 
+	def test_JSON_WriteIfChanged(self) -> None:
+		print()
+
+		with TemporaryDirectory() as tempDirectory:
+			outputFile = Path(tempDirectory) / "version.json"
+			messages = []
+			for _ in range(3):
+				arguments = ["pyVersioning.py", "--config-file=tests/unit/CIServices/.pyVersioning.yml", "--write-if-changed", "json", str(outputFile)]
+				with patch("sys.argv", arguments):
+					app = pyV_Application()
+					app._stdout, app._stderr = out, err = StringIO(), StringIO()
+					app._errorCount = 0  # the application is a singleton, thus errors of previous tests are still counted
+					try:
+						app.Run()
+					except SystemExit as ex:
+						self.assertEqual(0, ex.code)
+
+				stdout, stderr = self._PrintToStdOutAndStdErr(out, err)
+				messages.append(self._RemoveColorCodes(stdout))
+
+				if len(messages) == 1:
+					content = outputFile.read_text(encoding="utf-8")
+					modificationTime = outputFile.stat().st_mtime_ns
+
+			self.assertIn("updated", messages[0])
+			self.assertIn("unchanged", messages[1])
+			self.assertIn("unchanged", messages[2])
+			self.assertEqual(modificationTime, outputFile.stat().st_mtime_ns)
+			self.assertEqual(content, outputFile.read_text(encoding="utf-8"))
+			self.assertEqual(["version.json"], [path.name for path in Path(tempDirectory).iterdir()])
+
+	def test_JSON_DepFile(self) -> None:
+		print()
+
+		with TemporaryDirectory() as tempDirectory:
+			outputFile = Path(tempDirectory) / "version file.json"
+			depFile = Path(tempDirectory) / "version.d"
+			arguments = ["pyVersioning.py", "--config-file=tests/unit/CIServices/.pyVersioning.yml", "json", f"--depfile={depFile}", str(outputFile)]
+			with patch("sys.argv", arguments):
+				app = pyV_Application()
+				app._stdout, app._stderr = out, err = StringIO(), StringIO()
+				app._errorCount = 0  # the application is a singleton, thus errors of previous tests are still counted
+				try:
+					app.Run()
+				except SystemExit as ex:
+					self.assertEqual(0, ex.code)
+
+			self._PrintToStdOutAndStdErr(out, err)
+
+			lines = depFile.read_text(encoding="utf-8").splitlines()
+
+		target = outputFile.as_posix().replace(" ", "\\ ")
+		self.assertEqual(f"{target}: \\", lines[0])
+		self.assertEqual("  tests/unit/CIServices/.pyVersioning.yml \\", lines[1])
+		self.assertTrue(lines[2].strip().endswith("/HEAD \\"))
+		self.assertFalse(lines[-1].endswith("\\"))
+
+	def test_JSON_RenderCache(self) -> None:
+		print()
+
+		with TemporaryDirectory() as tempDirectory:
+			cacheDirectory = Path(tempDirectory) / "cache"
+			manifestFile = Path(tempDirectory) / "manifest.json"
+			outputFiles = [Path(tempDirectory) / f"version{index}.json" for index in range(2)]
+			for outputFile in outputFiles:
+				arguments = ["pyVersioning.py", "--config-file=tests/unit/CIServices/.pyVersioning.yml", f"--render-cache={cacheDirectory}", f"--manifest={manifestFile}", "json", str(outputFile)]
+				with patch("sys.argv", arguments):
+					app = pyV_Application()
+					app._stdout, app._stderr = out, err = StringIO(), StringIO()
+					app._errorCount = 0  # the application is a singleton, thus errors of previous tests are still counted
+					try:
+						app.Run()
+					except SystemExit as ex:
+						self.assertEqual(0, ex.code)
+
+				self._PrintToStdOutAndStdErr(out, err)
+
+			self.assertEqual((1, 0), (app._renderCache.Hits, app._renderCache.Misses))
+			self.assertEqual(outputFiles[0].read_text(encoding="utf-8"), outputFiles[1].read_text(encoding="utf-8"))
+			self.assertEqual(1, len(list((cacheDirectory / "objects").iterdir())))
+
+			manifest = json_loads(manifestFile.read_text(encoding="utf-8"))
+
+		self.assertEqual("sha256", manifest["algorithm"])
+		self.assertEqual({outputFile.as_posix() for outputFile in outputFiles}, set(manifest["outputs"]))
+		self.assertEqual(1, len(set(manifest["outputs"].values())))
+
+	def test_Batch(self) -> None:
+		print()
+
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "name.template").write_text("{project.name}", encoding="utf-8")
+			(directory / "version.template").write_text("{version!s} {build.compiler.name}", encoding="utf-8")
+			manifestFile = directory / "outputs.yml"
+			manifestFile.write_text(
+				"outputs:\n" +
+				"".join(
+					f"  - template: {directory / template}\n"
+					f"    output: {directory / 'generated' / f'{index}.txt'}\n"
+					for index, template in enumerate(("name.template", "version.template") * 4)
+				),
+				encoding="utf-8"
+			)
+
+			for jobs in ("1", "4"):
+				for outputFile in directory.glob("generated/*.txt"):
+					outputFile.unlink()
+
+				arguments = ["pyVersioning.py", "--config-file=tests/unit/CIServices/.pyVersioning.yml", "batch", f"--jobs={jobs}", str(manifestFile)]
+				with self.subTest(jobs=jobs), patch("sys.argv", arguments):
+					app = pyV_Application()
+					app._stdout, app._stderr = out, err = StringIO(), StringIO()
+					app._errorCount = 0  # the application is a singleton, thus errors of previous tests are still counted
+					try:
+						app.Run()
+					except SystemExit as ex:
+						self.assertEqual(0, ex.code)
+
+					self._PrintToStdOutAndStdErr(out, err)
+
+					for index in range(8):
+						self.assertEqual(
+							"UnitTest Project" if index % 2 == 0 else "v1.1.6 gcc",
+							(directory / "generated" / f"{index}.txt").read_text(encoding="utf-8")
+						)
+
+	def test_Batch_Matrix(self) -> None:
+		print()
+
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "version.template").write_text("{project.name} {project.variant} {build.compiler.name} {build.compiler.version!s}", encoding="utf-8")
+			configFile = directory / ".pyVersioning.yml"
+			configFile.write_text(dedent(f"""\
+				version: 1
+				project:
+				  name: Firmware
+				  version: v2.0.0
+				matrix:
+				  variants: [A1, B2]
+				  compilers:
+				    - {{name: gcc, version: 12.2.0, configuration: Release, options: -O2}}
+				    - {{name: clang, version: 17.0.1, configuration: Release, options: -Oz}}
+				outputs:
+				  - template: {directory / "version.template"}
+				    output: {directory}/generated/{{project.variant}}/{{build.compiler.name}}.txt
+				"""),
+				encoding="utf-8"
+			)
+
+			arguments = ["pyVersioning.py", f"--config-file={configFile}", "batch"]
+			with patch("sys.argv", arguments):
+				app = pyV_Application()
+				app._stdout, app._stderr = out, err = StringIO(), StringIO()
+				app._errorCount = 0  # the application is a singleton, thus errors of previous tests are still counted
+				try:
+					app.Run()
+				except SystemExit as ex:
+					self.assertEqual(0, ex.code)
+
+			self._PrintToStdOutAndStdErr(out, err)
+
+			outputs = {path.relative_to(directory / "generated").as_posix(): path.read_text(encoding="utf-8") for path in directory.glob("generated/*/*.txt")}
+
+		self.assertEqual({
+			"A1/gcc.txt":   "Firmware A1 gcc 12.2.0",
+			"A1/clang.txt": "Firmware A1 clang 17.0.1",
+			"B2/gcc.txt":   "Firmware B2 gcc 12.2.0",
+			"B2/clang.txt": "Firmware B2 clang 17.0.1",
+		}, outputs)
+
+	def test_Batch_Threads(self) -> None:
+		print()
+
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "version.template").write_text("{project.name} {project.variant} {build.compiler.name}\n" * 200, encoding="utf-8")
+			(directory / "shared.template").write_text("{project.name} {project.version!s}\n" * 200, encoding="utf-8")
+			configFile = directory / ".pyVersioning.yml"
+			configFile.write_text(dedent(f"""\
+				version: 1
+				project:
+				  name: Firmware
+				  version: v2.0.0
+				matrix:
+				  variants: [A, B, C, D]
+				  compilers:
+				    - {{name: gcc, version: 12.2.0, configuration: Release, options: -O2}}
+				    - {{name: clang, version: 17.0.1, configuration: Release, options: -Oz}}
+				    - {{name: icx, version: 2024.0.0, configuration: Release, options: -O3}}
+				outputs:
+				  - template: {directory / "version.template"}
+				    output: {directory}/generated/{{project.variant}}/{{build.compiler.name}}.txt
+				  - template: {directory / "shared.template"}
+				    output: {directory}/generated/{{project.variant}}/{{build.compiler.name}}.shared.txt
+				"""),
+				encoding="utf-8"
+			)
+			manifestFile = directory / "manifest.json"
+
+			arguments = [
+				"pyVersioning.py", f"--config-file={configFile}", f"--render-cache={directory / 'cache'}", f"--manifest={manifestFile}",
+				"batch", "--jobs", "16"
+			]
+			for _ in range(2):
+				with patch("sys.argv", arguments):
+					app = pyV_Application()
+					app._stdout, app._stderr = out, err = StringIO(), StringIO()
+					app._errorCount = 0
+					try:
+						app.Run()
+					except SystemExit as ex:
+						self.assertEqual(0, ex.code)
+
+				stdout, stderr = self._PrintToStdOutAndStdErr(out, err)
+				self.assertNotIn("can't be stored in render cache", stdout + stderr)
+
+				outputs = json_loads(manifestFile.read_text(encoding="utf-8"))["outputs"]
+				self.assertEqual(24, len(outputs))
+				for outputPath, contentHash in outputs.items():
+					self.assertEqual(sha256(Path(outputPath).read_bytes()).hexdigest(), contentHash, outputPath)
+
+			for objectFile in (directory / "cache" / "objects").iterdir():
+				self.assertEqual(objectFile.name, sha256(objectFile.read_bytes()).hexdigest())
+
 	@patch("sys.argv", ["pyVersioning.py", "--config-file=tests/unit/CIServices/.pyVersioning.yml", "yaml"])
 	def test_YAML_WithoutError(self) -> None:
 		print()
@@ -0,0 +1,175 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for reproducible build times and volatile fields."""
+from datetime                   import date, datetime, time
+from os                         import environ
+from pathlib                    import Path
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+from unittest.mock              import patch
+
+from pyVersioning               import Versioning, VersioningException, Volatility
+from pyVersioning.Configuration import Configuration
+from pyVersioning.GitFacade     import GitFacade
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class BuildTime(TestCase):
+	def setUp(self) -> None:
+		self._environment = patch.dict(environ)
+		self._environment.start()
+		for key in ("SOURCE_DATE_EPOCH", "APPVEYOR", "GITHUB_ACTIONS", "GITLAB_CI", "TRAVIS"):
+			environ.pop(key, None)
+
+	def tearDown(self) -> None:
+		self._environment.stop()
+
+	def _Configuration(self, timestamp: str = "now", volatile: str = "keep") -> Configuration:
+		with TemporaryDirectory() as tempDirectory:
+			configFile = Path(tempDirectory) / ".pyVersioning.yml"
+			configFile.write_text(
+				"version: 1\n"
+				"project:\n"
+				"  name: Firmware\n"
+				"  version: 1.2.3\n"
+				"build:\n"
+				f"  timestamp: {timestamp}\n"
+				f"  volatile: {volatile}\n"
+				"  compiler:\n"
+				"    name: gcc\n"
+				"    version: 12.0.0\n"
+				"    configuration: Release\n"
+				"    options: -O2\n",
+				encoding="utf-8"
+			)
+			return Configuration(configFile)
+
+	def _Versioning(self, config: Configuration, volatilePlaceholders: bool = False) -> Versioning:
+		versioning = Versioning(None, volatilePlaceholders=volatilePlaceholders)
+		versioning.LoadDataFromConfiguration(config)
+		versioning.CollectData()
+		return versioning
+
+	def test_Now(self) -> None:
+		versioning = self._Versioning(self._Configuration())
+
+		self.assertEqual(date.today(), versioning.Variables["build"].date)
+		self.assertIn("build.date", versioning.VolatileFields)
+		self.assertIn("env", versioning.VolatileFields)
+
+	def test_SourceDateEpoch(self) -> None:
+		environ["SOURCE_DATE_EPOCH"] = "1700000000"
+		versioning = self._Versioning(self._Configuration(timestamp="commit"))
+
+		self.assertEqual(date(2023, 11, 14), versioning.Variables["build"].date)
+		self.assertEqual(time(22, 13, 20), versioning.Variables["build"].time)
+		self.assertNotIn("build.time", versioning.VolatileFields)
+
+	def test_InvalidSourceDateEpoch(self) -> None:
+		environ["SOURCE_DATE_EPOCH"] = "yesterday"
+		versioning = self._Versioning(self._Configuration())
+
+		with self.assertRaises(VersioningException):
+			versioning.Variables["build"]
+
+	def test_Commit(self) -> None:
+		versioning = self._Versioning(self._Configuration(timestamp="commit"))
+		commitDateTime = GitFacade().GetCommitDate()
+
+		self.assertEqual(commitDateTime.date(), versioning.Variables["build"].date)
+		self.assertEqual(commitDateTime.time(), versioning.Variables["build"].time)
+		self.assertNotIn("build.date", versioning.VolatileFields)
+
+	def test_Placeholders(self) -> None:
+		for config, volatilePlaceholders in (
+			(self._Configuration(), True),
+			(self._Configuration(volatile="placeholder"), False)
+		):
+			versioning = self._Versioning(config, volatilePlaceholders)
+
+			self.assertTrue(versioning.VolatilePlaceholders)
+			self.assertEqual(
+				"1970-01-01 00:00:00 [|]",
+				versioning.FillOutTemplate("{build.date!s} {build.time!s} [{env.HOME}|{env[PATH]:>10}]")
+			)
+
+	def test_InvalidSetting(self) -> None:
+		for config in (self._Configuration(timestamp="yesterday"), self._Configuration(volatile="hidden")):
+			with self.assertRaises(VersioningException):
+				Versioning(None).LoadDataFromConfiguration(config)
+
+	def test_Volatility(self) -> None:
+		versioning = self._Versioning(self._Configuration())
+
+		for paths, volatility in (
+			(("version", "project.name", "build.compiler.version.Major", "unknown"), Volatility.Stable),
+			(("version", "git.commit.hash"), Volatility.Commit),
+			(("build.time.hour", ), Volatility.Build),
+			(("build", ), Volatility.Build),
+			(("env.HOME", "git.tag"), Volatility.Build),
+		):
+			with self.subTest(paths):
+				self.assertIs(volatility, versioning.GetVolatility(paths))
+
+		versioning = self._Versioning(self._Configuration(timestamp="commit"))
+		self.assertIs(Volatility.Commit, versioning.GetVolatility(("build.date.year", )))
+
+	def test_Flatten(self) -> None:
+		versioning = self._Versioning(self._Configuration())
+		fields = dict(versioning.FlattenVariables())
+
+		self.assertEqual("Firmware", fields["project.name"])
+		self.assertEqual("gcc", fields["build.compiler.name"])
+		self.assertIsInstance(fields["build.date"], date)
+		self.assertEqual(environ["PATH"], fields["env.PATH"])
+		self.assertNotIn("build", fields)
+
+	def test_Split(self) -> None:
+		template = (Path(__file__).parent.parent.parent / "templates" / "C" / "versioning.split.c.template").read_text(encoding="utf-8")
+		versioning = self._Versioning(self._Configuration())
+
+		stable, volatile = versioning.FillOutSplitTemplate(template)
+
+		self.assertIn("stableVersioningInformation", stable)
+		self.assertIn('"gcc\\0"', stable)
+		self.assertNotIn("volatileVersioningInformation", stable)
+		self.assertIn("volatileVersioningInformation", volatile)
+		self.assertIn(versioning.Variables["git"].commit.hash, volatile)
+		self.assertNotIn("stableVersioningInformation", volatile)
+		self.assertTrue(stable.startswith("/****"))
+		self.assertTrue(volatile.startswith("/****"))
+		self.assertEqual(stable, self._Versioning(self._Configuration()).FillOutSplitTemplate(template)[0])
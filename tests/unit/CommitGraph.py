@@ -0,0 +1,190 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the commit-graph reader and history walker."""
+from pathlib                    import Path
+from subprocess                 import run as subprocess_run, PIPE
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+
+from pyVersioning.CommitGraph   import CommitGraph, CommitGraphException
+from pyVersioning.GitRepository import GitRepository, GitRepositoryException
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _git(directory: Path, *args: str) -> str:
+	completed = subprocess_run(
+		("git", "-c", "user.name=Unit Test", "-c", "user.email=test@example.com", *args),
+		cwd=directory,
+		stdout=PIPE,
+		stderr=PIPE,
+		check=True
+	)
+	return completed.stdout.decode("utf-8").strip()
+
+
+class History(TestCase):
+	"""
+	Creates a history with a merge and an octopus merge::
+
+	  main:    A - B(v1.0.0) - C ----- M - O - E - F
+	  feature:      \\- D1 - D2(v1.1.0) /  /
+	  other:         \\- X1 ------------/  /
+	  more:           \\- Y1 -------------/
+	"""
+	_directory: TemporaryDirectory
+	_path:      Path
+
+	@classmethod
+	def setUpClass(cls) -> None:
+		cls._directory = TemporaryDirectory()
+		cls._path = path = Path(cls._directory.name)
+
+		def commit(name: str) -> None:
+			(path / f"{name}.txt").write_text(name, encoding="utf-8")
+			_git(path, "add", f"{name}.txt")
+			_git(path, "commit", "-q", "-m", name)
+
+		_git(path, "init", "-q", "-b", "main")
+		commit("A")
+		commit("B")
+		_git(path, "tag", "-a", "v1.0.0", "-m", "Release v1.0.0")
+		for branch, name in (("feature", "D1"), ("other", "X1"), ("more", "Y1")):
+			_git(path, "checkout", "-q", "-b", branch, "main")
+			commit(name)
+		_git(path, "checkout", "-q", "feature")
+		commit("D2")
+		_git(path, "tag", "v1.1.0")
+		_git(path, "checkout", "-q", "main")
+		commit("C")
+		_git(path, "merge", "-q", "--no-ff", "-m", "M", "feature")
+		_git(path, "merge", "-q", "--no-ff", "-m", "O", "other", "more")
+		commit("E")
+		commit("F")
+
+	@classmethod
+	def tearDownClass(cls) -> None:
+		cls._directory.cleanup()
+
+	def _Check(self) -> None:
+		repository = GitRepository.Discover(self._path)
+		try:
+			walker = repository.GetCommitWalker()
+			tags = repository.GetTagTargets()
+			for ref in ("HEAD", "HEAD~1", "HEAD~2", "HEAD~3", "HEAD~3^2", "HEAD~4", "HEAD~5"):
+				hash = _git(self._path, "rev-parse", ref)
+				self.assertEqual(int(_git(self._path, "rev-list", "--count", hash)), walker.CountCommits(hash), ref)
+
+				# Git's describe estimates the distance in merge-heavy histories, thus compare with rev-list.
+				tag, _, distance = walker.FindNearestTag(hash, tags)
+				self.assertEqual(_git(self._path, "describe", "--tags", "--abbrev=0", hash), tag, ref)
+				self.assertEqual(int(_git(self._path, "rev-list", "--count", f"{tag}..{hash}")), distance, ref)
+		finally:
+			repository.Close()
+
+	def test_WithoutCommitGraph(self) -> None:
+		_git(self._path, "commit-graph", "write", "--reachable")
+		graphFile = self._path / ".git" / "objects" / "info" / "commit-graph"
+		graphFile.unlink()
+
+		self._Check()
+
+	def test_WithCommitGraph(self) -> None:
+		_git(self._path, "commit-graph", "write", "--reachable")
+		try:
+			graph = CommitGraph.Open(self._path / ".git" / "objects")
+			self.assertEqual(int(_git(self._path, "rev-list", "--all", "--count")), graph.Count)
+			graph.Close()
+
+			self._Check()
+		finally:
+			(self._path / ".git" / "objects" / "info" / "commit-graph").unlink()
+
+	def test_CommitsNewerThanCommitGraph(self) -> None:
+		_git(self._path, "commit-graph", "write", "--reachable")
+		graphFile = self._path / ".git" / "objects" / "info" / "commit-graph"
+		try:
+			_git(self._path, "branch", "-q", "pinned", "HEAD")
+			_git(self._path, "reset", "-q", "--hard", "HEAD~3")
+			_git(self._path, "commit-graph", "write", "--reachable")
+			_git(self._path, "reset", "-q", "--hard", "pinned")
+			_git(self._path, "branch", "-q", "-D", "pinned")
+
+			self._Check()
+		finally:
+			graphFile.unlink()
+
+	def test_InvalidHash(self) -> None:
+		_git(self._path, "commit-graph", "write", "--reachable")
+		graphFile = self._path / ".git" / "objects" / "info" / "commit-graph"
+		try:
+			for name in ("HEAD", "", "abc", "g" * 40):
+				with self.subTest(name=name):
+					graph = CommitGraph.Open(self._path / ".git" / "objects")
+					try:
+						with self.assertRaises(CommitGraphException):
+							graph.Lookup(name)
+					finally:
+						graph.Close()
+
+			for withGraph in (True, False):
+				if not withGraph:
+					graphFile.unlink()
+
+				repository = GitRepository.Discover(self._path)
+				try:
+					for name in ("HEAD", "g" * 40):
+						with self.subTest(withGraph=withGraph, name=name), self.assertRaises(GitRepositoryException):
+							repository.DescribeCommit(name)
+				finally:
+					repository.Close()
+		finally:
+			graphFile.unlink(missing_ok=True)
+
+	def test_SplitCommitGraph(self) -> None:
+		graphs = self._path / ".git" / "objects" / "info" / "commit-graphs"
+		_git(self._path, "reset", "-q", "--hard", "HEAD~2")
+		_git(self._path, "commit-graph", "write", "--reachable", "--split")
+		_git(self._path, "reset", "-q", "--hard", "ORIG_HEAD")
+		_git(self._path, "commit-graph", "write", "--reachable", "--split=no-merge")
+		try:
+			self.assertEqual(2, len((graphs / "commit-graph-chain").read_text().split()))
+
+			self._Check()
+		finally:
+			for file in graphs.iterdir():
+				file.unlink()
+			graphs.rmdir()
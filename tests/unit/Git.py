@@ -0,0 +1,251 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for Git data collection."""
+from pathlib                    import Path
+from subprocess                 import run as subprocess_run, PIPE
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+from unittest.mock              import patch
+
+from pyTooling.Versioning       import SemanticVersion
+
+from pyVersioning               import GitHelperMixin, GitShowCommand
+from pyVersioning.GitObjects    import GitCommitObject, GitTreeObject
+from pyVersioning.GitRepository import GitRepository, GitRepositoryException, TagIndex
+from pyVersioning.GitSession    import GitSession
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class GitHelper(GitHelperMixin):
+	pass
+
+
+def _git(directory: Path, *args: str) -> str:
+	completed = subprocess_run(
+		("git", "-c", "user.name=Unit Test", "-c", "user.email=test@example.com", *args),
+		cwd=directory,
+		stdout=PIPE,
+		stderr=PIPE,
+		check=True
+	)
+	return completed.stdout.decode("utf-8").strip()
+
+
+class GitShow(TestCase):
+	def test_BatchEqualsSingleQueries(self) -> None:
+		helper = GitHelper()
+
+		fields = helper.ExecuteGitShowBatch()
+
+		self.assertEqual(len(GitShowCommand), len(fields))
+		for command in GitShowCommand:
+			self.assertEqual(helper.ExecuteGitShow(command), fields[command], f"Field {command.name}")
+
+	def test_BatchSubset(self) -> None:
+		helper = GitHelper()
+
+		fields = helper.ExecuteGitShowBatch((GitShowCommand.CommitComment, GitShowCommand.CommitHash))
+
+		self.assertEqual(2, len(fields))
+		self.assertEqual(40, len(fields[GitShowCommand.CommitHash]))
+
+	def test_GetCommit(self) -> None:
+		helper = GitHelper()
+
+		commit = helper.GetCommit()
+
+		self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitHash), commit.hash)
+		self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitAuthorEmail), commit.author.email)
+		self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitComment), commit.comment)
+
+
+class CatFileSession(TestCase):
+	def test_ReadCommit(self) -> None:
+		helper = GitHelper()
+
+		with GitSession() as session:
+			commit = session.ReadCommit()
+
+			self.assertIsInstance(commit, GitCommitObject)
+			self.assertEqual(str(helper.GetCommit()), str(commit.ToCommit()))
+			self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitHash), commit.Hash)
+			self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitComment), commit.Message)
+			self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitCommitterEmail), commit.Committer.Email)
+
+		self.assertFalse(session.IsOpen)
+
+	def test_OneProcessForManyObjects(self) -> None:
+		with GitSession() as session:
+			objects = list(session.ReadObjects(("HEAD", "HEAD^{tree}", "0" * 40, "HEAD")))
+
+			self.assertIsInstance(objects[0], GitCommitObject)
+			self.assertIsInstance(objects[1], GitTreeObject)
+			self.assertIsNone(objects[2])
+			self.assertEqual(objects[0].Hash, objects[3].Hash)
+			self.assertEqual(objects[0].Tree, objects[1].Hash)
+			self.assertEqual(4, session.RequestCount)
+			self.assertEqual(1, session.SpawnCount)
+
+	def test_ReadTree(self) -> None:
+		with GitSession() as session:
+			tree = session.ReadTree()
+
+			self.assertIn("pyVersioning", tree)
+			self.assertTrue(tree["pyVersioning"].IsTree)
+			self.assertFalse(tree["setup.py"].IsTree)
+
+
+class PurePythonRepository(TestCase):
+	def test_Discover(self) -> None:
+		repository = GitRepository.Discover(Path("tests/unit"))
+
+		self.assertIsNotNone(repository)
+		self.assertEqual(Path.cwd().resolve(), repository.WorkingDirectory)
+
+	def test_DiscoverOutsideOfRepository(self) -> None:
+		with TemporaryDirectory() as directory:
+			self.assertIsNone(GitRepository.Discover(Path(directory)))
+
+	def test_LastCommit(self) -> None:
+		helper = GitHelper()
+		repository = GitRepository.Discover()
+
+		self.assertEqual(str(helper.GetCommit()), str(repository.GetLastCommit()))
+		self.assertEqual(helper.ExecuteGitShow(GitShowCommand.CommitComment), repository.GetLastCommit().comment)
+
+	def test_LocalBranch(self) -> None:
+		completed = subprocess_run(("git", "branch", "--show-current"), stdout=PIPE, check=True)
+		repository = GitRepository.Discover()
+
+		self.assertEqual(completed.stdout.decode("utf-8").strip(), repository.GetLocalBranch())
+
+	def test_MissingReference(self) -> None:
+		repository = GitRepository.Discover()
+
+		with self.assertRaises(GitRepositoryException):
+			repository.ResolveReference("refs/heads/does/not/exist")
+
+
+class Tags(TestCase):
+	def test_SortTags(self) -> None:
+		tags = TagIndex.SortTags(("nightly", "v1.9.0", "v1.10.0", "v1.10.0-rc1", "latest"))
+
+		self.assertEqual(["v1.10.0", "v1.10.0-rc1", "v1.9.0", "latest", "nightly"], tags)
+
+	def test_IndexWithPackedAndLooseTags(self) -> None:
+		with TemporaryDirectory() as directory:
+			path = Path(directory)
+			_git(path, "init", "-q")
+			_git(path, "commit", "-q", "--allow-empty", "-m", "First")
+			first = _git(path, "rev-parse", "HEAD")
+			_git(path, "tag", "-a", "v1.0.0", "-m", "Release")
+			_git(path, "commit", "-q", "--allow-empty", "-m", "Second")
+			head = _git(path, "rev-parse", "HEAD")
+			_git(path, "tag", "-a", "v1.2.0", "-m", "Release")
+			_git(path, "tag", "v1.10.0")
+			_git(path, "pack-refs", "--all")
+			_git(path, "tag", "-a", "v1.9.0", "-m", "Loose annotated tag")
+			_git(path, "tag", "stable")
+
+			repository = GitRepository.Discover(path)
+			index = repository.TagIndex
+
+			self.assertEqual(["v1.10.0", "v1.9.0", "v1.2.0", "stable"], index.GetTags(head))
+			self.assertEqual("v1.0.0", index.GetBestTag(first))
+			self.assertIsNone(index.GetBestTag("0" * 40))
+			self.assertEqual("v1.10.0", index.GetBestTag(head))
+			self.assertFalse(index.Refresh())
+
+			_git(path, "tag", "v2.0.0")
+			self.assertTrue(index.Refresh())
+			self.assertEqual("v2.0.0", index.GetBestTag(head))
+
+			_git(path, "pack-refs", "--all")
+			self.assertTrue(index.Refresh())
+			self.assertEqual("v2.0.0", index.GetBestTag(head))
+
+	def test_FullyPeeledPackedRefs(self) -> None:
+		with TemporaryDirectory() as directory:
+			path = Path(directory)
+			_git(path, "init", "-q")
+			_git(path, "commit", "-q", "--allow-empty", "-m", "First")
+			head = _git(path, "rev-parse", "HEAD")
+			_git(path, "tag", "-a", "v1.0.0", "-m", "Release")
+			_git(path, "tag", "v1.1.0")
+			_git(path, "tag", "latest")
+			_git(path, "pack-refs", "--all")
+
+			peeled = []
+			index = TagIndex(path / ".git", lambda hash: peeled.append(hash) or hash)
+
+			self.assertEqual(["v1.1.0", "v1.0.0", "latest"], index.GetTags(head))
+			self.assertEqual([], peeled)
+
+			packedRefsFile = path / ".git" / "packed-refs"
+			content = packedRefsFile.read_text(encoding="utf-8")
+			self.assertIn("fully-peeled", content.splitlines()[0])
+			packedRefsFile.write_text("\n".join(content.splitlines()[1:]) + "\n", encoding="utf-8")
+
+			self.assertTrue(index.Refresh())
+			self.assertEqual(["v1.1.0", "v1.0.0", "latest"], index.GetTags(head))
+			self.assertEqual([head], peeled)
+
+	def test_SortTagsLazily(self) -> None:
+		with TemporaryDirectory() as directory:
+			path = Path(directory)
+			_git(path, "init", "-q")
+			_git(path, "commit", "-q", "--allow-empty", "-m", "First")
+			first = _git(path, "rev-parse", "HEAD")
+			for version in ("v1.0.0", "v1.0.1", "v1.0.2"):
+				_git(path, "tag", version)
+			_git(path, "commit", "-q", "--allow-empty", "-m", "Second")
+			head = _git(path, "rev-parse", "HEAD")
+			_git(path, "tag", "v2.0.0")
+			_git(path, "tag", "v2.0.0-rc1")
+
+			index = GitRepository.Discover(path).TagIndex
+			with patch("pyVersioning.GitRepository.SemanticVersion.Parse", side_effect=SemanticVersion.Parse) as parse:
+				self.assertTrue(index.Refresh())
+				self.assertIn(first, index.Targets)
+				self.assertEqual(0, parse.call_count)
+
+				self.assertEqual(["v2.0.0", "v2.0.0-rc1"], index.GetTags(head))
+				self.assertEqual(["v2.0.0", "v2.0.0-rc1"], index.GetTags(head))
+				self.assertEqual(2, parse.call_count)
+
+				self.assertEqual("v1.0.2", index.GetBestTag(first))
+				self.assertEqual(5, parse.call_count)
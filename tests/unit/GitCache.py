@@ -0,0 +1,194 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the on-disk cache of collected Git information."""
+from os                         import chdir, environ
+from pathlib                    import Path
+from subprocess                 import run as subprocess_run, PIPE
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+from unittest.mock              import patch
+
+from pyVersioning               import Versioning
+from pyVersioning.GitCache      import GitCache
+from pyVersioning.GitFacade     import GitFacade
+from pyVersioning.GitRepository import GitRepository
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _git(directory: Path, *args: str) -> None:
+	subprocess_run(
+		("git", "-c", "user.name=Unit Test", "-c", "user.email=test@example.com", *args),
+		cwd=directory,
+		stdout=PIPE,
+		stderr=PIPE,
+		check=True
+	)
+
+
+class Cache(TestCase):
+	_directory:        TemporaryDirectory
+	_path:             Path
+	_cacheFile:        Path
+	_workingDirectory: Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._path = Path(self._directory.name) / "repo"
+		self._path.mkdir()
+		self._cacheFile = Path(self._directory.name) / ".pyVersioning.cache"
+		self._workingDirectory = Path.cwd()
+
+		_git(self._path, "init", "-q", "-b", "main")
+		_git(self._path, "remote", "add", "origin", "https://example.com/project.git")
+		_git(self._path, "config", "branch.main.remote", "origin")
+		_git(self._path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+
+		chdir(self._path)
+
+	def tearDown(self) -> None:
+		chdir(self._workingDirectory)
+		self._directory.cleanup()
+
+	def _Collect(self) -> Versioning:
+		with patch.dict(environ):
+			for key in ("APPVEYOR", "GITHUB_ACTIONS", "GITLAB_CI", "TRAVIS"):
+				environ.pop(key, None)
+
+			with Versioning(None, git=GitFacade(repository=GitRepository.Discover()), cacheFile=self._cacheFile) as versioning:
+				versioning.CollectData()
+				versioning.Variables.Resolve("git")
+
+		return versioning
+
+	def _Key(self) -> str:
+		return GitCache(self._cacheFile, GitRepository.Discover()).ComputeKey()
+
+	def test_Hit(self) -> None:
+		expected = self._Collect()
+		self.assertTrue(self._cacheFile.exists())
+
+		versioning = self._Collect()
+		git = versioning.Variables["git"]
+
+		self.assertEqual(0, versioning.GitFacade.Misses)
+		self.assertEqual(0, versioning.GitFacade.SpawnCount)
+		self.assertEqual(str(expected.Variables["git"].commit), str(git.commit))
+		self.assertEqual(expected.Variables["git"].commit.comment, git.commit.comment)
+		self.assertEqual("main", git.branch)
+		self.assertEqual("https://example.com/project.git", git.repository)
+		self.assertEqual(str(expected.Variables["git"].describe), str(git.describe))
+
+	def test_Invalidation(self) -> None:
+		keys = {self._Key()}
+		self.assertEqual(keys, {self._Key()})
+
+		for args in (
+			("commit", "-q", "--allow-empty", "-m", "Second commit"),
+			("tag", "v1.0.0"),
+			("remote", "set-url", "origin", "https://example.com/moved.git"),
+			("checkout", "-q", "-b", "feature"),
+			("config", "branch.feature.remote", "origin"),
+		):
+			with self.subTest(command=args[0]):
+				_git(self._path, *args)
+				key = self._Key()
+
+				self.assertNotIn(key, keys)
+				keys.add(key)
+
+		self._Collect()
+		versioning = self._Collect()
+
+		self.assertEqual(0, versioning.GitFacade.Misses)
+		self.assertEqual("v1.0.0", versioning.Variables["git"].tag)
+		self.assertEqual("feature", versioning.Variables["git"].branch)
+
+	def test_CreatedConfigFiles(self) -> None:
+		home = Path(self._directory.name) / "home"
+		home.mkdir()
+		with patch.dict(environ, {"HOME": str(home), "XDG_CONFIG_HOME": str(home / ".config"), "GIT_CONFIG_NOSYSTEM": "1"}):
+			environ.pop("GIT_CONFIG_GLOBAL", None)
+			_git(self._path, "config", "include.path", "../../included.cfg")
+
+			keys = {self._Key()}
+			for file in (home / ".gitconfig", home / ".config" / "git" / "config", self._path.parent / "included.cfg"):
+				with self.subTest(file=file.name):
+					file.parent.mkdir(parents=True, exist_ok=True)
+					file.write_text("[remote \"origin\"]\n\turl = https://example.com/other.git\n", encoding="utf-8")
+					key = self._Key()
+
+					self.assertNotIn(key, keys)
+					keys.add(key)
+
+	def test_StateFiles(self) -> None:
+		gitDirectory = Path(self._path / ".git").resolve()
+
+		_git(self._path, "tag", "v1.0.0")
+		files = GitRepository.Discover().GetStateFiles()
+
+		self.assertIn(gitDirectory / "HEAD", files)
+		self.assertIn(gitDirectory / "refs" / "heads" / "main", files)
+		self.assertIn(gitDirectory / "refs" / "tags" / "v1.0.0", files)
+		self.assertIn(gitDirectory / "config", files)
+		self.assertTrue(all(file.exists() for file in files))
+
+		_git(self._path, "pack-refs", "--all")
+		files = GitRepository.Discover().GetStateFiles()
+
+		self.assertIn(gitDirectory / "packed-refs", files)
+		self.assertIn(gitDirectory / "refs" / "heads", files)
+		self.assertNotIn(gitDirectory / "refs" / "heads" / "main", files)
+
+	def test_Eviction(self) -> None:
+		cache = GitCache(self._cacheFile, GitRepository.Discover(), maxEntries=2)
+		git = self._Collect().Variables["git"]
+		self._cacheFile.unlink()
+
+		for key in ("a", "b", "c"):
+			cache.Store(key, git)
+
+		self.assertIsNone(cache.Load("a"))
+		self.assertEqual(str(git.commit), str(cache.Load("b").commit))
+		self.assertEqual(str(git.commit), str(cache.Load("c").commit))
+
+	def test_CorruptFile(self) -> None:
+		self._cacheFile.write_text("{ not json", encoding="utf-8")
+
+		versioning = self._Collect()
+
+		self.assertEqual("main", versioning.Variables["git"].branch)
+		self.assertIsNotNone(GitCache(self._cacheFile, GitRepository.Discover()).Load(self._Key()))
@@ -0,0 +1,146 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the packfile reader."""
+from pathlib                    import Path
+from subprocess                 import run as subprocess_run, PIPE
+from tempfile                   import TemporaryDirectory
+from typing                     import List
+from unittest                   import TestCase
+
+from pyVersioning.GitObjects    import GitObjectType
+from pyVersioning.GitPack       import PackStore, PackIndex, ApplyDelta, PackException
+from pyVersioning.GitRepository import GitRepository
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _git(directory: Path, *args: str, input: bytes = None) -> bytes:
+	completed = subprocess_run(
+		("git", "-c", "user.name=Unit Test", "-c", "user.email=test@example.com", *args),
+		cwd=directory,
+		input=input,
+		stdout=PIPE,
+		stderr=PIPE,
+		check=True
+	)
+	return completed.stdout
+
+
+class PackedRepository(TestCase):
+	_directory: TemporaryDirectory
+	_path:      Path
+	_hashes:    List[str]
+
+	@classmethod
+	def setUpClass(cls) -> None:
+		cls._directory = TemporaryDirectory()
+		cls._path = Path(cls._directory.name)
+
+		_git(cls._path, "init", "-q", "-b", "main")
+		lines = [f"line {i}: {'x' * (i % 17)}\n" for i in range(2000)]
+		for i in range(6):
+			lines[i * 300] = f"changed in commit {i}\n"
+			(cls._path / "file.txt").write_text("".join(lines), encoding="utf-8")
+			_git(cls._path, "add", "file.txt")
+			_git(cls._path, "commit", "-q", "-m", f"Commit {i}\n\nMulti-line\nmessage.")
+		_git(cls._path, "tag", "-a", "v1.0.0", "-m", "Release v1.0.0")
+		_git(cls._path, "gc", "-q", "--aggressive", "--prune=now")
+		_git(cls._path, "multi-pack-index", "write")
+
+		objects = _git(cls._path, "cat-file", "--batch-all-objects", "--batch-check=%(objectname)")
+		cls._hashes = objects.decode("ascii").split()
+
+	@classmethod
+	def tearDownClass(cls) -> None:
+		cls._directory.cleanup()
+
+	def test_AllObjectsAreResolved(self) -> None:
+		store = PackStore(self._path / ".git" / "objects" / "pack")
+		try:
+			self.assertGreater(len(self._hashes), 10)
+			for hash in self._hashes:
+				type, content = store.ReadObject(hash)
+				expected = _git(self._path, "cat-file", type.value, hash)
+				self.assertEqual(expected, content, f"Object {hash}")
+		finally:
+			store.Close()
+
+	def test_WithoutMultiPackIndex(self) -> None:
+		for indexFile in (self._path / ".git" / "objects" / "pack").glob("pack-*.idx"):
+			index = PackIndex(indexFile)
+			try:
+				for hash in self._hashes:
+					self.assertIsNotNone(index.Lookup(hash))
+				self.assertIsNone(index.Lookup("0" * 40))
+			finally:
+				index.Close()
+
+	def test_MissingObject(self) -> None:
+		store = PackStore(self._path / ".git" / "objects" / "pack")
+		try:
+			self.assertIsNone(store.ReadObject("f" * 40))
+		finally:
+			store.Close()
+
+	def test_Repository(self) -> None:
+		repository = GitRepository.Discover(self._path)
+		try:
+			commit = repository.ReadCommit()
+			self.assertEqual(_git(self._path, "rev-parse", "HEAD").decode("ascii").strip(), commit.Hash)
+			self.assertEqual("Commit 5\n\nMulti-line\nmessage.\n", commit.Message)
+			self.assertEqual(["v1.0.0"], repository.GetTags(commit.Hash))
+			self.assertEqual(GitObjectType.Tree, repository.ReadObject(commit.Tree).Type)
+		finally:
+			repository.Close()
+
+
+class Delta(TestCase):
+	def test_CopyAndInsert(self) -> None:
+		base = b"Hello World!"
+		# source size 12, target size 10, copy 6 bytes from offset 0, insert 'Git!'
+		delta = bytes([12, 10, 0x90, 6, 4]) + b"Git!"
+
+		self.assertEqual(b"Hello Git!", ApplyDelta(base, delta))
+
+	def test_WrongBaseSize(self) -> None:
+		with self.assertRaises(PackException):
+			ApplyDelta(b"abc", bytes([12, 0]))
+
+	def test_Truncated(self) -> None:
+		delta = bytes([12, 10, 0x91, 0, 6, 4]) + b"Git!"
+		for length in (0, 1, 2, 3, 4):
+			with self.subTest(length=length), self.assertRaises(PackException):
+				ApplyDelta(b"Hello World!", delta[:length])
@@ -0,0 +1,105 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the lazily resolved variable namespace."""
+from collections.abc        import Mapping
+from unittest               import TestCase
+
+from pyVersioning.Namespace import VariableNamespace
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Namespace(TestCase):
+	def setUp(self) -> None:
+		self._calls = []
+		self._namespace = VariableNamespace({"tool": "pyVersioning"})
+		self._namespace.Register("git", self._Provider("git", 1))
+		self._namespace.Register("env", self._Provider("env", 2))
+
+	def _Provider(self, name: str, value: int):
+		def provider() -> int:
+			self._calls.append(name)
+			return value
+
+		return provider
+
+	def test_ResolvedOnFirstAccess(self) -> None:
+		self.assertIn("git", self._namespace)
+		self.assertEqual(["tool", "git", "env"], list(self._namespace))
+		self.assertEqual([], self._calls)
+
+		self.assertEqual(1, self._namespace["git"])
+		self.assertEqual(1, self._namespace["git"])
+		self.assertEqual(["git"], self._calls)
+		self.assertTrue(self._namespace.IsResolved("git"))
+		self.assertFalse(self._namespace.IsResolved("env"))
+
+	def test_Format(self) -> None:
+		self.assertIsInstance(self._namespace, Mapping)
+		self.assertEqual("pyVersioning 1 2", "{tool} {git} {env}".format(**self._namespace))
+		self.assertEqual({"tool": "pyVersioning", "git": 1, "env": 2}, dict(self._namespace.items()))
+		self.assertEqual(["git", "env"], self._calls)
+
+	def test_Assignment(self) -> None:
+		self._namespace["git"] = 3
+		self._namespace["build"] = 4
+		del self._namespace["env"]
+
+		self.assertEqual(["tool", "git", "build"], list(self._namespace))
+		self.assertEqual(3, self._namespace["git"])
+		self.assertEqual([], self._calls)
+		with self.assertRaises(KeyError):
+			self._namespace["env"]
+		with self.assertRaises(KeyError):
+			del self._namespace["env"]
+
+	def test_FailureSurfacesOnAccess(self) -> None:
+		attempts = []
+
+		def provider() -> int:
+			attempts.append(None)
+			if len(attempts) == 1:
+				raise RuntimeError("Not available.")
+			return 5
+
+		self._namespace.Register("platform", provider)
+		self.assertEqual(1, self._namespace["git"])
+
+		with self.assertRaises(RuntimeError):
+			self._namespace["platform"]
+
+		self.assertFalse(self._namespace.IsResolved("platform"))
+		self.assertEqual(5, self._namespace["platform"])
@@ -0,0 +1,229 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the pyVersioning server and its client."""
+from argparse                   import Namespace
+from io                         import StringIO
+from os                         import chdir, environ
+from pathlib                    import Path
+from socket                     import socket, SOCK_STREAM
+from subprocess                 import run as subprocess_run, PIPE
+from tempfile                   import TemporaryDirectory
+from threading                  import Thread
+from time                       import sleep
+from typing                     import Tuple
+from unittest                   import TestCase, skipIf
+from unittest.mock              import patch
+
+from pyVersioning               import Versioning
+from pyVersioning.CLI           import Application as pyV_Application
+from pyVersioning.Configuration import Configuration
+from pyVersioning.GitFacade     import GitFacade
+from pyVersioning.GitRepository import GitRepository
+from pyVersioning.Server        import AF_UNIX, VersioningServer, VersioningClient, ServerException
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _git(directory: Path, *args: str) -> None:
+	subprocess_run(
+		("git", "-c", "user.name=Unit Test", "-c", "user.email=test@example.com", *args),
+		cwd=directory,
+		stdout=PIPE,
+		stderr=PIPE,
+		check=True
+	)
+
+
+def _head(directory: Path) -> str:
+	return subprocess_run(("git", "rev-parse", "HEAD"), cwd=directory, stdout=PIPE, check=True).stdout.decode("utf-8").strip()
+
+
+@skipIf(AF_UNIX is None, "Unix domain sockets aren't supported on this platform.")
+class Server(TestCase):
+	_directory:        TemporaryDirectory
+	_path:             Path
+	_socketPath:       Path
+	_workingDirectory: Path
+	_settings:         dict
+	_withReader:       bool
+	_server:           VersioningServer
+	_thread:           Thread
+
+	def setUp(self) -> None:
+		self._environment = patch.dict(environ)
+		self._environment.start()
+		for key in ("SOURCE_DATE_EPOCH", "APPVEYOR", "GITHUB_ACTIONS", "GITLAB_CI", "TRAVIS"):
+			environ.pop(key, None)
+
+		self._directory = TemporaryDirectory()
+		self._path = Path(self._directory.name) / "repo"
+		self._path.mkdir()
+		self._socketPath = self._path / ".pyVersioning.sock"
+		self._workingDirectory = Path.cwd()
+
+		_git(self._path, "init", "-q", "-b", "main")
+		_git(self._path, "remote", "add", "origin", "https://example.com/project.git")
+		_git(self._path, "config", "branch.main.remote", "origin")
+		_git(self._path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+		(self._path / ".pyVersioning.yml").write_text(
+			"version: 1\n"
+			"project:\n"
+			"  name: Firmware\n"
+			"  version: 1.2.3\n",
+			encoding="utf-8"
+		)
+
+		chdir(self._path)
+
+		self._settings = {"directory": self._path.as_posix()}
+		self._withReader = True
+		self._server = VersioningServer(self._socketPath, self._Initialize, self._settings, [self._path / ".pyVersioning.yml"], timeout=0.5)
+		self._thread = Thread(target=self._server.Serve, daemon=True)
+		self._thread.start()
+		while not self._socketPath.exists():
+			sleep(0.01)
+
+	def tearDown(self) -> None:
+		if self._thread.is_alive():
+			VersioningClient(self._socketPath).Request({"command": "stop"})
+			self._thread.join()
+
+		chdir(self._workingDirectory)
+		self._directory.cleanup()
+		self._environment.stop()
+
+	def _Initialize(self) -> Tuple[Versioning, Configuration]:
+		config = Configuration(self._path / ".pyVersioning.yml")
+		versioning = Versioning(None, git=GitFacade(repository=GitRepository.Discover() if self._withReader else None))
+		versioning.LoadDataFromConfiguration(config)
+		versioning.CollectData()
+		return versioning, config
+
+	def _Request(self, **request) -> str:
+		return VersioningClient(self._socketPath).Request({**request, "settings": self._settings})["content"]
+
+	def test_Field(self) -> None:
+		commitHash = _head(self._path)
+
+		self.assertEqual(commitHash, self._Request(command="field", field="git.commit.hash"))
+		self.assertEqual("Firmware 1.2.3", self._Request(command="fillout", template="{project.name} {project.version!s}"))
+		self.assertEqual(1, self._server.Refreshes)
+		self.assertEqual(2, self._server.Requests)
+
+	def test_Refused(self) -> None:
+		client = VersioningClient(self._socketPath)
+
+		with self.assertRaises(ServerException):
+			client.Request({"command": "field", "field": "git.commit.hash", "settings": {"directory": "/elsewhere"}})
+		with self.assertRaises(ServerException):
+			self._Request(command="field", field="env.HOME")
+		with self.assertRaises(ServerException):
+			self._Request(command="unknown")
+
+	def test_Invalidation(self) -> None:
+		firstHash = self._Request(command="field", field="git.commit.hash")
+		_git(self._path, "commit", "-q", "--allow-empty", "-m", "Second commit")
+		secondHash = self._Request(command="field", field="git.commit.hash")
+
+		self.assertNotEqual(firstHash, secondHash)
+		self.assertEqual(_head(self._path), secondHash)
+		self.assertEqual(2, self._server.Refreshes)
+
+		self._Request(command="field", field="git.commit.hash")
+		self.assertEqual(2, self._server.Refreshes)
+
+	def test_InvalidationWithoutReader(self) -> None:
+		self._withReader = False
+
+		firstHash = self._Request(command="field", field="git.commit.hash")
+		_git(self._path, "checkout", "-q", "-b", "feature")
+		_git(self._path, "config", "branch.feature.remote", "origin")
+		_git(self._path, "commit", "-q", "--allow-empty", "-m", "Second commit")
+		secondHash = self._Request(command="field", field="git.commit.hash")
+
+		self.assertNotEqual(firstHash, secondHash)
+		self.assertEqual(_head(self._path), secondHash)
+		self.assertEqual("feature", self._Request(command="field", field="git.branch"))
+
+		refreshes = self._server.Refreshes
+		self._Request(command="field", field="git.commit.hash")
+		self.assertEqual(refreshes, self._server.Refreshes)
+
+	def test_Stop(self) -> None:
+		VersioningClient(self._socketPath).Request({"command": "stop"})
+		self._thread.join()
+
+		self.assertFalse(self._socketPath.exists())
+		with self.assertRaises(OSError):
+			VersioningClient(self._socketPath).Request({"command": "ping"})
+
+	def test_BrokenClients(self) -> None:
+		stalled = socket(AF_UNIX, SOCK_STREAM)
+		stalled.connect(str(self._socketPath))
+		try:
+			self.assertEqual("", VersioningClient(self._socketPath, timeout=5.0).Request({"command": "ping"})["content"])
+		finally:
+			stalled.close()
+
+		for request in (b'{"command": "ping"}\n', b'{"command": "pi'):
+			with socket(AF_UNIX, SOCK_STREAM) as closed:
+				closed.connect(str(self._socketPath))
+				closed.sendall(request)
+
+		self.assertEqual("", VersioningClient(self._socketPath, timeout=5.0).Request({"command": "ping"})["content"])
+		self.assertTrue(self._thread.is_alive())
+
+	def test_Busy(self) -> None:
+		with self.assertRaises(ServerException):
+			VersioningServer(self._socketPath, self._Initialize).Serve()
+
+	@patch("sys.argv", ["pyVersioning.py", "--verbose", "field", "git.commit.hash"])
+	def test_Application(self) -> None:
+		app = pyV_Application()
+		self._settings.update(app._ServerSettings(Namespace(ConfigFile=None, CacheFile=None, VolatilePlaceholders=False)))
+
+		app._errorCount = 0
+		app._stdout, app._stderr = out, err = StringIO(), StringIO()
+		try:
+			app.Run()
+		except SystemExit as ex:
+			self.assertEqual(0, ex.code)
+
+		out.seek(0)
+		stdout = out.read()
+		self.assertIn("Answered by server", stdout)
+		self.assertIn(_head(self._path), stdout)
+		self.assertEqual(1, self._server.Requests)
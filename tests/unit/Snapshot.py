@@ -0,0 +1,153 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for immutable snapshots of all variables."""
+from concurrent.futures         import ThreadPoolExecutor
+from os                         import environ
+from pathlib                    import Path
+from pickle                     import dumps as pickle_dumps, loads as pickle_loads
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+from unittest.mock              import patch
+
+from pyVersioning               import Versioning, VersioningException
+from pyVersioning.Configuration import Configuration
+from pyVersioning.Snapshot      import Snapshot, Record
+from pyVersioning.Template      import TemplateStream
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Snapshots(TestCase):
+	_snapshot: Snapshot
+
+	def setUp(self) -> None:
+		with patch.dict(environ):
+			environ["SOURCE_DATE_EPOCH"] = "1700000000"
+			for key in ("APPVEYOR", "GITHUB_ACTIONS", "GITLAB_CI", "TRAVIS"):
+				environ.pop(key, None)
+
+			with TemporaryDirectory() as tempDirectory:
+				configFile = Path(tempDirectory) / ".pyVersioning.yml"
+				configFile.write_text(
+					"version: 1\n"
+					"project:\n"
+					"  name: Firmware\n"
+					"  version: 1.2.3\n"
+					"build:\n"
+					"  compiler:\n"
+					"    name: gcc\n"
+					"    version: 12.0.0\n"
+					"    configuration: Release\n"
+					"    options: -O2\n",
+					encoding="utf-8"
+				)
+				config = Configuration(configFile)
+
+			with Versioning(None) as versioning:
+				versioning.LoadDataFromConfiguration(config)
+				versioning.CollectData()
+				self._snapshot = versioning.CreateSnapshot()
+
+	def test_Render(self) -> None:
+		self.assertEqual(
+			"Firmware 1.2.3 gcc 12 2023",
+			self._snapshot.Render("{project.name} {project.version!s} {build.compiler.name} {build.compiler.version.Major} {build.date:%Y}")
+		)
+		self.assertEqual(self._snapshot["git"].commit.hash, self._snapshot.Render("{git.commit.hash}"))
+		self.assertEqual("x", self._snapshot.Render("{extra}", extra="x"))
+
+	def test_Immutable(self) -> None:
+		project = self._snapshot["project"]
+
+		self.assertIsInstance(project, Record)
+		with self.assertRaises(TypeError):
+			self._snapshot["project"] = None
+		with self.assertRaises(AttributeError):
+			project.name = "Other"
+		with self.assertRaises(AttributeError):
+			project.unknown
+
+	def test_Derive(self) -> None:
+		derived = self._snapshot.Derive(projectVariant="Debug", compilerName="clang", compilerVersion="15.0.0", extra="x")
+
+		self.assertEqual("Firmware|Debug|clang 15|x", derived.Render("{project.name}|{project.variant}|{build.compiler.name} {build.compiler.version.Major}|{extra}"))
+		self.assertEqual("Firmware||gcc", self._snapshot.Render("{project.name}|{project.variant}|{build.compiler.name}"))
+		self.assertIs(self._snapshot["git"], derived["git"])
+		self.assertNotIn("extra", self._snapshot)
+
+	def test_Hash(self) -> None:
+		self.assertEqual(self._snapshot, self._snapshot.Derive())
+		self.assertEqual(hash(self._snapshot), hash(self._snapshot.Derive()))
+		self.assertNotEqual(self._snapshot, self._snapshot.Derive(projectVariant="Debug"))
+		self.assertEqual(1, len({self._snapshot, self._snapshot.Derive(), self._snapshot.Derive(projectName="Firmware")}))
+
+	def test_Pickle(self) -> None:
+		snapshot = pickle_loads(pickle_dumps(self._snapshot))
+
+		self.assertEqual(self._snapshot, snapshot)
+		self.assertEqual(hash(self._snapshot), hash(snapshot))
+		self.assertEqual(self._snapshot.Render("{git.commit.hash} {env.PATH}"), snapshot.Render("{git.commit.hash} {env.PATH}"))
+
+	def test_Threads(self) -> None:
+		variants = [f"Variant{index}" for index in range(32)]
+		with ThreadPoolExecutor(max_workers=8) as pool:
+			results = list(pool.map(lambda variant: self._snapshot.Derive(projectVariant=variant).Render("{project.variant}"), variants))
+
+		self.assertEqual(variants, results)
+		self.assertEqual("", self._snapshot["project"].variant)
+
+	def test_Collect(self) -> None:
+		with patch.dict(environ):
+			environ.pop("SOURCE_DATE_EPOCH", None)
+			snapshot = Snapshot.Collect(volatilePlaceholders=True)
+
+		self.assertEqual(self._snapshot["git"].commit.hash, snapshot["git"].commit.hash)
+		self.assertEqual("1970-01-01|", snapshot.Render("{build.date!s}|{env.HOME}"))
+
+
+class Headless(TestCase):
+	def test_TemplateError(self) -> None:
+		with TemporaryDirectory() as tempDirectory, Versioning(None) as versioning:
+			templateFile = Path(tempDirectory) / "template"
+			templateFile.write_text("{git.branch} {git.unknown}\n", encoding="utf-8")
+			versioning.CollectData()
+
+			with self.assertRaisesRegex(VersioningException, "Accessing field 'unknown' of 'Git'"):
+				versioning.FillOutTemplate("{git.unknown}")
+			with self.assertRaisesRegex(VersioningException, "Accessing field 'unknown' of 'Git'"):
+				versioning.GetRenderKey("{git.unknown}")
+			with self.assertRaisesRegex(VersioningException, "Accessing field 'unknown' of 'Git'"):
+				versioning.FillOutTemplateStream(TemplateStream(templateFile), lambda chunk: None)
@@ -0,0 +1,314 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for compiled templates."""
+from concurrent.futures    import ThreadPoolExecutor
+from hashlib               import sha256
+from os                    import umask, utime
+from pathlib               import Path
+from tempfile              import TemporaryDirectory
+from types                 import SimpleNamespace
+from unittest              import TestCase
+
+from pyVersioning.Template import CompiledTemplate, FieldReferences, RenderCache, TemplateCache, TemplateField, TemplateStream, SplitSections
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Anything:
+	"""Returns itself for every attribute and index, and formats as its lookup path."""
+
+	def __init__(self, path: str) -> None:
+		self._path = path
+
+	def __getattr__(self, name: str) -> "Anything":
+		return Anything(f"{self._path}.{name}")
+
+	def __getitem__(self, key) -> "Anything":
+		return Anything(f"{self._path}[{key!r}]")
+
+	def __format__(self, spec: str) -> str:
+		return f"<{self._path}:{spec}>"
+
+
+class Compile(TestCase):
+	def assertSameAsFormat(self, template: str, variables: dict, **kwargs) -> None:
+		self.assertEqual(template.format(**variables, **kwargs), CompiledTemplate.Compile(template).Render(variables, **kwargs))
+
+	def test_ShippedTemplates(self) -> None:
+		root = Path(__file__).parent.parent.parent / "templates"
+		for path in (*root.glob("C/*.c.template"), *root.glob("CXX/*.cpp.template")):
+			with self.subTest(path.name):
+				template = path.read_text(encoding="utf-8")
+				compiled = CompiledTemplate.Compile(template)
+				variables = {part.Name: Anything(part.Name) for part in compiled.Parts if isinstance(part, TemplateField)}
+
+				self.assertGreater(len(variables), 0)
+				self.assertSameAsFormat(template, variables)
+
+	def test_Escapes(self) -> None:
+		self.assertSameAsFormat("{{a}} {{{a}}} }}{{ {a}}}", {"a": 1})
+		self.assertEqual(["{a} {", "}"], [part for part in CompiledTemplate.Compile("{{a}} {{{a}}}").Parts if isinstance(part, str)])
+
+	def test_Fields(self) -> None:
+		variables = {
+			"obj":   SimpleNamespace(name="pyVersioning", items=["x", "y"], map={"key": 5}),
+			"value": 3.14159,
+			"width": 8
+		}
+		self.assertSameAsFormat("{obj.name} {obj.items[1]} {obj.map[key]}", variables)
+		self.assertSameAsFormat("{obj.items[١]} {obj.map[key].real} {obj.map[key]:[>4}", variables)
+		self.assertSameAsFormat("{obj.name!r:>20} {obj.name!a} {obj.name!s:.3}", variables)
+		self.assertSameAsFormat("{value:{width}.{prec}f}|{value:>{width}}", variables, prec=2)
+		self.assertSameAsFormat("{value:{size}}", variables, size=12)
+
+		with self.assertRaises(TypeError):
+			CompiledTemplate.Compile("{value:{width}}").Render(variables, width=12)
+
+	def test_Errors(self) -> None:
+		variables = {"obj": SimpleNamespace(name="pyVersioning")}
+		for template, exception in (
+			("{missing}", KeyError),
+			("{obj.missing}", AttributeError),
+			("{}", IndexError),
+			("{0}", IndexError),
+		):
+			with self.subTest(template):
+				with self.assertRaises(exception) as expected:
+					template.format(**variables)
+				with self.assertRaises(exception) as actual:
+					CompiledTemplate.Compile(template).Render(variables)
+				self.assertEqual(str(expected.exception), str(actual.exception))
+
+		for template in ("{a", "a}", "{a!x}", "{a:{b:{c:{d}}}}"):
+			with self.subTest(template):
+				with self.assertRaises(ValueError):
+					CompiledTemplate.Compile(template).Render({"a": 1, "b": 2, "c": 3, "d": 4})
+
+		for template in ("{a..b}", "{a.}", "{a[}", "{a[]}", "{a[0]x}", "{a[99999999999999999999]}"):
+			with self.subTest(template):
+				with self.assertRaises(ValueError) as expected:
+					template.format(a=[1])
+				with self.assertRaises(ValueError) as actual:
+					CompiledTemplate.Compile(template)
+				self.assertEqual(str(expected.exception), str(actual.exception))
+
+
+class Analysis(TestCase):
+	def test_Fields(self) -> None:
+		template = CompiledTemplate.Compile("{{escaped}} {version!s} {git.commit.hash:>{width}} {env[HOME].upper} {build.date.year}")
+
+		self.assertEqual({"version", "git.commit.hash", "width", "env", "build.date.year"}, template.Fields)
+
+	def test_References(self) -> None:
+		references = FieldReferences(("git.commit.hash", "build"))
+
+		for path in ("git", "git.commit", "git.commit.hash", "build", "build.compiler.name"):
+			with self.subTest(path):
+				self.assertIn(path, references)
+		for path in ("git.commit.comment", "git.tag", "env", "gi", "git.commit.hash2"):
+			with self.subTest(path):
+				self.assertNotIn(path, references)
+
+		self.assertIn("anything", FieldReferences())
+		self.assertTrue(FieldReferences().IsAll)
+		self.assertFalse(references.IsAll)
+
+
+	def test_Sections(self) -> None:
+		template = "header\n/* pyVersioning:section 1 */\n{version}\n// pyVersioning:section 2\n{git.tag}"
+
+		self.assertEqual(["header\n", "/* pyVersioning:section 1 */\n{version}\n", "// pyVersioning:section 2\n{git.tag}"], SplitSections(template))
+		self.assertEqual("".join(SplitSections(template)), template)
+		self.assertEqual(["{version}"], SplitSections("{version}"))
+
+
+class Stream(TestCase):
+	def assertSameAsFormat(self, template: str, variables: dict) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "template"
+			path.write_text(template, encoding="utf-8")
+
+			expected = template.format(**variables)
+			for chunkSize in (1, 2, 3, 5, 8, 13, 64, TemplateStream.DEFAULT_CHUNK_SIZE):
+				with self.subTest(chunkSize=chunkSize):
+					chunks = []
+					TemplateStream(path, chunkSize).Render(chunks.append, variables)
+
+					self.assertEqual(expected, "".join(chunks))
+					self.assertEqual(CompiledTemplate.Compile(template).Fields, TemplateStream(path, chunkSize).Fields())
+
+	def test_ShippedTemplate(self) -> None:
+		template = (Path(__file__).parent.parent.parent / "templates" / "C" / "versioning.c.template").read_text(encoding="utf-8")
+		compiled = CompiledTemplate.Compile(template)
+
+		self.assertSameAsFormat(template, {part.Name: Anything(part.Name) for part in compiled.Parts if isinstance(part, TemplateField)})
+
+	def test_Boundaries(self) -> None:
+		self.assertSameAsFormat("{{a}} {{{a}}} }}{{ x{a[}]}y {a:{b}>{b}} ÄÖÜ\n" * 3, {"a": Anything("a"), "b": 4})
+
+	def test_Errors(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			path = Path(tempDirectory) / "template"
+			for template in ("text {a", "text } text", "{a:{b:{c:{d}}}}"):
+				with self.subTest(template):
+					path.write_text(template, encoding="utf-8")
+					with self.assertRaises(ValueError):
+						TemplateStream(path, 2).Render(lambda chunk: None, {"a": 1, "b": 2, "c": 3, "d": 4})
+
+
+class Cache(TestCase):
+	def test_Memory(self) -> None:
+		cache = TemplateCache()
+		first = cache.Compile("{a}-{b}")
+
+		self.assertIs(first, cache.Compile("{a}-{b}"))
+		self.assertIsNot(first, cache.Compile("{a}+{b}"))
+		self.assertEqual((1, 2), (cache.Hits, cache.Misses))
+
+	def test_Disk(self) -> None:
+		template = "{{ {obj.items[0]!r:>{width}} {obj.name} }}"
+		variables = {"obj": SimpleNamespace(name="n", items=[7]), "width": 4}
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory) / "templates"
+			compiled = TemplateCache(directory).Compile(template)
+
+			cache = TemplateCache(directory)
+			loaded = cache.Compile(template)
+
+			self.assertEqual((1, 0), (cache.Hits, cache.Misses))
+			self.assertIsNot(compiled, loaded)
+			self.assertEqual(template.format(**variables), loaded.Render(variables))
+
+	def test_CorruptFile(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / f"{CompiledTemplate.Hash('{a}')}.json").write_text("{not json", encoding="utf-8")
+
+			cache = TemplateCache(directory)
+			self.assertEqual("1", cache.Compile("{a}").Render({"a": 1}))
+			self.assertEqual((0, 1), (cache.Hits, cache.Misses))
+			self.assertEqual("1", TemplateCache(directory).Compile("{a}").Render({"a": 1}))
+
+	def test_Threads(self) -> None:
+		templates = [f"{{a}}-{index % 4}" for index in range(64)]
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			cache = TemplateCache(directory)
+
+			with ThreadPoolExecutor(max_workers=16) as pool:
+				compiled = list(pool.map(cache.Compile, templates))
+
+			self.assertEqual((60, 4), (cache.Hits, cache.Misses))
+			for index, template in enumerate(templates):
+				self.assertIs(compiled[index % 4], compiled[index])
+				self.assertEqual(template.format(a=1), compiled[index].Render({"a": 1}))
+			self.assertEqual(4, len(list(directory.glob("*.json"))))
+			self.assertEqual([], [path.name for path in directory.glob("*.tmp")])
+
+
+class Render(TestCase):
+	def test_Key(self) -> None:
+		template = CompiledTemplate.Compile("{a.x} {b:>{width}}")
+		variables = {"a": SimpleNamespace(x=1, y=2), "b": "b", "c": 3}
+		key = template.RenderKey(variables, width=3)
+
+		self.assertEqual(key, template.RenderKey({**variables, "a": SimpleNamespace(x=1, y=9), "c": 4}, width=3))
+		self.assertNotEqual(key, template.RenderKey({**variables, "a": SimpleNamespace(x=2, y=2)}, width=3))
+		self.assertNotEqual(key, template.RenderKey(variables, width=4))
+		self.assertNotEqual(key, CompiledTemplate.Compile("{a.x}-{b:>{width}}").RenderKey(variables, width=3))
+		self.assertNotEqual(
+			CompiledTemplate.Compile("{a}{b}").RenderKey({"a": "xy", "b": ""}),
+			CompiledTemplate.Compile("{a}{b}").RenderKey({"a": "x", "b": "y"})
+		)
+
+	def test_Cache(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			cache = RenderCache(directory / "cache")
+
+			self.assertIsNone(cache.Load("key"))
+
+			objectFile, contentHash = cache.Store("key", "content\n")
+			self.assertEqual(contentHash, objectFile.name)
+			self.assertEqual((objectFile, contentHash), RenderCache(directory / "cache").Load("key"))
+			self.assertEqual(objectFile, cache.Store("other", "content\n")[0])
+			self.assertEqual((0, 1), (cache.Hits, cache.Misses))
+
+			outputFile = directory / "output.txt"
+			outputFile.write_text("old", encoding="utf-8")
+			utime(objectFile, (0, 0))
+			RenderCache.Place(objectFile, outputFile)
+
+			self.assertEqual("content\n", outputFile.read_text(encoding="utf-8"))
+			self.assertFalse(outputFile.samefile(objectFile))
+			self.assertGreater(outputFile.stat().st_mtime, objectFile.stat().st_mtime)
+			self.assertEqual(["cache", "output.txt"], sorted(path.name for path in directory.iterdir()))
+
+			objectFile.unlink()
+			self.assertIsNone(cache.Load("key"))
+
+	def test_Cache_Permissions(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			previous = umask(0o027)
+			try:
+				objectFile, _ = RenderCache(directory / "cache").Store("key", "content\n")
+				outputFile = directory / "output.txt"
+				outputFile.write_text("content\n", encoding="utf-8")
+			finally:
+				umask(previous)
+
+			self.assertEqual(outputFile.stat().st_mode & 0o777, objectFile.stat().st_mode & 0o777)
+			self.assertEqual(0o640, (directory / "cache" / "key.json").stat().st_mode & 0o777)
+
+	def test_Cache_Threads(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			cache = RenderCache(directory / "cache")
+			contents = [f"content {index % 4}\n" * (1000 + index % 4) for index in range(64)]
+
+			def store(index: int) -> None:
+				objectFile, contentHash = cache.Store(f"key{index % 8}", contents[index])
+				RenderCache.Place(objectFile, directory / f"output{index}.txt")
+
+			with ThreadPoolExecutor(max_workers=16) as pool:
+				list(pool.map(store, range(64)))
+
+			for objectFile in (directory / "cache" / "objects").iterdir():
+				self.assertEqual(objectFile.name, sha256(objectFile.read_bytes()).hexdigest())
+			for index, content in enumerate(contents):
+				self.assertEqual(content, (directory / f"output{index}.txt").read_text(encoding="utf-8"))
+			self.assertEqual([], [path.name for path in directory.rglob(".*.tmp")])
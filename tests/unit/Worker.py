@@ -0,0 +1,162 @@
+# ==================================================================================================================== #
+#            __     __            _             _                                                                      #
+#  _ __  _   \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                                                          #
+# | '_ \| | | \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                                                         #
+# | |_) | |_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                                                         #
+# | .__/ \__, | \_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                                                         #
+# |_|    |___/                                          |___/                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2020-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the Bazel persistent worker."""
+from io                   import StringIO
+from json                 import dumps as json_dumps, loads as json_loads
+from pathlib              import Path
+from tempfile             import TemporaryDirectory
+from threading            import Event
+from typing               import List, Tuple
+from unittest             import TestCase
+from unittest.mock        import patch
+
+from pyVersioning.CLI     import Application as pyV_Application
+from pyVersioning.Worker  import PersistentWorker
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _Requests(*requests: dict) -> StringIO:
+	return StringIO("".join(json_dumps(request) + "\n" for request in requests))
+
+
+def _Responses(output: StringIO) -> List[dict]:
+	return [json_loads(line) for line in output.getvalue().splitlines()]
+
+
+class Protocol(TestCase):
+	def test_Singleplex(self) -> None:
+		def handler(arguments: List[str]) -> Tuple[int, str]:
+			return len(arguments), " ".join(arguments)
+
+		worker = PersistentWorker(handler)
+		output = StringIO()
+		worker.Run(_Requests({"arguments": ["a", "b"]}, {"arguments": []}), output)
+
+		self.assertEqual([{"exitCode": 2, "output": "a b"}, {"exitCode": 0, "output": ""}], _Responses(output))
+		self.assertEqual(2, worker.Requests)
+
+	def test_Multiplex(self) -> None:
+		first = Event()
+
+		def handler(arguments: List[str]) -> Tuple[int, str]:
+			if arguments == ["first"]:
+				return 0 if first.wait(10) else 1, arguments[0]
+
+			first.set()
+			return 0, arguments[0]
+
+		output = StringIO()
+		PersistentWorker(handler, jobs=2).Run(_Requests(
+			{"arguments": ["first"], "requestId": 1},
+			{"arguments": ["second"], "requestId": 2}
+		), output)
+
+		self.assertEqual(
+			[{"exitCode": 0, "output": "first", "requestId": 1}, {"exitCode": 0, "output": "second", "requestId": 2}],
+			sorted(_Responses(output), key=lambda response: response["requestId"])
+		)
+
+	def test_Cancel(self) -> None:
+		started = Event()
+		release = Event()
+
+		def handler(arguments: List[str]) -> Tuple[int, str]:
+			started.set()
+			release.wait(10)
+			return 0, arguments[0]
+
+		class Input(StringIO):
+			def __iter__(self):
+				yield json_dumps({"arguments": ["running"], "requestId": 1})
+				started.wait(10)
+				yield json_dumps({"arguments": ["pending"], "requestId": 2})
+				yield json_dumps({"requestId": 2, "cancel": True})
+				release.set()
+
+		output = StringIO()
+		PersistentWorker(handler, jobs=1).Run(Input(), output)
+
+		self.assertEqual(
+			[{"requestId": 2, "wasCancelled": True}, {"exitCode": 0, "output": "running", "requestId": 1}],
+			_Responses(output)
+		)
+
+	def test_Errors(self) -> None:
+		def handler(arguments: List[str]) -> Tuple[int, str]:
+			if arguments[0] == "exit":
+				raise SystemExit(3)
+			raise ValueError("broken")
+
+		output = StringIO()
+		PersistentWorker(handler).Run(StringIO("no json\n" + json_dumps({"arguments": ["exit"]}) + "\n" + json_dumps({"arguments": ["raise"]}) + "\n"), output)
+		responses = _Responses(output)
+
+		self.assertEqual(2, responses[0]["exitCode"])
+		self.assertEqual({"exitCode": 3, "output": ""}, responses[1])
+		self.assertEqual({"exitCode": 1, "output": "ValueError: broken"}, responses[2])
+
+
+class Application(TestCase):
+	@patch("sys.argv", ["pyVersioning.py", "--persistent_worker"])
+	def test_Worker(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			templateFile = directory / "version.template"
+			templateFile.write_text("{project.variant}|{build.compiler.name}|{version!s}\n", encoding="utf-8")
+
+			requests = _Requests(
+				{"arguments": ["fillout", str(templateFile), str(directory / "plain.txt")], "requestId": 1},
+				{"arguments": ["fillout", "--project-variant", "Debug", "--compiler-name", "clang", str(templateFile), str(directory / "override.txt")], "requestId": 2},
+				{"arguments": ["json", str(directory / "version.json")], "requestId": 3},
+				{"arguments": ["field", "version"], "requestId": 4}
+			)
+
+			app = pyV_Application()
+			app._errorCount = 0
+			app._stdout, app._stderr = out, err = StringIO(), StringIO()
+			with patch("sys.stdin", requests):
+				try:
+					app.Run()
+				except SystemExit as ex:
+					self.assertEqual(0, ex.code)
+
+			responses = {response["requestId"]: response for response in _Responses(out)}
+			version = json_loads((directory / "version.json").read_text(encoding="utf-8"))["version"]["name"]
+
+			self.assertEqual([0, 0, 0, 2], [responses[requestID]["exitCode"] for requestID in range(1, 5)])
+			self.assertEqual(f"Debug|clang|{version}\n", (directory / "override.txt").read_text(encoding="utf-8"))
+			self.assertNotEqual("Debug", (directory / "plain.txt").read_text(encoding="utf-8").partition("|")[0])